@@ -0,0 +1,81 @@
+"""
+Parse time of the job card extraction on saved listing pages.
+
+Compares, on every page of fixtures/listing_pages, the former scraper code
+(BeautifulSoup with html.parser and ``select_one`` twice per field) with
+job_search.card_extractor on its BeautifulSoup fallback and on lxml, and
+checks that all three extract the same fields.
+
+Usage (from the repository root):
+    python -m benchmarks.card_extraction_benchmark
+    python -m benchmarks.card_extraction_benchmark --repeat 50
+"""
+import argparse
+import statistics
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from job_search.card_extractor import extract_cards, lxml_html
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "listing_pages"
+
+
+def select_one_cards(html: str):
+    """The extraction the scrapers used before job_search.card_extractor."""
+    cards = []
+    soup = BeautifulSoup(html, 'html.parser')
+    for job_card in soup.select('div.job-listing'):
+        cards.append({
+            'title': job_card.select_one('h2').get_text(strip=True) if job_card.select_one('h2') else '',
+            'company': job_card.select_one('div.company').get_text(strip=True) if job_card.select_one('div.company') else '',
+            'location': job_card.select_one('div.location').get_text(strip=True) if job_card.select_one('div.location') else '',
+            'link': job_card.select_one('a.job-link')['href'] if job_card.select_one('a.job-link') else '',
+            'description': job_card.select_one('div.description').get_text(strip=True) if job_card.select_one('div.description') else '',
+            'posted': job_card.select_one('time[datetime]')['datetime'] if job_card.select_one('time[datetime]') else '',
+        })
+    return cards
+
+
+def time_per_page(extract, html: str, repeat: int) -> float:
+    extract(html)  # warm up
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        extract(html)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per page and extractor (median is reported)")
+    args = parser.parse_args()
+
+    extractors = {
+        "select_one x2 (html.parser)": select_one_cards,
+        "single pass (html.parser)": lambda html: extract_cards(html, "html.parser"),
+    }
+    if lxml_html is not None:
+        extractors["single pass (lxml)"] = lambda html: extract_cards(html, "lxml")
+    else:
+        print("lxml is not installed: only the BeautifulSoup extractors are measured")
+
+    for path in sorted(FIXTURES.glob("*.html")):
+        html = path.read_text(encoding="utf-8")
+        reference = select_one_cards(html)
+        print(f"{path.name}: {len(html) / 1024:.0f} KiB, {len(reference)} cards")
+        baseline = None
+        for name, extract in extractors.items():
+            same = extract(html) == reference
+            seconds = time_per_page(extract, html, args.repeat)
+            baseline = baseline or seconds
+            print(
+                f"  {name:<28} {seconds * 1000:7.2f} ms/page  {seconds / len(reference) * 1e6:6.0f} us/card"
+                f"  {baseline / seconds:5.1f}x  {'same fields' if same else 'FIELDS DIFFER'}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Check that a crawl which fails part way keeps the saved cursor.
+
+Runs ListingPageFetcher.fetch_jobs against an in-memory job board, with the
+cursor store in a temporary directory, over three runs:
+  1. the board lists 10 postings: all are returned and the cursor is saved;
+  2. 10 newer postings push the old ones to page 3 and page 2 answers 503:
+     the saved cursor must not move, or postings 11-15 would be lost;
+  3. the board answers again: postings 11-20 are all returned.
+
+Usage (from the repository root):
+    python -m benchmarks.crawl_cursor_check
+"""
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlsplit
+
+import config as cfg
+from job_search import crawl_cursor
+from src.job_scraper import listing_fetcher
+from src.job_scraper.listing_fetcher import ListingPageFetcher
+
+PAGE_SIZE = 5
+
+
+class CheckBoard(ListingPageFetcher):
+    search_url = "https://board.example/jobs?q={keywords}"
+    base_url = "https://board.example"
+    source = "Check board"
+
+
+class FakeBoard:
+    """Serves postings newest first, PAGE_SIZE per page; pages in ``failing`` answer 503."""
+
+    def __init__(self):
+        self.newest = 0
+        self.failing = set()
+
+    def publish(self, count: int) -> None:
+        self.newest += count
+
+    def get(self, url: str, **kwargs):
+        page = int(parse_qs(urlsplit(url).query).get("page", ["1"])[0])
+        if page in self.failing:
+            return SimpleNamespace(status_code=503, text="")
+        numbers = range(self.newest - (page - 1) * PAGE_SIZE, max(self.newest - page * PAGE_SIZE, 0), -1)
+        cards = "".join(
+            f'<div class="job-listing"><h2>Job {n}</h2><div class="company">Acme</div>'
+            f'<div class="location">Berlin, Germany</div><a class="job-link" href="/jobs/{n}">Apply</a>'
+            f'<time datetime="2026-01-{n:02d}">{n} Jan</time></div>'
+            for n in numbers
+        )
+        return SimpleNamespace(status_code=200, text=f"<html><body>{cards}</body></html>")
+
+
+def job_numbers(jobs):
+    return sorted(int(job["link"].rsplit("/", 1)[1]) for job in jobs)
+
+
+def main():
+    cfg.JOB_SCRAPER_INCREMENTAL = True
+    cfg.JOB_SCRAPER_CURSOR_PATH = str(Path(tempfile.mkdtemp()) / "crawl_cursors.sqlite3")
+    crawl_cursor._crawl_cursor_store = None
+    board = FakeBoard()
+    listing_fetcher.cached_get = board.get
+    fetcher = CheckBoard()
+    store = crawl_cursor.get_crawl_cursor_store()
+    failures = []
+
+    def check(condition: bool, message: str) -> None:
+        print(f"  {'ok  ' if condition else 'FAIL'} {message}")
+        if not condition:
+            failures.append(message)
+
+    print("run 1: first crawl")
+    board.publish(10)
+    jobs = fetcher.fetch_jobs("python")
+    crawl_cursor.commit_crawls()
+    check(job_numbers(jobs) == list(range(1, 11)), "returns postings 1-10")
+    saved = store.get(CheckBoard.source, "python")
+    check(saved.newest_posted == "2026-01-10", "cursor saved at posting 10")
+
+    print("run 2: 10 new postings, page 2 answers 503")
+    board.publish(10)
+    board.failing = {2}
+    jobs = fetcher.fetch_jobs("python")
+    crawl_cursor.commit_crawls()
+    check(job_numbers(jobs) == list(range(16, 21)), "returns the postings of page 1 (16-20)")
+    check(store.get(CheckBoard.source, "python") == saved, "saved cursor unchanged")
+
+    print("run 3: the board answers again")
+    board.failing = set()
+    jobs = fetcher.fetch_jobs("python")
+    crawl_cursor.commit_crawls()
+    check(job_numbers(jobs) == list(range(11, 21)), "returns postings 11-20, page 2 included")
+    check(store.get(CheckBoard.source, "python").newest_posted == "2026-01-20", "cursor moved to posting 20")
+
+    if failures:
+        sys.exit(f"{len(failures)} check(s) failed")
+    print("all checks passed")
+
+
+if __name__ == "__main__":
+    main()
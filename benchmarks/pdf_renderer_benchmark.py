@@ -0,0 +1,148 @@
+"""
+Throughput, memory and visual fidelity of the PDF renderers.
+
+Renders a sample resume (fixtures/resume_body.html) with every resume style
+through each renderer. Chrome uses a warm browser from the pool, so its
+start-up cost is excluded; WeasyPrint runs in-process.
+
+Fidelity is measured against the Chrome output: page count, similarity of the
+extracted text (pdfminer.six) and, when ``pdftoppm`` and Pillow are available,
+the share of differing pixels on the first page.
+
+Usage (from the repository root):
+    python -m benchmarks.pdf_renderer_benchmark
+    python -m benchmarks.pdf_renderer_benchmark --iterations 10 --renderers weasyprint
+"""
+import argparse
+import io
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from string import Template
+
+from Levenshtein import ratio
+from pdfminer.high_level import extract_text
+from pdfminer.pdfpage import PDFPage
+
+from documents.config import global_config
+from documents.font_assets import inline_google_fonts
+from src.utils.browser_pool import get_browser_pool
+from src.utils.pdf_renderers import CHROME, RENDERERS, get_renderer
+
+FIXTURE = Path(__file__).resolve().parent / "fixtures" / "resume_body.html"
+STYLES_DIRECTORY = Path(__file__).resolve().parent.parent / "documents" / "styles" / "resume_style"
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    from PIL import Image, ImageChops
+except ImportError:
+    Image = None
+
+
+def build_documents():
+    body = FIXTURE.read_text(encoding="utf-8")
+    template = Template(global_config.html_template)
+    for style_path in sorted(STYLES_DIRECTORY.glob("*.css")):
+        style_css = inline_google_fonts(style_path.read_text(encoding="utf-8"))
+        yield style_path.stem, template.substitute(body=body, style_css=style_css)
+
+
+def chrome_rss_mb() -> float:
+    """Resident memory of every running Chrome/ChromeDriver process, in MiB."""
+    if psutil is None:
+        return float("nan")
+    total = 0
+    for process in psutil.process_iter(["name", "memory_info"]):
+        if "chrom" in (process.info["name"] or "").lower() and process.info["memory_info"]:
+            total += process.info["memory_info"].rss
+    return total / 2 ** 20
+
+
+def page_count(pdf: bytes) -> int:
+    return sum(1 for _ in PDFPage.get_pages(io.BytesIO(pdf)))
+
+
+def pixel_difference(pdf: bytes, reference: bytes) -> float:
+    """Share of pixels that differ on the first page at 50 dpi, or NaN without pdftoppm/Pillow."""
+    if Image is None or shutil.which("pdftoppm") is None:
+        return float("nan")
+    with tempfile.TemporaryDirectory() as directory:
+        images = []
+        for name, data in (("a", pdf), ("b", reference)):
+            pdf_path = Path(directory) / f"{name}.pdf"
+            pdf_path.write_bytes(data)
+            subprocess.run(
+                ["pdftoppm", "-r", "50", "-f", "1", "-l", "1", "-png", "-singlefile", str(pdf_path),
+                 str(Path(directory) / name)],
+                check=True,
+            )
+            images.append(Image.open(Path(directory) / f"{name}.png").convert("L"))
+        if images[0].size != images[1].size:
+            images[0] = images[0].resize(images[1].size)
+        difference = ImageChops.difference(images[0], images[1]).point(lambda value: 255 if value > 32 else 0)
+        return sum(difference.histogram()[255:]) / (images[1].size[0] * images[1].size[1])
+
+
+def benchmark_renderer(name: str, documents, iterations: int):
+    renderer = get_renderer(name)
+    renderer.render(documents[0][1])  # warm up: browser start, font loading, imports
+    outputs, latencies, peaks = {}, [], []
+    for style, html in documents:
+        for _ in range(iterations):
+            tracemalloc.start()
+            start = time.perf_counter()
+            outputs[style] = renderer.render(html)
+            latencies.append(time.perf_counter() - start)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+    chrome_rss = chrome_rss_mb() if name == CHROME else None
+
+    print(f"{name}:")
+    print(f"  throughput         {len(latencies) / sum(latencies):.2f} documents/s")
+    print(f"  mean latency       {statistics.mean(latencies) * 1000:.0f} ms")
+    print(f"  p95 latency        {sorted(latencies)[int(len(latencies) * 0.95) - 1] * 1000:.0f} ms")
+    print(f"  Python peak alloc  {max(peaks) / 2 ** 20:.1f} MiB per document")
+    if chrome_rss is not None:
+        print(f"  Chrome RSS         {chrome_rss:.0f} MiB (needs psutil)")
+    return outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=3, help="renders per style and renderer")
+    parser.add_argument("--renderers", nargs="+", default=sorted(RENDERERS), choices=sorted(RENDERERS))
+    args = parser.parse_args()
+
+    documents = list(build_documents())
+    if CHROME in args.renderers:
+        get_browser_pool().warm_up(1)
+
+    outputs = {name: benchmark_renderer(name, documents, args.iterations) for name in args.renderers}
+    if CHROME not in outputs:
+        return
+
+    reference = outputs[CHROME]
+    for name, rendered in outputs.items():
+        if name == CHROME:
+            continue
+        print(f"{name} fidelity against chrome:")
+        for style, pdf in rendered.items():
+            text_similarity = ratio(extract_text(io.BytesIO(pdf)), extract_text(io.BytesIO(reference[style])))
+            print(
+                f"  {style:<28} pages {page_count(pdf)}/{page_count(reference[style])}"
+                f"  text {text_similarity:.0%}"
+                f"  pixels differing {pixel_difference(pdf, reference[style]):.1%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
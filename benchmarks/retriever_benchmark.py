@@ -0,0 +1,118 @@
+"""
+Context quality and latency of the job page retrievers on saved job pages.
+
+For every page in fixtures/job_pages.json the page text is split into token
+chunks and indexed, then LLMParser's retrieval query for each field is run.
+A retrieval counts as a hit when the labelled value appears in the top-k
+chunks, i.e. when the LLM would have been shown the answer.
+
+Usage (from the repository root):
+    python -m benchmarks.retriever_benchmark                 # BM25 only, offline
+    python -m benchmarks.retriever_benchmark --embeddings    # also OpenAI + FAISS, needs data_folder/secrets.yaml
+    python -m benchmarks.retriever_benchmark --embeddings --llm   # also runs the structured LLM extraction
+"""
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+
+from langchain_text_splitters import TokenTextSplitter
+
+import config as cfg
+from documents.llm.job_retrievers import BM25Retriever, EmbeddingRetriever
+from documents.llm.llm_job_parser import JOB_FIELD_QUERIES
+from src.utils.html_text import html_to_text
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def _load_pages():
+    with open(FIXTURES / "job_pages.json", "r", encoding="utf-8") as f:
+        labels = json.load(f)
+    for label in labels:
+        with open(FIXTURES / label["page"], "r", encoding="utf-8") as f:
+            yield label, f.read()
+
+
+def _benchmark_retrieval(name: str, make_retriever, pages, chunk_size: int, top_k: int) -> None:
+    splitter = TokenTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_size // 10)
+    hits = {field: 0 for field in JOB_FIELD_QUERIES}
+    index_latencies, query_latencies, chunk_counts = [], [], []
+    for label, html in pages:
+        chunks = splitter.split_text(html_to_text(html))
+        chunk_counts.append(len(chunks))
+        retriever = make_retriever()
+        start = time.perf_counter()
+        retriever.index(chunks)
+        index_latencies.append(time.perf_counter() - start)
+        for field, query in JOB_FIELD_QUERIES.items():
+            start = time.perf_counter()
+            context = _normalize(" ".join(retriever.retrieve(query, top_k)))
+            query_latencies.append(time.perf_counter() - start)
+            hits[field] += _normalize(label[field]) in context
+
+    print(f"{name} (chunk size {chunk_size}, top {top_k}, {statistics.mean(chunk_counts):.1f} chunks per page):")
+    for field, count in hits.items():
+        print(f"  {field:<16} {count}/{len(pages)} pages with the answer in context")
+    print(f"  mean index time  {statistics.mean(index_latencies) * 1000:.2f} ms")
+    print(f"  mean query time  {statistics.mean(query_latencies) * 1000:.2f} ms")
+
+
+def _benchmark_extraction(name: str, make_retriever, pages, api_key: str) -> None:
+    from documents.llm.llm_job_parser import LLMParser
+
+    correct = {field: 0 for field in ("role", "company", "location", "recruiter_email")}
+    latencies = []
+    for label, html in pages:
+        parser = LLMParser(api_key, retriever=make_retriever())
+        start = time.perf_counter()
+        parser.set_body_html(html)
+        job = parser.extract_job(label["url"], structured=True)
+        latencies.append(time.perf_counter() - start)
+        for field in correct:
+            extracted, expected = _normalize(getattr(job, field)), _normalize(label[field])
+            correct[field] += bool(extracted) and (expected in extracted or extracted in expected)
+
+    print(f"{name} + structured LLM extraction:")
+    for field, count in correct.items():
+        print(f"  {field:<16} {count}/{len(pages)} correct")
+    print(f"  mean page time   {statistics.mean(latencies):.2f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--embeddings", action="store_true", help="also benchmark the OpenAI embedding retriever")
+    parser.add_argument("--llm", action="store_true", help="also run the structured extraction with each retriever")
+    parser.add_argument("--chunk-size", type=int, default=100,
+                        help="tokens per chunk; the saved pages fit in one chunk of the parser's 500")
+    parser.add_argument("--top-k", type=int, default=3)
+    args = parser.parse_args()
+
+    # Measure real embedding calls, not the on-disk cache
+    cfg.JOB_PARSER_EMBEDDING_CACHE_PATH = ""
+    cfg.JOB_PARSER_INDEX_PATH = ""
+
+    pages = list(_load_pages())
+    retrievers = {"BM25": BM25Retriever}
+    api_key = None
+    if args.embeddings or args.llm:
+        from profiles.config import ConfigValidator
+
+        api_key = ConfigValidator.validate_secrets(Path("data_folder/secrets.yaml"))
+        if args.embeddings:
+            retrievers["Embeddings + FAISS"] = lambda: EmbeddingRetriever(api_key)
+
+    for name, make_retriever in retrievers.items():
+        _benchmark_retrieval(name, make_retriever, pages, args.chunk_size, args.top_k)
+    if args.llm:
+        for name, make_retriever in retrievers.items():
+            _benchmark_extraction(name, make_retriever, pages, api_key)
+
+
+if __name__ == "__main__":
+    main()
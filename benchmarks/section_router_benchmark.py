@@ -0,0 +1,91 @@
+"""
+Accuracy and latency of the local section router against the LLM router.
+
+Usage (from the repository root):
+    python -m benchmarks.section_router_benchmark
+    python -m benchmarks.section_router_benchmark --llm   # also queries the LLM, needs data_folder/secrets.yaml
+"""
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+
+from src.libs.section_router import SectionRouter
+
+FIXTURE = Path(__file__).resolve().parent / "fixtures" / "section_router_questions.json"
+
+
+def _summary(name: str, predictions, labels, latencies) -> None:
+    answered = [(p, l) for p, l in zip(predictions, labels) if p is not None]
+    correct = sum(p == l for p, l in answered)
+    print(f"{name}:")
+    print(f"  routed        {len(answered)}/{len(labels)} ({len(answered) / len(labels):.0%})")
+    if answered:
+        print(f"  accuracy      {correct}/{len(answered)} ({correct / len(answered):.0%}) of routed questions")
+    print(f"  mean latency  {statistics.mean(latencies) * 1000:.3f} ms")
+    print(f"  p95 latency   {sorted(latencies)[int(len(latencies) * 0.95) - 1] * 1000:.3f} ms")
+
+
+def _llm_router():
+    from profiles.config import ConfigValidator
+    from src.libs.llm_cache import LLM_CACHE_BYPASS
+    from src.libs.llm_manager import GPTAnswerer
+    from src.utils.constants import QUESTION
+
+    api_key = ConfigValidator.validate_secrets(Path("data_folder/secrets.yaml"))
+    answerer = GPTAnswerer({}, api_key)
+    chain = answerer._create_chain("determine_section_template")
+
+    def route(question: str) -> str:
+        raw_output = chain.invoke(
+            {QUESTION: question}, config={"configurable": {LLM_CACHE_BYPASS: True}}
+        )
+        return answerer._extract_section_name(raw_output)
+
+    return route
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--llm", action="store_true", help="also benchmark the LLM router")
+    args = parser.parse_args()
+
+    with open(FIXTURE, "r", encoding="utf-8") as f:
+        dataset = json.load(f)
+    questions = [item["question"] for item in dataset]
+    labels = [item["section"] for item in dataset]
+
+    router = SectionRouter(memory_path=None)
+    router.route("warm up")
+    local_predictions, local_latencies = [], []
+    for question in questions:
+        start = time.perf_counter()
+        local_predictions.append(router.route(question))
+        local_latencies.append(time.perf_counter() - start)
+    _summary("Local router", local_predictions, labels, local_latencies)
+
+    if not args.llm:
+        return
+
+    llm_route = _llm_router()
+    llm_predictions, llm_latencies = [], []
+    for question in questions:
+        start = time.perf_counter()
+        try:
+            llm_predictions.append(llm_route(question))
+        except ValueError:
+            llm_predictions.append(None)
+        llm_latencies.append(time.perf_counter() - start)
+    _summary("LLM router", llm_predictions, labels, llm_latencies)
+
+    combined = [local or llm for local, llm in zip(local_predictions, llm_predictions)]
+    combined_latencies = [
+        local_latency + (llm_latency if local is None else 0.0)
+        for local, local_latency, llm_latency in zip(local_predictions, local_latencies, llm_latencies)
+    ]
+    _summary("Local router with LLM fallback", combined, labels, combined_latencies)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,8 @@ MINIMUM_WAIT_TIME_IN_SECONDS = 60
 
 JOB_APPLICATIONS_DIR = "job_applications"
 JOB_SUITABILITY_SCORE = 7
+# Number of jobs scored per LLM request by GPTAnswerer.are_jobs_suitable
+JOB_SUITABILITY_BATCH_SIZE = 10
 
 JOB_MAX_APPLICATIONS = 5
 JOB_MIN_APPLICATIONS = 1
@@ -20,3 +22,90 @@ LLM_MODEL_TYPE = 'openai'
 LLM_MODEL = 'gpt-4o-mini'
 # Only required for OLLAMA models
 LLM_API_URL = ''
+
+# Persistent cache for LLM replies, keyed by model, temperature and prompt hash
+LLM_CACHE_ENABLED = True
+LLM_CACHE_PATH = 'data_folder/output/llm_cache.sqlite3'
+LLM_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+LLM_CACHE_MAX_ENTRIES = 5000
+
+# Retry/backoff for LLM calls; fatal errors (e.g. invalid API key) are never retried
+LLM_RETRY_MAX_ATTEMPTS = 8
+LLM_RETRY_BASE_DELAY_SECONDS = 2
+LLM_RETRY_MAX_DELAY_SECONDS = 60
+LLM_RETRY_DEADLINE_SECONDS = 300
+
+# Client-side rate limits per provider and model ('*' matches any model of the provider).
+# Providers or models without an entry are not limited.
+LLM_RATE_LIMITS = {
+    'openai': {
+        'gpt-4o-mini': {'rpm': 500, 'tpm': 200000},
+    },
+}
+# Directory holding lock-protected limiter state shared by several processes ('' keeps limits per process)
+LLM_RATE_LIMIT_STATE_DIR = ''
+
+# Local TF-IDF routing of form questions to resume sections; the LLM is asked only below the threshold
+SECTION_ROUTER_ENABLED = True
+SECTION_ROUTER_CONFIDENCE_THRESHOLD = 0.4
+SECTION_ROUTER_MEMORY_PATH = 'data_folder/output/section_router_examples.json'
+
+# Persistent memory of answers to repeated application-form questions
+ANSWER_MEMORY_ENABLED = True
+ANSWER_MEMORY_PATH = 'data_folder/output/answer_memory.sqlite3'
+# Maximum Levenshtein distance, relative to the question length, for reusing an answer to a reworded question
+ANSWER_MEMORY_MAX_DISTANCE_RATIO = 0.15
+
+# Job-description summaries shared by GPTAnswerer and the resume/cover letter generators
+JOB_SUMMARY_CACHE_ENABLED = True
+JOB_SUMMARY_CACHE_PATH = 'data_folder/output/job_summaries.sqlite3'
+JOB_SUMMARY_CACHE_MAX_ENTRIES = 2000
+
+# Extract all job fields from a job page with one JSON-mode LLM call instead of one call per field
+JOB_PARSER_STRUCTURED_OUTPUT = True
+# Seconds to wait for the per-field extraction calls, which run concurrently
+JOB_PARSER_FIELD_TIMEOUT_SECONDS = 60
+
+# Job page parser: on-disk chunk-hash embedding cache and per-job-URL FAISS indexes ('' disables either)
+JOB_PARSER_EMBEDDING_CACHE_PATH = 'data_folder/output/embedding_cache'
+JOB_PARSER_INDEX_PATH = 'data_folder/output/job_indexes'
+JOB_PARSER_INDEX_MMAP = True
+# Chunk retriever used by the job page parser: 'embeddings' (OpenAI + FAISS) or 'bm25' (local, offline)
+JOB_PARSER_RETRIEVER = 'embeddings'
+
+# Warm headless Chrome instances reused for job page fetching and PDF rendering; each is restarted after MAX_USES
+BROWSER_POOL_SIZE = 2
+BROWSER_POOL_MAX_USES = 20
+BROWSER_POOL_HEADLESS = True
+
+# PDF rendering waits for document load, web fonts and resource quiescence instead of a fixed sleep
+PDF_READY_MAX_WAIT_SECONDS = 10
+PDF_READY_QUIET_PERIOD_MS = 100
+
+# Default PDF renderer for resumes and cover letters: 'chrome' (headless Chrome), 'weasyprint' (no browser) or 'reportlab' (text only)
+PDF_RENDERER = 'chrome'
+
+# Worker processes of the bulk PDF render farm (documents/render_farm.py); None uses one per core
+RENDER_FARM_WORKERS = None
+
+# Job board scraping: seconds before a request times out, and requests in flight per host in the concurrent engine
+JOB_SCRAPER_TIMEOUT_SECONDS = 20
+JOB_SCRAPER_PER_HOST_CONCURRENCY = 4
+# Job board HTTP connection pools: hosts and keep-alive connections per host kept open, total async connections
+JOB_SCRAPER_POOL_HOSTS = 10
+JOB_SCRAPER_POOL_SIZE = 10
+JOB_SCRAPER_MAX_CONNECTIONS = 20
+JOB_SCRAPER_KEEPALIVE_SECONDS = 30
+# Use HTTP/2 for the async job board client when the h2 package is installed
+JOB_SCRAPER_HTTP2 = True
+
+# On-disk HTTP cache of job board pages: conditional GETs (ETag/Last-Modified), least recently used pages evicted past MAX_BYTES
+HTTP_CACHE_ENABLED = True
+HTTP_CACHE_PATH = 'data_folder/output/http_cache.sqlite3'
+HTTP_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+# Job board crawling: result pages read per search at most, and a persisted per-source/query cursor so a run only
+# fetches postings newer than the previous one
+JOB_SCRAPER_MAX_PAGES = 5
+JOB_SCRAPER_INCREMENTAL = True
+JOB_SCRAPER_CURSOR_PATH = 'data_folder/output/crawl_cursors.sqlite3'
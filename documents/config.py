@@ -4,6 +4,8 @@ This module is used to store the global configuration of the application.
 # app/libs/resume_and_cover_builder/config.py
 from pathlib import Path
 
+from documents.font_assets import html_head_assets
+
 class GlobalConfig:
     def __init__(self):
         self.STRINGS_MODULE_RESUME_PATH: Path = None
@@ -20,9 +22,7 @@ class GlobalConfig:
                                 <meta charset="UTF-8">
                                 <meta name="viewport" content="width=device-width, initial-scale=1.0">
                                 <title>Resume</title>
-                                <link href="https://fonts.googleapis.com/css2?family=Barlow:wght@400;600&display=swap" rel="stylesheet" />
-                                <link href="https://fonts.googleapis.com/css2?family=Barlow:wght@400;600&display=swap" rel="stylesheet" /> 
-                                <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/5.15.3/css/all.min.css" /> 
+                                """ + html_head_assets() + """
                                     <style>
                                         $style_css
                                     </style>
@@ -0,0 +1,88 @@
+"""
+Locally vendored web fonts and Font Awesome for the resume and cover letter HTML.
+
+``python -m documents.vendor_assets`` downloads the Google Fonts families and
+the Font Awesome stylesheet used by the template and the styles into
+``documents/assets`` as CSS with the font files embedded as data URIs. When
+they are present, the CDN ``<link>`` tags and ``@import url(...)`` rules are
+replaced by the inlined CSS, so rendering needs no network; when they are
+missing the remote URLs are kept.
+"""
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional
+from urllib.parse import parse_qs, urlparse
+
+ASSETS_DIRECTORY = Path(__file__).resolve().parent / "assets"
+FONTS_DIRECTORY = ASSETS_DIRECTORY / "fonts"
+FONT_AWESOME_CSS_PATH = ASSETS_DIRECTORY / "fontawesome.css"
+
+TEMPLATE_GOOGLE_FONTS_URL = "https://fonts.googleapis.com/css2?family=Barlow:wght@400;600&display=swap"
+FONT_AWESOME_URL = "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/5.15.3/css/all.min.css"
+
+GOOGLE_FONTS_IMPORT = re.compile(
+    r"""@import\s+url\(\s*['"]?(https://fonts\.googleapis\.com/css2\?[^'")]+)['"]?\s*\)\s*;?"""
+)
+
+
+def font_slug(family: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", family.lower()).strip("-")
+
+
+def google_font_families(url: str) -> List[str]:
+    """Family names requested by a Google Fonts css2 URL."""
+    return [family.split(":")[0] for family in parse_qs(urlparse(url).query).get("family", [])]
+
+
+@lru_cache(maxsize=None)
+def vendored_font_css(family: str) -> Optional[str]:
+    path = FONTS_DIRECTORY / f"{font_slug(family)}.css"
+    return path.read_text(encoding="utf-8") if path.exists() else None
+
+
+@lru_cache(maxsize=None)
+def vendored_font_awesome_css() -> Optional[str]:
+    return FONT_AWESOME_CSS_PATH.read_text(encoding="utf-8") if FONT_AWESOME_CSS_PATH.exists() else None
+
+
+def google_fonts_css(url: str) -> Optional[str]:
+    """The vendored CSS for every family of a Google Fonts URL, or None if any of them is missing."""
+    blocks = [vendored_font_css(family) for family in google_font_families(url)]
+    if not blocks or any(block is None for block in blocks):
+        return None
+    return "\n".join(blocks)
+
+
+def inline_google_fonts(style_css: str) -> str:
+    """Replace the Google Fonts ``@import`` rules of a stylesheet with the vendored CSS when available."""
+    kept_imports, inlined = [], []
+    for match in GOOGLE_FONTS_IMPORT.finditer(style_css):
+        css = google_fonts_css(match.group(1))
+        if css is None:
+            kept_imports.append(match.group(0))
+        else:
+            inlined.append(css)
+    if not inlined:
+        return style_css
+    # @import rules must precede every other rule, so the ones that stay remote go first
+    return "\n".join(kept_imports + inlined + [GOOGLE_FONTS_IMPORT.sub("", style_css)])
+
+
+def html_head_assets() -> str:
+    """
+    The ``<head>`` font and icon tags of the HTML template: inlined ``<style>`` blocks when vendored,
+    CDN ``<link>`` tags otherwise. ``$`` is escaped because the result is part of a string.Template.
+    """
+    tags = []
+    template_fonts = google_fonts_css(TEMPLATE_GOOGLE_FONTS_URL)
+    if template_fonts is not None:
+        tags.append(f"<style>{template_fonts}</style>")
+    else:
+        tags.append(f'<link href="{TEMPLATE_GOOGLE_FONTS_URL}" rel="stylesheet" />')
+    font_awesome = vendored_font_awesome_css()
+    if font_awesome is not None:
+        tags.append(f"<style>{font_awesome}</style>")
+    else:
+        tags.append(f'<link rel="stylesheet" href="{FONT_AWESOME_URL}" />')
+    return "\n".join(tags).replace("$", "$$")
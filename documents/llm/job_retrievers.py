@@ -0,0 +1,200 @@
+"""
+Retrievers that pick the job-page chunks relevant to an extraction question.
+
+``EmbeddingRetriever`` embeds the chunks with OpenAI and searches them with
+FAISS (with an on-disk embedding cache and per-job-URL index persistence).
+``BM25Retriever`` scores the chunks lexically in pure Python: no network, no
+embedding cost, which is usually enough for a single small job page.
+"""
+import hashlib
+import math
+import pickle
+import re
+from abc import ABC, abstractmethod
+from collections import Counter
+from pathlib import Path
+from typing import List, Optional
+
+from langchain.embeddings import CacheBackedEmbeddings
+from langchain.storage import LocalFileStore
+from langchain_community.embeddings import OpenAIEmbeddings
+from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.faiss import dependable_faiss_import
+from loguru import logger
+
+import config as cfg
+
+EMBEDDINGS = "embeddings"
+BM25 = "bm25"
+
+
+class JobPageRetriever(ABC):
+    """Indexes the chunks of one job page and returns the most relevant ones for a query."""
+
+    @abstractmethod
+    def index(self, chunks: List[str], job_url: Optional[str] = None) -> None:
+        pass
+
+    @abstractmethod
+    def retrieve(self, query: str, top_k: int = 3) -> List[str]:
+        pass
+
+    def retrieve_many(self, queries: List[str], top_k: int = 3) -> List[List[str]]:
+        """Retrieve for several queries at once; backends override it when batching saves round trips."""
+        return [self.retrieve(query, top_k) for query in queries]
+
+
+class EmbeddingRetriever(JobPageRetriever):
+    def __init__(self, openai_api_key: str):
+        self.embeddings = self._create_embeddings(openai_api_key)
+        self.vectorstore = None
+
+    @staticmethod
+    def _create_embeddings(openai_api_key: str):
+        """OpenAI embeddings, backed by the on-disk chunk-hash cache when it is enabled."""
+        embeddings = OpenAIEmbeddings(openai_api_key=openai_api_key)
+        if not cfg.JOB_PARSER_EMBEDDING_CACHE_PATH:
+            return embeddings
+        store = LocalFileStore(cfg.JOB_PARSER_EMBEDDING_CACHE_PATH)
+        return CacheBackedEmbeddings.from_bytes_store(embeddings, store, namespace=embeddings.model)
+
+    @staticmethod
+    def _index_folder(job_url: str) -> Path:
+        return Path(cfg.JOB_PARSER_INDEX_PATH) / hashlib.sha256(job_url.encode("utf-8")).hexdigest()[:16]
+
+    def _load_index(self, job_url: str, content_hash: str):
+        """Load the FAISS index saved for a job URL, or None when there is no index for this content."""
+        folder = self._index_folder(job_url)
+        try:
+            if (folder / "content_hash").read_text(encoding="utf-8") != content_hash:
+                return None
+            faiss = dependable_faiss_import()
+            index_path = str(folder / "index.faiss")
+            if cfg.JOB_PARSER_INDEX_MMAP:
+                try:
+                    index = faiss.read_index(index_path, faiss.IO_FLAG_MMAP)
+                except RuntimeError:
+                    # Not every index type supports memory mapping
+                    index = faiss.read_index(index_path)
+            else:
+                index = faiss.read_index(index_path)
+            # The pickle was written by _save_index below
+            with open(folder / "index.pkl", "rb") as f:
+                docstore, index_to_docstore_id = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, RuntimeError) as e:
+            logger.debug(f"No reusable vector index for {job_url}: {e}")
+            return None
+        logger.debug(f"Vector index for {job_url} loaded from {folder}")
+        return FAISS(self.embeddings, index, docstore, index_to_docstore_id)
+
+    def _save_index(self, job_url: str, content_hash: str) -> None:
+        folder = self._index_folder(job_url)
+        try:
+            self.vectorstore.save_local(str(folder), index_name="index")
+            (folder / "content_hash").write_text(content_hash, encoding="utf-8")
+            logger.debug(f"Vector index for {job_url} saved to {folder}")
+        except OSError as e:
+            logger.warning(f"Could not save the vector index for {job_url}: {e}")
+
+    def index(self, chunks: List[str], job_url: Optional[str] = None) -> None:
+        persist = bool(job_url and cfg.JOB_PARSER_INDEX_PATH)
+        content_hash = hashlib.sha256("\0".join(chunks).encode("utf-8")).hexdigest()
+        if persist:
+            self.vectorstore = self._load_index(job_url, content_hash)
+            if self.vectorstore is not None:
+                return
+        try:
+            self.vectorstore = FAISS.from_texts(chunks, embedding=self.embeddings)
+            logger.debug("Vectorstore successfully initialized.")
+        except Exception as e:
+            logger.error(f"Error during vectorstore creation: {e}")
+            raise
+        if persist:
+            self._save_index(job_url, content_hash)
+
+    def retrieve_many(self, queries: List[str], top_k: int = 3) -> List[List[str]]:
+        if not self.vectorstore:
+            raise ValueError("Vectorstore not initialized. Run set_body_html first.")
+        # Queries go through embed_documents so that they are batched and served by the embedding cache too
+        query_vectors = self.embeddings.embed_documents(queries)
+        return [
+            [doc.page_content for doc in self.vectorstore.similarity_search_by_vector(vector, k=top_k)]
+            for vector in query_vectors
+        ]
+
+    def retrieve(self, query: str, top_k: int = 3) -> List[str]:
+        return self.retrieve_many([query], top_k)[0]
+
+
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+
+# Words a job page uses for what LLMParser's retrieval queries ask about
+QUERY_EXPANSIONS = {
+    "job title": "title role position job opening hiring",
+    "company name": "company about us inc ltd gmbh team",
+    "location": "location based office remote hybrid onsite city country",
+    "job description": "description responsibilities requirements qualifications role you will",
+    "recruiter email": "recruiter email contact apply hiring manager",
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens; every email address also counts as the word 'email'."""
+    tokens = re.findall(r"\w+", text.lower())
+    tokens += ["email"] * len(EMAIL_PATTERN.findall(text))
+    return tokens
+
+
+class BM25Retriever(JobPageRetriever):
+    """Okapi BM25 over the chunks of the current page."""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._chunks: List[str] = []
+        self._term_frequencies: List[Counter] = []
+        self._lengths: List[int] = []
+        self._average_length = 0.0
+        self._idf = {}
+
+    def index(self, chunks: List[str], job_url: Optional[str] = None) -> None:
+        self._chunks = list(chunks)
+        self._term_frequencies = [Counter(tokenize(chunk)) for chunk in self._chunks]
+        self._lengths = [sum(tf.values()) for tf in self._term_frequencies]
+        self._average_length = sum(self._lengths) / len(self._lengths) if self._lengths else 0.0
+        document_frequency = Counter(term for tf in self._term_frequencies for term in tf)
+        total = len(self._chunks)
+        self._idf = {
+            term: math.log(1 + (total - df + 0.5) / (df + 0.5)) for term, df in document_frequency.items()
+        }
+        logger.debug(f"BM25 index built over {total} chunks.")
+
+    def _score(self, query_terms: List[str], position: int) -> float:
+        tf = self._term_frequencies[position]
+        length_norm = 1 - self.b + self.b * self._lengths[position] / (self._average_length or 1)
+        score = 0.0
+        for term in query_terms:
+            frequency = tf.get(term)
+            if frequency:
+                score += self._idf[term] * frequency * (self.k1 + 1) / (frequency + self.k1 * length_norm)
+        return score
+
+    def retrieve(self, query: str, top_k: int = 3) -> List[str]:
+        if not self._term_frequencies:
+            raise ValueError("BM25 index not initialized. Run set_body_html first.")
+        expansion = QUERY_EXPANSIONS.get(query.lower(), "")
+        query_terms = list(dict.fromkeys(tokenize(f"{query} {expansion}")))
+        # Ties keep page order, since titles and company names usually come first
+        ranked = sorted(
+            range(len(self._chunks)), key=lambda position: (-self._score(query_terms, position), position)
+        )
+        return [self._chunks[position] for position in ranked[:top_k]]
+
+
+def create_retriever(name: str, openai_api_key: Optional[str] = None) -> JobPageRetriever:
+    """Return the retriever named in config.JOB_PARSER_RETRIEVER ('embeddings' or 'bm25')."""
+    if name == EMBEDDINGS:
+        return EmbeddingRetriever(openai_api_key)
+    if name == BM25:
+        return BM25Retriever()
+    raise ValueError(f"Unknown job page retriever: {name}")
@@ -5,6 +5,7 @@ This creates the cover letter (in html, utils will then convert in PDF) matching
 import os
 import textwrap
 from ..utils import LoggerChatModel
+from src.libs.job_summary_cache import summarize_with_cache
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
@@ -58,7 +59,11 @@ class LLMCoverLetterJobDescription:
         logger.debug("Starting job description summarization...")
         prompt = ChatPromptTemplate.from_template(self.strings.summarize_prompt_template)
         chain = prompt | self.llm_cheap | StrOutputParser()
-        output = chain.invoke({"text": job_description_text})
+        output = summarize_with_cache(
+            job_description_text,
+            self.strings.summarize_prompt_template,
+            lambda: chain.invoke({"text": job_description_text}),
+        )
         self.job_description = output
         logger.debug(f"Job description summarization complete: {self.job_description}")
 
@@ -3,8 +3,9 @@ Create a class that generates a job description based on a resume and a job desc
 """
 # app/libs/resume_and_cover_builder/llm_generate_resume_from_job.py
 import os
-from src.libs.resume_and_cover_builder.llm.llm_generate_resume import LLMResumer
-from src.libs.resume_and_cover_builder.utils import LoggerChatModel
+from documents.llm.llm_generate_resume import LLMResumer
+from documents.utils import LoggerChatModel
+from src.libs.job_summary_cache import summarize_with_cache
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
@@ -33,7 +34,11 @@ class LLMResumeJobDescription(LLMResumer):
         """
         prompt = ChatPromptTemplate.from_template(self.strings.summarize_prompt_template)
         chain = prompt | self.llm_cheap | StrOutputParser()
-        output = chain.invoke({"text": job_description_text})
+        output = summarize_with_cache(
+            job_description_text,
+            self.strings.summarize_prompt_template,
+            lambda: chain.invoke({"text": job_description_text}),
+        )
         self.job_description = output
     
     def generate_header(self) -> str:
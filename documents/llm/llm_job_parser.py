@@ -1,25 +1,30 @@
+import json
 import os
-import tempfile
 import textwrap
+import threading
 import time
 import re  # For email validation
-from src.libs.resume_and_cover_builder.utils import LoggerChatModel
+from documents.utils import LoggerChatModel
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate, PromptTemplate
 from langchain_openai import ChatOpenAI
 from dotenv import load_dotenv
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 from loguru import logger
 from pathlib import Path
+from typing import Optional
 from langchain_core.prompt_values import StringPromptValue
 from langchain_core.runnables import RunnablePassthrough
 from langchain_text_splitters import TokenTextSplitter
-from langchain_community.embeddings import OpenAIEmbeddings
-from langchain_community.vectorstores import FAISS
 from src.libs.resume_and_cover_builder.config import global_config
-from langchain_community.document_loaders import TextLoader
 from requests.exceptions import HTTPError as HTTPStatusError  # HTTP error handling
 import openai
+from jsonschema import ValidationError, validate
+
+import config as cfg
+from documents.llm.job_retrievers import JobPageRetriever, create_retriever
+from src.job import Job
+from src.utils.html_text import html_to_text
 
 # Load environment variables from the .env file
 load_dotenv()
@@ -31,16 +36,81 @@ if not os.path.exists(log_folder):
 log_path = Path(log_folder).resolve()
 logger.add(log_path / "gpt_resume.log", rotation="1 day", compression="zip", retention="7 days", level="DEBUG")
 
+# Token chunks the page text is split into before retrieval
+CHUNK_SIZE = 500
+CHUNK_OVERLAP = 50
+
+EMAIL_REGEX = r'[\w\.-]+@[\w\.-]+\.\w+'
+
+# Workers shared by every extract_fields_parallel call; extra ones absorb calls abandoned on timeout
+FIELD_EXTRACTION_WORKERS = 8
+
+_field_executor: Optional[ThreadPoolExecutor] = None
+_field_executor_lock = threading.Lock()
+
+
+def get_field_executor() -> ThreadPoolExecutor:
+    """Return the process-wide executor of the per-field extraction calls."""
+    global _field_executor
+    if _field_executor is None:
+        with _field_executor_lock:
+            if _field_executor is None:
+                _field_executor = ThreadPoolExecutor(max_workers=FIELD_EXTRACTION_WORKERS, thread_name_prefix="job-field")
+    return _field_executor
+
+# Retrieval query per field extracted in structured mode
+JOB_FIELD_QUERIES = {
+    "role": "Job title",
+    "company": "Company name",
+    "location": "Location",
+    "description": "Job description",
+    "recruiter_email": "Recruiter email",
+}
+
+JOB_FIELDS_SCHEMA = {
+    "type": "object",
+    "properties": {field: {"type": "string"} for field in JOB_FIELD_QUERIES},
+    "required": list(JOB_FIELD_QUERIES),
+}
+
+job_fields_template = """
+You are an expert in extracting specific information from job descriptions.
+Carefully read the job posting context below and extract the following fields:
+- role: the role or title sought in this job posting
+- company: the company's name
+- location: the location mentioned in the job posting
+- description: the job description of the company
+- recruiter_email: the recruiter's email address
+
+Reply with a single JSON object with exactly these keys, all string values.
+Use an empty string for any field that is not present in the context.
+
+Context: {context}
+
+JSON:
+"""
+
 
 class LLMParser:
-    def __init__(self, openai_api_key):
+    def __init__(self, openai_api_key, retriever: Optional[JobPageRetriever] = None):
         self.llm = LoggerChatModel(
             ChatOpenAI(
-                model_name="gpt-4o-mini", openai_api_key=openai_api_key, temperature=0.4
+                model_name="gpt-4o-mini", openai_api_key=openai_api_key, temperature=0.4,
+                # Bounds every attempt, so a per-field call abandoned on timeout ends within the retry deadline
+                timeout=cfg.JOB_PARSER_FIELD_TIMEOUT_SECONDS,
+            )
+        )
+        # Same model in JSON mode, used to extract every job field in a single call
+        self.llm_structured = LoggerChatModel(
+            ChatOpenAI(
+                model_name="gpt-4o-mini",
+                openai_api_key=openai_api_key,
+                temperature=0,
+                model_kwargs={"response_format": {"type": "json_object"}},
             )
         )
-        self.llm_embeddings = OpenAIEmbeddings(openai_api_key=openai_api_key)  # Initialize embeddings
-        self.vectorstore = None  # Will be initialized after document loading
+        # Picks the page chunks given to the LLM; initialized with the chunks in set_body_html
+        self.retriever = retriever or create_retriever(cfg.JOB_PARSER_RETRIEVER, openai_api_key)
 
     @staticmethod
     def _preprocess_template_string(template: str) -> str:
@@ -52,41 +122,26 @@ class LLMParser:
             str: The preprocessed template string.
         """
         return textwrap.dedent(template)
-    
-    def set_body_html(self, body_html):
+
+    def set_body_html(self, body_html, job_url: Optional[str] = None):
         """
-        Retrieves the job description from HTML, processes it, and initializes the vectorstore.
+        Retrieves the job description from HTML, processes it, and indexes it in the retriever.
         Args:
             body_html (str): The HTML content to process.
+            job_url (str): The job URL; the embedding retriever saves its index for the URL and reuses it
+                as long as the page text does not change.
         """
 
-        # Save the HTML content to a temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".html", mode="w", encoding="utf-8") as temp_file:
-            temp_file.write(body_html)
-            temp_file_path = temp_file.name 
-        try:
-            loader = TextLoader(temp_file_path, encoding="utf-8", autodetect_encoding=True)
-            document = loader.load()
-            logger.debug("Document successfully loaded.")
-        except Exception as e:
-            logger.error(f"Error during document loading: {e}")
-            raise
-        finally:
-            os.remove(temp_file_path)
-            logger.debug(f"Temporary file removed: {temp_file_path}")
-        
+        # Keep only the visible text, so no markup, scripts or navigation gets embedded
+        text = html_to_text(body_html)
+        logger.debug(f"Visible text extracted: {len(text)} characters out of {len(body_html)} of HTML.")
+
         # Split the text into chunks
-        text_splitter = TokenTextSplitter(chunk_size=500, chunk_overlap=50)
-        all_splits = text_splitter.split_documents(document)
-        logger.debug(f"Text split into {len(all_splits)} fragments.")
-        
-        # Create the vectorstore using FAISS
-        try:
-            self.vectorstore = FAISS.from_documents(documents=all_splits, embedding=self.llm_embeddings)
-            logger.debug("Vectorstore successfully initialized.")
-        except Exception as e:
-            logger.error(f"Error during vectorstore creation: {e}")
-            raise
+        text_splitter = TokenTextSplitter(chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP)
+        chunks = text_splitter.split_text(text)
+        logger.debug(f"Text split into {len(chunks)} fragments.")
+
+        self.retriever.index(chunks, job_url)
 
     def _retrieve_context(self, query: str, top_k: int = 3) -> str:
         """
@@ -97,12 +152,8 @@ class LLMParser:
         Returns:
             str: Concatenated text fragments.
         """
-        if not self.vectorstore:
-            raise ValueError("Vectorstore not initialized. Run extract_job_description first.")
-        
-        retriever = self.vectorstore.as_retriever()
-        retrieved_docs = retriever.get_relevant_documents(query)[:top_k]
-        context = "\n\n".join(doc.page_content for doc in retrieved_docs)
+        retrieved_chunks = self.retriever.retrieve(query, top_k)
+        context = "\n\n".join(retrieved_chunks)
         logger.debug(f"Context retrieved for query '{query}': {context[:200]}...")  # Log the first 200 characters
         return context
     
@@ -196,13 +247,125 @@ class LLMParser:
         retrieval_query = "Recruiter email"
         logger.debug("Starting recruiter email extraction.")
         email = self._extract_information(question, retrieval_query)
-        
-        # Validate the extracted email using regex
-        email_regex = r'[\w\.-]+@[\w\.-]+\.\w+'
-        if re.match(email_regex, email):
+        return self._validate_email(email)
+
+    @staticmethod
+    def _validate_email(email: str) -> str:
+        """
+        Validates the extracted email using regex.
+        Args:
+            email (str): The extracted email.
+        Returns:
+            str: The email, or an empty string if it is not valid.
+        """
+        if re.match(EMAIL_REGEX, email):
             logger.debug("Valid recruiter's email.")
             return email
         else:
             logger.warning("Invalid or not found recruiter's email.")
             return ""
+
+    def _retrieve_combined_context(self, top_k: int = 3) -> str:
+        """
+        Retrieves the fragments relevant to every job field in one retriever request.
+        Args:
+            top_k (int): Number of fragments to retrieve per field.
+        Returns:
+            str: Concatenated unique text fragments, in retrieval order.
+        """
+        fragments = []
+        for retrieved_chunks in self.retriever.retrieve_many(list(JOB_FIELD_QUERIES.values()), top_k):
+            for chunk in retrieved_chunks:
+                if chunk not in fragments:
+                    fragments.append(chunk)
+        context = "\n\n".join(fragments)
+        logger.debug(f"Combined context retrieved from {len(fragments)} fragments: {context[:200]}...")
+        return context
+
+    def extract_job_structured(self) -> Job:
+        """
+        Extracts role, company, location, description and recruiter email with a single LLM call.
+        Returns:
+            Job: The extracted job.
+        Raises:
+            ValueError: If the reply is not a JSON object matching JOB_FIELDS_SCHEMA.
+        """
+        context = self._retrieve_combined_context()
+        prompt = ChatPromptTemplate.from_template(self._preprocess_template_string(job_fields_template))
+        chain = prompt | self.llm_structured | StrOutputParser()
+        raw_output = chain.invoke({"context": context})
+        try:
+            fields = json.loads(raw_output)
+            validate(instance=fields, schema=JOB_FIELDS_SCHEMA)
+        except (json.JSONDecodeError, ValidationError) as e:
+            raise ValueError(f"Invalid structured job extraction reply: {e}") from e
+        logger.debug(f"Structured job fields extracted: {fields}")
+        return Job(
+            role=fields["role"].strip(),
+            company=fields["company"].strip(),
+            location=fields["location"].strip(),
+            description=fields["description"].strip(),
+            recruiter_email=self._validate_email(fields["recruiter_email"].strip()),
+        )
+
+    def extract_job(self, job_url: str = "", structured: Optional[bool] = None) -> Job:
+        """
+        Extracts the job from the loaded page.
+        Args:
+            job_url (str): The job URL, stored as the job link.
+            structured (bool): Extract all fields in one JSON-mode call instead of one call per field.
+                Defaults to config.JOB_PARSER_STRUCTURED_OUTPUT.
+        Returns:
+            Job: The extracted job.
+        """
+        if structured is None:
+            structured = cfg.JOB_PARSER_STRUCTURED_OUTPUT
+        job = None
+        if structured:
+            try:
+                job = self.extract_job_structured()
+            except ValueError as e:
+                logger.warning(f"{e}; falling back to one extraction call per field.")
+        if job is None:
+            job = Job(**self.extract_fields_parallel())
+        job.link = job_url
+        return job
+
+    def extract_fields_parallel(self, timeout: Optional[float] = None) -> dict:
+        """
+        Extracts role, company, description and location with one concurrent call per field.
+        Args:
+            timeout (float): Seconds to wait for the fields, all of which start at once.
+                Defaults to config.JOB_PARSER_FIELD_TIMEOUT_SECONDS.
+        Returns:
+            dict: The extracted fields; a field that failed or timed out is an empty string.
+
+        Calls still running at the timeout are abandoned, not interrupted: they keep a worker of the
+        shared executor in the background. Each attempt is capped at config.JOB_PARSER_FIELD_TIMEOUT_SECONDS and no retry
+        starts after config.LLM_RETRY_DEADLINE_SECONDS, which bounds how long they can delay interpreter exit.
+        """
+        if timeout is None:
+            timeout = cfg.JOB_PARSER_FIELD_TIMEOUT_SECONDS
+        extractors = {
+            "role": self.extract_role,
+            "company": self.extract_company_name,
+            "description": self.extract_job_description,
+            "location": self.extract_location,
+        }
+        fields = {field: "" for field in extractors}
+        executor = get_field_executor()
+        futures = {executor.submit(extractor): field for field, extractor in extractors.items()}
+        done, not_done = wait(futures, timeout=timeout)
+        for future in done:
+            field = futures[future]
+            try:
+                fields[field] = future.result()
+            except Exception as e:
+                logger.error(f"Error during {field} extraction: {e}")
+        for future in not_done:
+            logger.warning(f"{futures[future]} extraction timed out after {timeout}s; leaving it empty.")
+        # Timed-out calls that have not started yet are dropped; running ones finish in the background
+        for future in not_done:
+            future.cancel()
+        return fields
  
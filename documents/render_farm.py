@@ -0,0 +1,175 @@
+"""
+Multi-process PDF render farm for bulk resume and cover letter generation.
+
+Rendering is CPU-bound and single-threaded in every renderer, so once the LLM
+calls run in parallel it becomes the bottleneck of bulk generation. The farm
+spreads ``RenderJob``s (HTML, optional resume CSS, output path) over a pool of
+worker processes, one per core by default. Each worker builds its renderer
+once (for Chrome: one warm headless browser per worker) and streams the PDF
+straight to the output path, so only paths and timings cross process
+boundaries.
+
+Usage (from the repository root), to render saved HTML documents:
+    python -m documents.render_farm data_folder/output/*.html --renderer weasyprint --workers 4
+"""
+import argparse
+import multiprocessing
+import os
+import statistics
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from multiprocessing.util import Finalize
+from pathlib import Path
+from string import Template
+from typing import Iterable, Iterator, List, Optional
+
+from loguru import logger
+
+import config as cfg
+from documents.config import global_config
+from documents.font_assets import inline_google_fonts
+from src.utils.browser_pool import get_browser_pool
+from src.utils.pdf_renderers import CHROME, PDFRenderer, RENDERERS, get_renderer
+
+
+@dataclass
+class RenderJob:
+    """``html`` is a full document, or the body to wrap in the resume template when ``css`` is given."""
+    html: str
+    output_path: str
+    css: Optional[str] = None
+    submitted_at: float = 0.0
+
+
+@dataclass
+class RenderResult:
+    output_path: str
+    renderer: str
+    worker_pid: int
+    queued_seconds: float = 0.0
+    render_seconds: float = 0.0
+    size_bytes: int = 0
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return not self.error
+
+
+# Renderer of the current worker process, built once by _init_worker
+_worker_renderer: Optional[PDFRenderer] = None
+
+
+def _init_worker(renderer_name: str) -> None:
+    global _worker_renderer
+    _worker_renderer = get_renderer(renderer_name)
+    if renderer_name == CHROME:
+        # Worker processes skip atexit handlers; a multiprocessing finalizer still runs on a clean exit
+        pool = get_browser_pool()
+        pool.warm_up(1)
+        Finalize(None, pool.close, exitpriority=10)
+
+
+def build_document(job: RenderJob) -> str:
+    if job.css is None:
+        return job.html
+    template = Template(global_config.html_template)
+    return template.substitute(body=job.html, style_css=inline_google_fonts(job.css))
+
+
+def _render_job(job: RenderJob) -> RenderResult:
+    result = RenderResult(output_path=job.output_path, renderer=_worker_renderer.name, worker_pid=os.getpid())
+    result.queued_seconds = max(time.time() - job.submitted_at, 0.0) if job.submitted_at else 0.0
+    try:
+        start = time.perf_counter()
+        result.size_bytes = _worker_renderer.render_to_file(build_document(job), job.output_path)
+        result.render_seconds = time.perf_counter() - start
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    return result
+
+
+class RenderFarm:
+    def __init__(self, renderer: Optional[str] = None, workers: Optional[int] = None):
+        """
+        ``renderer`` defaults to config.PDF_RENDERER and ``workers`` to config.RENDER_FARM_WORKERS,
+        itself defaulting to one worker per core.
+        """
+        self.renderer = renderer or cfg.PDF_RENDERER
+        if self.renderer not in RENDERERS:
+            raise ValueError(f"Unknown PDF renderer '{self.renderer}', expected one of {sorted(RENDERERS)}")
+        self.workers = workers or cfg.RENDER_FARM_WORKERS or os.cpu_count() or 1
+        # spawn: forking a process that already runs browser or LLM threads is unsafe
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.renderer,),
+        )
+        logger.info(f"Render farm started with {self.workers} {self.renderer} workers")
+
+    def submit(self, job: RenderJob) -> "Future[RenderResult]":
+        job.submitted_at = time.time()
+        return self._executor.submit(_render_job, job)
+
+    def render_all(self, jobs: Iterable[RenderJob]) -> Iterator[RenderResult]:
+        """Queue every job and yield the results as documents complete, logging each document's timings."""
+        futures = [self.submit(job) for job in jobs]
+        for future in as_completed(futures):
+            result = future.result()
+            if result.ok:
+                logger.info(
+                    f"Rendered {result.output_path} in {result.render_seconds:.2f}s "
+                    f"(queued {result.queued_seconds:.2f}s, {result.size_bytes / 1024:.0f} KiB, "
+                    f"worker {result.worker_pid})"
+                )
+            else:
+                logger.error(f"Failed to render {result.output_path}: {result.error}")
+            yield result
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "RenderFarm":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def log_summary(results: List[RenderResult], elapsed: float) -> None:
+    rendered = [result for result in results if result.ok]
+    logger.info(f"Render farm: {len(rendered)}/{len(results)} documents in {elapsed:.2f}s "
+                f"({len(rendered) / elapsed if elapsed else 0:.2f} documents/s)")
+    if rendered:
+        render_times = sorted(result.render_seconds for result in rendered)
+        logger.info(
+            f"Render time per document: mean {statistics.mean(render_times):.2f}s, "
+            f"p95 {render_times[max(int(len(render_times) * 0.95) - 1, 0)]:.2f}s, max {render_times[-1]:.2f}s"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("html_files", nargs="+", type=Path, help="HTML documents; each PDF is written next to it")
+    parser.add_argument("--renderer", choices=sorted(RENDERERS), default=None,
+                        help="PDF renderer (default: config.PDF_RENDERER)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument("--style", type=Path, default=None,
+                        help="resume style CSS; the HTML files are then bodies wrapped in the resume template")
+    args = parser.parse_args()
+
+    css = args.style.read_text(encoding="utf-8") if args.style else None
+    jobs = [
+        RenderJob(html=path.read_text(encoding="utf-8"), output_path=str(path.with_suffix(".pdf")), css=css)
+        for path in args.html_files
+    ]
+    start = time.perf_counter()
+    with RenderFarm(args.renderer, args.workers) as farm:
+        results = list(farm.render_all(jobs))
+    log_summary(results, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
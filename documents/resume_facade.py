@@ -5,12 +5,12 @@ This module contains the FacadeManager class, which is responsible for managing
 import hashlib
 import inquirer
 from pathlib import Path
+from typing import Optional, Union
 
 from loguru import logger
 
 from documents.llm.llm_job_parser import LLMParser
-# from src.job import Job  # TODO: Move or refactor Job model to new location
-from src.utils.chrome_utils import HTML_to_PDF
+from src.utils.pdf_renderers import get_renderer
 from documents.config import global_config
 
 class ResumeFacade:
@@ -37,8 +37,36 @@ class ResumeFacade:
         self.resume_generator.set_resume_object(resume_object)
         self.selected_style = None  # Property to store the selected style
     
-    def set_driver(self, driver):
-         self.driver = driver
+    def set_driver(self, driver, pooled: bool = False):
+        """
+        Set the browser used to fetch job pages and render PDFs.
+        Args:
+            driver: The Selenium WebDriver, or None to render without one (the Chrome renderer then
+                borrows a browser from the pool, other renderers need none).
+            pooled (bool): The driver belongs to a BrowserPool and is handed back by the caller,
+                so it is not quit after rendering.
+        """
+        self.driver = driver
+        self.driver_pooled = pooled
+
+    def _release_driver(self):
+        if getattr(self, "driver", None) is not None and not getattr(self, "driver_pooled", False):
+            self.driver.quit()
+
+    def _render_pdf(self, html: str, renderer: Optional[str], output_path: Optional[Path] = None) -> Union[str, Path]:
+        """
+        Render the HTML with the named PDF renderer (default: config.PDF_RENDERER).
+        Args:
+            output_path (Path): When given, the PDF is written (streamed, with Chrome) to this file.
+        Returns:
+            The PDF as a base64 string, or output_path when one is given.
+        """
+        pdf_renderer = get_renderer(renderer, getattr(self, "driver", None))
+        if output_path is None:
+            return pdf_renderer.render_base64(html)
+        pdf_renderer.render_to_file(html, output_path)
+        logger.info(f"PDF written to {output_path}")
+        return output_path
 
     def prompt_user(self, choices: list[str], message: str) -> str:
         """
@@ -74,25 +102,23 @@ class ResumeFacade:
         body_element = self.driver.find_element("tag name", "body")
         body_element = body_element.get_attribute("outerHTML")
         self.llm_job_parser = LLMParser(openai_api_key=global_config.API_KEY)
-        self.llm_job_parser.set_body_html(body_element)
-
-        self.job = Job()
-        self.job.role = self.llm_job_parser.extract_role()
-        self.job.company = self.llm_job_parser.extract_company_name()
-        self.job.description = self.llm_job_parser.extract_job_description()
-        self.job.location = self.llm_job_parser.extract_location()
-        self.job.link = job_url
+        self.llm_job_parser.set_body_html(body_element, job_url)
+
+        self.job = self.llm_job_parser.extract_job(job_url)
         logger.info(f"Extracting job details from URL: {job_url}")
 
 
-    def create_resume_pdf_job_tailored(self) -> tuple[bytes, str]:
+    def create_resume_pdf_job_tailored(
+        self, renderer: Optional[str] = None, output_dir: Optional[Path] = None
+    ) -> tuple[Union[str, Path], str]:
         """
         Create a resume PDF using the selected style and the given job description text.
         Args:
-            job_url (str): The job URL to generate the hash for.
-            job_description_text (str): The job description text to include in the resume.
+            renderer (str): The PDF renderer to use, config.PDF_RENDERER by default.
+            output_dir (Path): When given, the PDF is written to output_dir/<unique name>/resume_tailored.pdf
+                and its path is returned instead of the content.
         Returns:
-            tuple: A tuple containing the PDF content as bytes and the unique filename.
+            tuple: A tuple containing the PDF content as a base64 string (or its path) and the unique filename.
         """
         style_path = self.style_manager.get_style_path()
         if style_path is None:
@@ -104,38 +130,44 @@ class ResumeFacade:
         # Generate a unique name using the job URL hash
         suggested_name = hashlib.md5(self.job.link.encode()).hexdigest()[:10]
         
-        result = HTML_to_PDF(html_resume, self.driver)
-        self.driver.quit()
+        output_path = output_dir / suggested_name / "resume_tailored.pdf" if output_dir else None
+        result = self._render_pdf(html_resume, renderer, output_path)
+        self._release_driver()
         return result, suggested_name
     
     
     
-    def create_resume_pdf(self) -> tuple[bytes, str]:
+    def create_resume_pdf(self, renderer: Optional[str] = None, output_dir: Optional[Path] = None) -> Union[str, Path]:
         """
         Create a resume PDF using the selected style and the given job description text.
         Args:
-            job_url (str): The job URL to generate the hash for.
-            job_description_text (str): The job description text to include in the resume.
+            renderer (str): The PDF renderer to use, config.PDF_RENDERER by default.
+            output_dir (Path): When given, the PDF is written to output_dir/resume_base.pdf and its path
+                is returned instead of the content.
         Returns:
-            tuple: A tuple containing the PDF content as bytes and the unique filename.
+            The PDF content as a base64 string, or its path when output_dir is given.
         """
         style_path = self.style_manager.get_style_path()
         if style_path is None:
             raise ValueError("You must choose a style before generating the PDF.")
         
         html_resume = self.resume_generator.create_resume(style_path)
-        result = HTML_to_PDF(html_resume, self.driver)
-        self.driver.quit()
+        output_path = output_dir / "resume_base.pdf" if output_dir else None
+        result = self._render_pdf(html_resume, renderer, output_path)
+        self._release_driver()
         return result
 
-    def create_cover_letter(self) -> tuple[bytes, str]:
+    def create_cover_letter(
+        self, renderer: Optional[str] = None, output_dir: Optional[Path] = None
+    ) -> tuple[Union[str, Path], str]:
         """
         Create a cover letter based on the given job description text and job URL.
         Args:
-            job_url (str): The job URL to generate the hash for.
-            job_description_text (str): The job description text to include in the cover letter.
+            renderer (str): The PDF renderer to use, config.PDF_RENDERER by default.
+            output_dir (Path): When given, the PDF is written to output_dir/<unique name>/cover_letter_tailored.pdf
+                and its path is returned instead of the content.
         Returns:
-            tuple: A tuple containing the PDF content as bytes and the unique filename.
+            tuple: A tuple containing the PDF content as a base64 string (or its path) and the unique filename.
         """
         style_path = self.style_manager.get_style_path()
         if style_path is None:
@@ -148,6 +180,7 @@ class ResumeFacade:
         suggested_name = hashlib.md5(self.job.link.encode()).hexdigest()[:10]
 
         
-        result = HTML_to_PDF(cover_letter_html, self.driver)
-        self.driver.quit()
+        output_path = output_dir / suggested_name / "cover_letter_tailored.pdf" if output_dir else None
+        result = self._render_pdf(cover_letter_html, renderer, output_path)
+        self._release_driver()
         return result, suggested_name
\ No newline at end of file
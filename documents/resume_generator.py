@@ -11,6 +11,7 @@ from documents.llm.llm_generate_resume_from_job import LLMResumeJobDescription
 from documents.llm.llm_generate_cover_letter_from_job import LLMCoverLetterJobDescription
 from documents.module_loader import load_module
 from documents.config import global_config
+from documents.font_assets import inline_google_fonts
 from documents.resume_facade import ResumeFacade
 from profiles.config import ConfigValidator, FileManager
 from src.libs.resume_and_cover_builder.pdf_generator import PDFGenerator
@@ -70,6 +71,8 @@ class ResumeGenerator:
         try:
             with open(style_path, "r") as f:
                 style_css = f.read()  # Correzione: chiama il metodo `read` con le parentesi
+            # Usa i font vendorizzati in documents/assets al posto di Google Fonts, se presenti
+            style_css = inline_google_fonts(style_css)
         except FileNotFoundError:
             raise ValueError(f"Il file di stile non è stato trovato nel percorso: {style_path}")
         except Exception as e:
@@ -100,7 +103,7 @@ class ResumeGenerator:
         cover_letter_html = gpt_answerer.generate_cover_letter()
         template = Template(global_config.html_template)
         with open(style_path, "r") as f:
-            style_css = f.read()
+            style_css = inline_google_fonts(f.read())
         return template.substitute(body=cover_letter_html, style_css=style_css), style_css
     
     def generate_standard_resume(self, output_path: Optional[str] = None, format: str = "pdf") -> str:
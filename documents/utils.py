@@ -3,18 +3,20 @@ This module contains utility functions for the Resume and Cover Letter Builder s
 """
 
 # app/libs/resume_and_cover_builder/utils.py
+import asyncio
 import json
-import openai
-import time
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 from pathlib import Path
 from langchain_core.messages.ai import AIMessage
 from langchain_core.prompt_values import StringPromptValue
+from langchain_core.runnables import RunnableConfig, RunnableLambda
 from langchain_openai import ChatOpenAI
 from .config import global_config
-from loguru import logger
-from requests.exceptions import HTTPError as HTTPStatusError
+from src.libs.llm_cache import describe_llm, get_llm_cache, is_cache_bypassed
+from src.libs.llm_rate_limiter import estimate_tokens, get_rate_limiter, reported_total_tokens
+from src.libs.llm_retry import aretry_call, retry_call
+from src.utils.constants import OPENAI
 
 
 class LLMLogger:
@@ -89,35 +91,63 @@ class LLMLogger:
 
 class LoggerChatModel:
 
-    def __init__(self, llm: ChatOpenAI):
+    def __init__(self, llm: ChatOpenAI, use_cache: bool = True):
         self.llm = llm
-
-    def __call__(self, messages: List[Dict[str, str]]) -> str:
-        max_retries = 15
-        retry_delay = 10
-
-        for attempt in range(max_retries):
-            try:
-                reply = self.llm.invoke(messages)
-                parsed_reply = self.parse_llmresult(reply)
-                LLMLogger.log_request(prompts=messages, parsed_reply=parsed_reply)
-                return reply
-            except (openai.RateLimitError, HTTPStatusError) as err:
-                if isinstance(err, HTTPStatusError) and err.response.status_code == 429:
-                    logger.warning(f"HTTP 429 Too Many Requests: Waiting for {retry_delay} seconds before retrying (Attempt {attempt + 1}/{max_retries})...")
-                    time.sleep(retry_delay)
-                    retry_delay *= 2
-                else:
-                    wait_time = self.parse_wait_time_from_error_message(str(err))
-                    logger.warning(f"Rate limit exceeded or API error. Waiting for {wait_time} seconds before retrying (Attempt {attempt + 1}/{max_retries})...")
-                    time.sleep(wait_time)
-            except Exception as e:
-                logger.error(f"Unexpected error occurred: {str(e)}, retrying in {retry_delay} seconds... (Attempt {attempt + 1}/{max_retries})")
-                time.sleep(retry_delay)
-                retry_delay *= 2
-
-        logger.critical("Failed to get a response from the model after multiple attempts.")
-        raise Exception("Failed to get a response from the model after multiple attempts.")
+        self.use_cache = use_cache
+        self.rate_limiter = get_rate_limiter(OPENAI, describe_llm(llm)[0])
+
+    def __call__(self, messages: List[Dict[str, str]], config: Optional[RunnableConfig] = None) -> str:
+        # Identical prompts to the same model are served from the on-disk cache
+        cache = get_llm_cache() if self.use_cache and not is_cache_bypassed(config) else None
+        if cache is not None:
+            cached_reply = cache.get(self.llm, messages)
+            if cached_reply is not None:
+                return cached_reply
+
+        reply = retry_call(self._invoke, messages, description="LLM call")
+        return self._handle_reply(messages, reply, cache)
+
+    async def acall(self, messages: List[Dict[str, str]], config: Optional[RunnableConfig] = None) -> str:
+        # Same as __call__, but awaits the async client and yields to the event loop between retries;
+        # the SQLite cache and the request log are read and written in a worker thread, off the event loop
+        cache = get_llm_cache() if self.use_cache and not is_cache_bypassed(config) else None
+        if cache is not None:
+            cached_reply = await asyncio.to_thread(cache.get, self.llm, messages)
+            if cached_reply is not None:
+                return cached_reply
+
+        reply = await aretry_call(self._ainvoke, messages, description="Async LLM call")
+        return await asyncio.to_thread(self._handle_reply, messages, reply, cache)
+
+    def _invoke(self, messages):
+        # Every attempt, retries included, goes through the shared client-side rate limiter
+        if self.rate_limiter is None:
+            return self.llm.invoke(messages)
+        estimated_tokens = estimate_tokens(messages)
+        self.rate_limiter.acquire(estimated_tokens)
+        reply = self.llm.invoke(messages)
+        self.rate_limiter.record_usage(estimated_tokens, reported_total_tokens(reply))
+        return reply
+
+    async def _ainvoke(self, messages):
+        if self.rate_limiter is None:
+            return await self.llm.ainvoke(messages)
+        estimated_tokens = estimate_tokens(messages)
+        await self.rate_limiter.aacquire(estimated_tokens)
+        reply = await self.llm.ainvoke(messages)
+        self.rate_limiter.record_usage(estimated_tokens, reported_total_tokens(reply))
+        return reply
+
+    def as_runnable(self) -> RunnableLambda:
+        """Wrap the model so chains use ``acall`` when invoked with ``ainvoke``."""
+        return RunnableLambda(self, afunc=self.acall)
+
+    def _handle_reply(self, messages, reply: AIMessage, cache) -> AIMessage:
+        parsed_reply = self.parse_llmresult(reply)
+        LLMLogger.log_request(prompts=messages, parsed_reply=parsed_reply)
+        if cache is not None:
+            cache.put(self.llm, messages, reply)
+        return reply
 
     def parse_llmresult(self, llmresult: AIMessage) -> Dict[str, Dict]:
         # Parse the LLM result into a structured format.
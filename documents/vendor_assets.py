@@ -0,0 +1,190 @@
+"""
+Vendor the web fonts and Font Awesome used by the resume HTML into documents/assets.
+
+Downloads every Google Fonts family referenced by the HTML template and the
+resume styles, plus the Font Awesome stylesheet, and writes them as CSS with
+the woff2 files embedded as data URIs (see documents/font_assets.py). Run it
+again after adding a style that imports new fonts.
+
+Usage (from the repository root):
+    python -m documents.vendor_assets
+    python -m documents.vendor_assets --subset data_folder/plain_text_resume.yaml   # needs fontTools and brotli
+
+With --subset the fonts keep only the glyphs for printable ASCII, Latin-1 and
+the characters of the given files, and Font Awesome keeps only the icons used
+in the documents package.
+"""
+import argparse
+import base64
+import io
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urljoin
+
+import requests
+
+from documents.font_assets import (
+    ASSETS_DIRECTORY,
+    FONT_AWESOME_CSS_PATH,
+    FONT_AWESOME_URL,
+    FONTS_DIRECTORY,
+    GOOGLE_FONTS_IMPORT,
+    TEMPLATE_GOOGLE_FONTS_URL,
+    font_slug,
+)
+
+try:
+    from fontTools import subset as font_subset
+    from fontTools.ttLib import TTFont
+except ImportError:
+    font_subset = None
+
+STYLES_DIRECTORY = Path(__file__).resolve().parent / "styles" / "resume_style"
+
+# Google Fonts serves woff2 only to browsers that announce support for it
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/126.0.0.0 Safari/537.36"
+)
+DEFAULT_SUBSETS = ("latin", "latin-ext")
+BASE_CHARACTERS = {chr(c) for c in range(0x20, 0x7F)} | {chr(c) for c in range(0xA0, 0x100)}
+
+FONT_FACE = re.compile(r"(?:/\*\s*([^*]+?)\s*\*/\s*)?@font-face\s*\{([^}]*)\}")
+FONT_AWESOME_ICON_RULE = re.compile(r'\.fa-([a-z0-9-]+):before\{content:"\\([0-9a-f]+)"\}')
+ICON_CLASS = re.compile(r"\bfa-([a-z0-9-]+)")
+
+
+def collect_google_font_urls() -> List[str]:
+    urls = [TEMPLATE_GOOGLE_FONTS_URL]
+    for style_path in sorted(STYLES_DIRECTORY.glob("*.css")):
+        urls += GOOGLE_FONTS_IMPORT.findall(style_path.read_text(encoding="utf-8"))
+    return list(dict.fromkeys(urls))
+
+
+def parse_unicode_ranges(body: str) -> Optional[List[Tuple[int, int]]]:
+    match = re.search(r"unicode-range:\s*([^;]+)", body)
+    if not match:
+        return None
+    ranges = []
+    for part in match.group(1).split(","):
+        bounds = part.strip()[2:].split("-")
+        start = int(bounds[0].replace("?", "0"), 16)
+        end = int(bounds[-1].replace("?", "F"), 16)
+        ranges.append((start, end))
+    return ranges
+
+
+def data_uri(font: bytes) -> str:
+    return f"data:font/woff2;base64,{base64.b64encode(font).decode('ascii')}"
+
+
+def subset_font(font: bytes, codepoints: Iterable[int]) -> bytes:
+    """Keep only the glyphs for ``codepoints``, returned as woff2."""
+    options = font_subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["*"]
+    subsetter = font_subset.Subsetter(options)
+    subsetter.populate(unicodes=codepoints)
+    ttfont = TTFont(io.BytesIO(font))
+    subsetter.subset(ttfont)
+    output = io.BytesIO()
+    ttfont.flavor = "woff2"
+    ttfont.save(output)
+    return output.getvalue()
+
+
+def vendor_google_fonts(session: requests.Session, subsets: Iterable[str], codepoints: Optional[Set[int]]) -> None:
+    faces: Dict[str, Dict[str, str]] = {}
+    for url in collect_google_font_urls():
+        response = session.get(url, timeout=30)
+        response.raise_for_status()
+        for subset_name, body in FONT_FACE.findall(response.text):
+            family = re.search(r"font-family:\s*['\"]?([^;'\"]+)", body).group(1)
+            source = re.search(r"url\(([^)]+)\)", body).group(1)
+            ranges = parse_unicode_ranges(body)
+            if codepoints is not None:
+                wanted = {c for c in codepoints if ranges is None or any(a <= c <= b for a, b in ranges)}
+                if not wanted:
+                    continue
+            elif subset_name and subset_name not in subsets:
+                continue
+            if source in faces.get(family, {}):
+                continue
+            font = session.get(source, timeout=30).content
+            if codepoints is not None:
+                font = subset_font(font, wanted)
+            faces.setdefault(family, {})[source] = (
+                "@font-face {" + body.replace(f"url({source})", f"url({data_uri(font)})") + "}"
+            )
+            print(f"  {family} ({subset_name or 'all'}): {len(font) / 1024:.1f} KiB")
+
+    FONTS_DIRECTORY.mkdir(parents=True, exist_ok=True)
+    for family, blocks in faces.items():
+        (FONTS_DIRECTORY / f"{font_slug(family)}.css").write_text("\n".join(blocks.values()), encoding="utf-8")
+
+
+def used_icons() -> Set[str]:
+    package = Path(__file__).resolve().parent
+    icons = set()
+    for path in package.rglob("*"):
+        if path.suffix in {".py", ".css", ".html"} and ASSETS_DIRECTORY not in path.parents:
+            icons.update(ICON_CLASS.findall(path.read_text(encoding="utf-8", errors="ignore")))
+    return icons
+
+
+def vendor_font_awesome(session: requests.Session, subset: bool) -> None:
+    response = session.get(FONT_AWESOME_URL, timeout=30)
+    response.raise_for_status()
+    css = response.text
+
+    codepoints = None
+    if subset:
+        icons = used_icons()
+        codepoints = {int(code, 16) for name, code in FONT_AWESOME_ICON_RULE.findall(css) if name in icons}
+        css = FONT_AWESOME_ICON_RULE.sub(lambda m: m.group(0) if m.group(1) in icons else "", css)
+
+    def embed(match: re.Match) -> str:
+        body = match.group(2)
+        woff2 = re.search(r"url\(([^)]+\.woff2)\)", body).group(1)
+        font = session.get(urljoin(FONT_AWESOME_URL, woff2), timeout=30).content
+        if codepoints is not None:
+            font = subset_font(font, codepoints)
+        print(f"  Font Awesome {Path(woff2).name}: {len(font) / 1024:.1f} KiB")
+        # Keep every descriptor but src, then point src at the embedded woff2 only
+        descriptors = ";".join(d for d in body.split(";") if d.strip() and not d.strip().startswith("src"))
+        return f'@font-face{{{descriptors};src:url({data_uri(font)}) format("woff2")}}'
+
+    ASSETS_DIRECTORY.mkdir(parents=True, exist_ok=True)
+    FONT_AWESOME_CSS_PATH.write_text(FONT_FACE.sub(embed, css), encoding="utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--subset", nargs="*", metavar="TEXT_FILE",
+                        help="subset fonts to the glyphs used (ASCII, Latin-1 and the characters of these files)")
+    parser.add_argument("--subsets", default=",".join(DEFAULT_SUBSETS),
+                        help="Google Fonts unicode subsets to keep when not subsetting (default: %(default)s)")
+    args = parser.parse_args()
+
+    subset = args.subset is not None
+    if subset and font_subset is None:
+        parser.error("--subset needs fontTools and brotli: pip install fonttools brotli")
+    codepoints = None
+    if subset:
+        characters = set(BASE_CHARACTERS)
+        for path in args.subset:
+            characters.update(Path(path).read_text(encoding="utf-8"))
+        codepoints = {ord(c) for c in characters}
+
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    print("Google Fonts:")
+    vendor_google_fonts(session, args.subsets.split(","), codepoints)
+    print("Font Awesome:")
+    vendor_font_awesome(session, subset)
+    print(f"Assets written to {ASSETS_DIRECTORY}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,16 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from job_search.http_client import AsyncHttpClient
 
 class JobFetcher(ABC):
     """
     Abstract base class for job fetchers.
     All job board/source fetchers should inherit from this and implement fetch_jobs.
+    Fetchers that talk HTTP should also override afetch_jobs to use the shared async client,
+    so the scraping engine can run them concurrently.
     """
     @abstractmethod
     def fetch_jobs(self, query: str = "", filters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
@@ -17,3 +23,14 @@ class JobFetcher(ABC):
             List of standardized job dicts.
         """
         pass
+
+    async def afetch_jobs(
+        self, query: str = "", filters: Dict[str, Any] = None, client: Optional["AsyncHttpClient"] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Async version of fetch_jobs, run by the scraping engine (job_search/engine.py).
+        Args:
+            client: Shared async HTTP client with per-host concurrency caps and timeouts.
+        The default runs the blocking fetch_jobs in a worker thread.
+        """
+        return await asyncio.to_thread(self.fetch_jobs, query, filters)
@@ -0,0 +1,143 @@
+"""
+Single-pass extraction of job cards from job board listing pages.
+
+The card and field selectors are compiled once at import. Each card is then
+read in one walk over its elements that fills every field, instead of
+evaluating one CSS selector per field (twice with the test-then-read
+``select_one`` idiom). Pages are parsed with lxml when it is installed and
+with BeautifulSoup's ``html.parser`` otherwise; both produce the same fields.
+
+Only simple selectors are supported: ``tag``, ``.class`` (repeatable) and
+``[attribute]``, e.g. ``div.job-listing`` or ``time[datetime]``.
+"""
+import re
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+CARD_SELECTOR = "div.job-listing"
+
+# Field -> (selector, attribute to read; None reads the text)
+CARD_FIELDS: Dict[str, Tuple[str, Optional[str]]] = {
+    "title": ("h2", None),
+    "company": ("div.company", None),
+    "location": ("div.location", None),
+    "link": ("a.job-link", "href"),
+    "description": ("div.description", None),
+    "posted": ("time[datetime]", "datetime"),
+}
+
+SIMPLE_SELECTOR = re.compile(r"^(?P<tag>[a-zA-Z][a-zA-Z0-9-]*)?(?P<classes>(?:\.[\w-]+)*)(?P<attrs>(?:\[[\w-]+\])*)$")
+
+
+@dataclass(frozen=True)
+class SimpleSelector:
+    tag: Optional[str]
+    classes: FrozenSet[str]
+    attributes: Tuple[str, ...]
+
+    def matches(self, tag: str, class_attr: Optional[str], has_attribute) -> bool:
+        if self.tag is not None and tag != self.tag:
+            return False
+        if self.classes and not self.classes.issubset((class_attr or "").split()):
+            return False
+        return all(has_attribute(name) for name in self.attributes)
+
+    def xpath(self) -> str:
+        conditions = [f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')" for name in sorted(self.classes)]
+        conditions += [f"@{name}" for name in self.attributes]
+        return f"//{self.tag or '*'}" + "".join(f"[{condition}]" for condition in conditions)
+
+
+def compile_selector(selector: str) -> SimpleSelector:
+    match = SIMPLE_SELECTOR.match(selector.strip())
+    if not match:
+        raise ValueError(f"Unsupported selector '{selector}': only tag, .class and [attribute] are supported")
+    return SimpleSelector(
+        tag=match.group("tag").lower() if match.group("tag") else None,
+        classes=frozenset(re.findall(r"\.([\w-]+)", match.group("classes"))),
+        attributes=tuple(re.findall(r"\[([\w-]+)\]", match.group("attrs"))),
+    )
+
+
+_CARD = compile_selector(CARD_SELECTOR)
+_FIELDS = [(name, compile_selector(selector), attribute) for name, (selector, attribute) in CARD_FIELDS.items()]
+_CARD_XPATH = etree.XPath(_CARD.xpath()) if lxml_html is not None else None
+# Text nodes of an element as BeautifulSoup's get_text() sees them: script, style and template content is not text
+_TEXT_XPATH = (
+    etree.XPath("descendant-or-self::text()[not(ancestor::script or ancestor::style or ancestor::template)]")
+    if lxml_html is not None else None
+)
+
+
+def _strip_join(strings) -> str:
+    # Same text as BeautifulSoup's get_text(strip=True): every string stripped, then concatenated
+    return "".join(string.strip() for string in strings)
+
+
+def _extract_lxml(html: str) -> List[Dict[str, str]]:
+    if not html.strip():
+        return []
+    try:
+        root = lxml_html.fromstring(html)
+    except ValueError:  # str input with an XML encoding declaration
+        root = lxml_html.fromstring(html.encode("utf-8"))
+    cards = []
+    for card in _CARD_XPATH(root):
+        fields = dict.fromkeys(CARD_FIELDS, "")
+        pending = list(_FIELDS)
+        for element in card.iterdescendants():
+            if not isinstance(element.tag, str):  # comments and processing instructions
+                continue
+            for field in list(pending):
+                name, selector, attribute = field
+                if selector.matches(element.tag, element.get("class"), lambda key: element.get(key) is not None):
+                    fields[name] = element.get(attribute, "") if attribute else _strip_join(_TEXT_XPATH(element))
+                    pending.remove(field)
+            if not pending:
+                break
+        cards.append(fields)
+    return cards
+
+
+def _extract_soup(html: str) -> List[Dict[str, str]]:
+    from bs4 import BeautifulSoup, Tag
+
+    cards = []
+    soup = BeautifulSoup(html, "html.parser")
+    for card in soup.find_all(_CARD.tag or True):
+        if not _CARD.matches(card.name, " ".join(card.get("class", [])), card.has_attr):
+            continue
+        fields = dict.fromkeys(CARD_FIELDS, "")
+        pending = list(_FIELDS)
+        for element in card.descendants:
+            if not isinstance(element, Tag):
+                continue
+            for field in list(pending):
+                name, selector, attribute = field
+                if selector.matches(element.name, " ".join(element.get("class", [])), element.has_attr):
+                    fields[name] = element.get(attribute, "") if attribute else element.get_text(strip=True)
+                    pending.remove(field)
+            if not pending:
+                break
+        cards.append(fields)
+    return cards
+
+
+def extract_cards(html: str, parser: Optional[str] = None) -> List[Dict[str, str]]:
+    """
+    Fields of every job card of a listing page, in page order; a field missing from a card is "".
+    ``parser`` forces "lxml" or "html.parser"; by default lxml is used when installed.
+    """
+    if parser is None:
+        parser = "lxml" if lxml_html is not None else "html.parser"
+    if parser == "lxml":
+        if lxml_html is None:
+            raise RuntimeError("lxml is not installed")
+        return _extract_lxml(html)
+    return _extract_soup(html)
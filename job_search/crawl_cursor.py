@@ -0,0 +1,199 @@
+"""
+Incremental, pagination-aware crawling of job board search results.
+
+Job boards list postings newest first. For every (source, query) the cursor
+store keeps a high-water mark: the ids (posting URLs) of the most recent
+postings seen and the newest posting date when the board shows one. A crawl
+walks the result pages in order and stops after the page that reaches the
+mark, so a run only downloads the pages holding postings newer than the
+previous run, and the first run goes up to ``max_pages`` deep. Unseen
+postings on that last page are still kept, so a pinned or promoted posting
+that was already seen does not hide the new ones below it.
+
+A finished crawl does not move its cursor right away: ``commit_crawls()``
+saves the cursors of every finished crawl and is called once their postings
+have been processed and stored, so a run that fails after scraping fetches the
+same postings again next time instead of losing them. A crawl that did not end
+cleanly (an HTTP error or exception before it reached the mark, ran out of
+results or hit ``max_pages``) never moves its cursor: the pages it skipped
+would otherwise be behind the mark for good.
+"""
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from loguru import logger
+
+import config as cfg
+
+# Posting ids remembered per cursor; more than one so a deleted posting does not lose the mark
+CURSOR_SEEN_IDS = 50
+
+
+@dataclass
+class CrawlCursor:
+    seen_ids: List[str] = field(default_factory=list)
+    newest_posted: Optional[str] = None  # ISO 8601 date of the newest posting, when the board shows dates
+
+    def is_seen(self, posting: Dict[str, Any]) -> bool:
+        if posting.get("link") in self.seen_ids:
+            return True
+        posted = posting.get("posted")
+        # Strictly older only: postings sharing the newest date are told apart by their ids
+        return bool(posted and self.newest_posted and posted < self.newest_posted)
+
+
+class CrawlCursorStore:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS crawl_cursors (
+                source TEXT NOT NULL,
+                query TEXT NOT NULL,
+                seen_ids TEXT NOT NULL,
+                newest_posted TEXT,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (source, query)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, source: str, query: str) -> CrawlCursor:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT seen_ids, newest_posted FROM crawl_cursors WHERE source = ? AND query = ?", (source, query)
+            ).fetchone()
+        if row is None:
+            return CrawlCursor()
+        return CrawlCursor(json.loads(row[0]), row[1])
+
+    def put(self, source: str, query: str, cursor: CrawlCursor) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO crawl_cursors (source, query, seen_ids, newest_posted, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (source, query, json.dumps(cursor.seen_ids), cursor.newest_posted, time.time()),
+            )
+            self._conn.commit()
+
+
+class IncrementalCrawl:
+    """
+    State of one crawl of a query's result pages. Feed each page's postings (all of them, before any
+    location filtering) to ``add_page`` until it returns False, then call ``finish``; call ``abandon``
+    first when a page could not be fetched. The new high-water mark is saved by ``commit``, normally
+    through ``commit_crawls()``, and only for crawls that were not abandoned.
+    """
+
+    def __init__(self, source: str, query: str, store: Optional[CrawlCursorStore], max_pages: int):
+        self.source = source
+        self.query = query
+        self.store = store
+        self.max_pages = max_pages
+        self.cursor = store.get(source, query) if store else CrawlCursor()
+        self.fresh: List[Dict[str, Any]] = []
+        self._fresh_ids = set()
+        self.pages_fetched = 0
+        self.abandoned = False
+
+    def pages(self) -> Iterator[int]:
+        return iter(range(1, self.max_pages + 1))
+
+    def add_page(self, postings: List[Dict[str, Any]]) -> bool:
+        """Collect the postings newer than the cursor; returns whether the next page is worth fetching."""
+        self.pages_fetched += 1
+        if not postings:
+            return False
+        new_on_page = 0
+        reached_mark = False
+        for posting in postings:
+            if self.cursor.is_seen(posting):
+                reached_mark = True
+                continue
+            posting_id = posting.get("link")
+            if posting_id in self._fresh_ids:
+                continue
+            self._fresh_ids.add(posting_id)
+            self.fresh.append(posting)
+            new_on_page += 1
+        # A page repeating earlier ones means the board ignored the page parameter
+        return new_on_page > 0 and not reached_mark
+
+    def abandon(self, reason: str) -> None:
+        """Keep the stored cursor: the crawl stopped before the pages up to the previous mark were all read."""
+        self.abandoned = True
+        logger.warning(f"{self.source} '{self.query}': crawl stopped after {self.pages_fetched} pages ({reason}), cursor kept")
+
+    def finish(self) -> List[Dict[str, Any]]:
+        """Return the postings newer than the previous high-water mark; the new mark waits for ``commit_crawls()``."""
+        if self.store and self.fresh and not self.abandoned:
+            with _pending_crawls_lock:
+                _pending_crawls.append(self)
+        logger.debug(
+            f"{self.source} '{self.query}': {len(self.fresh)} new postings in {self.pages_fetched} pages"
+        )
+        return self.fresh
+
+    def commit(self) -> None:
+        """Persist the high-water mark moved past the postings of this crawl."""
+        if not self.store or not self.fresh or self.abandoned:
+            return
+        seen_ids = [posting["link"] for posting in self.fresh if posting.get("link")]
+        dates = [posting["posted"] for posting in self.fresh if posting.get("posted")]
+        if self.cursor.newest_posted:
+            dates.append(self.cursor.newest_posted)
+        self.store.put(self.source, self.query, CrawlCursor(
+            seen_ids=list(dict.fromkeys(seen_ids + self.cursor.seen_ids))[:CURSOR_SEEN_IDS],
+            newest_posted=max(dates) if dates else None,
+        ))
+
+
+# Finished crawls whose cursors are saved by the next commit_crawls()
+_pending_crawls: List[IncrementalCrawl] = []
+_pending_crawls_lock = threading.Lock()
+
+
+def commit_crawls() -> int:
+    """
+    Save the cursors of every crawl finished since the last call and return how many were saved.
+    Call it once the scraped postings are stored (e.g. the report is written): until then the next
+    run crawls the same postings again.
+    """
+    with _pending_crawls_lock:
+        crawls = list(_pending_crawls)
+        _pending_crawls.clear()
+    for crawl in crawls:
+        crawl.commit()
+    if crawls:
+        logger.debug(f"Saved {len(crawls)} crawl cursors")
+    return len(crawls)
+
+
+_crawl_cursor_store: Optional[CrawlCursorStore] = None
+_crawl_cursor_store_lock = threading.Lock()
+
+
+def get_crawl_cursor_store() -> Optional[CrawlCursorStore]:
+    """Return the process-wide cursor store, or None when incremental crawling is disabled in config.py."""
+    global _crawl_cursor_store
+    if not cfg.JOB_SCRAPER_INCREMENTAL:
+        return None
+    if _crawl_cursor_store is None:
+        with _crawl_cursor_store_lock:
+            if _crawl_cursor_store is None:
+                _crawl_cursor_store = CrawlCursorStore(Path(cfg.JOB_SCRAPER_CURSOR_PATH))
+    return _crawl_cursor_store
+
+
+def start_crawl(source: str, query: str, max_pages: Optional[int] = None) -> IncrementalCrawl:
+    return IncrementalCrawl(source, query, get_crawl_cursor_store(), max_pages or cfg.JOB_SCRAPER_MAX_PAGES)
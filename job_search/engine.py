@@ -0,0 +1,56 @@
+"""
+Concurrent scraping engine for the job fetchers.
+
+Runs every (fetcher, query) pair at once on one event loop through a shared
+``AsyncHttpClient``, so a scrape takes about as long as its slowest request
+instead of the sum of all of them. Per-host concurrency caps and timeouts are
+enforced by the client; a failing or timed-out search is logged and skipped
+without affecting the others.
+"""
+import asyncio
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from loguru import logger
+
+from job_search.base import JobFetcher
+from job_search.http_client import AsyncHttpClient
+
+
+class ScrapeEngine:
+    def __init__(self, fetchers: Iterable[JobFetcher], timeout: Optional[float] = None, per_host_limit: Optional[int] = None):
+        self.fetchers = list(fetchers)
+        self.timeout = timeout
+        self.per_host_limit = per_host_limit
+
+    async def _fetch(self, fetcher: JobFetcher, query: str, filters: Optional[Dict[str, Any]],
+                     client: AsyncHttpClient) -> List[Dict[str, Any]]:
+        start = time.perf_counter()
+        try:
+            jobs = await fetcher.afetch_jobs(query, filters, client=client)
+        except Exception as e:
+            logger.warning(f"{type(fetcher).__name__} failed for '{query}': {type(e).__name__}: {e}")
+            return []
+        logger.debug(f"{type(fetcher).__name__} found {len(jobs)} jobs for '{query}' in {time.perf_counter() - start:.2f}s")
+        return jobs
+
+    async def arun(self, queries: Iterable[str], filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Fetch every query from every source concurrently; results keep the fetcher, then query, order."""
+        queries = list(queries)
+        start = time.perf_counter()
+        async with AsyncHttpClient(self.timeout, self.per_host_limit) as client:
+            results = await asyncio.gather(*(
+                self._fetch(fetcher, query, filters, client) for fetcher in self.fetchers for query in queries
+            ))
+        jobs = [job for result in results for job in result]
+        logger.info(
+            f"Scraped {len(jobs)} jobs from {len(self.fetchers)} sources x {len(queries)} queries "
+            f"in {time.perf_counter() - start:.2f}s"
+        )
+        if client.cache is not None:
+            logger.info(f"HTTP cache: {client.cache.hits} pages not modified, {client.cache.misses} downloaded so far")
+        return jobs
+
+    def run(self, queries: Iterable[str], filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Blocking entry point for synchronous callers."""
+        return asyncio.run(self.arun(queries, filters))
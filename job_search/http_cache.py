@@ -0,0 +1,154 @@
+"""
+On-disk HTTP cache with conditional GETs for scraped listing pages.
+
+Responses carrying an ``ETag`` or ``Last-Modified`` validator are stored in
+SQLite with their body. The next request for the same URL sends
+``If-None-Match`` / ``If-Modified-Since``; when the server answers
+``304 Not Modified`` the stored body is served instead of downloading the page
+again. The store is bounded by total body size and evicts the least recently
+used pages first.
+"""
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Mapping, Optional
+
+from loguru import logger
+
+import config as cfg
+
+# Hop-by-hop or encoding headers that no longer describe the stored (decoded) body
+UNCACHED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"}
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    def __init__(self, path: Path, max_bytes: Optional[int] = None):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+        # Running total of the stored body sizes, so inserts only scan the table when eviction is due
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0]
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, headers, body, etag, last_modified FROM http_cache WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        status, headers, body, etag, last_modified = row
+        return CachedResponse(url, status, json.loads(headers), bytes(body), etag, last_modified)
+
+    def put(self, url: str, status: int, headers: Mapping[str, str], body: bytes) -> bool:
+        """Store a response if it has a validator and may be stored; returns whether it was."""
+        headers = {name.lower(): value for name, value in headers.items()}
+        etag, last_modified = headers.get("etag"), headers.get("last-modified")
+        if status != 200 or not (etag or last_modified) or "no-store" in headers.get("cache-control", ""):
+            return False
+        if self.max_bytes and len(body) > self.max_bytes:
+            return False
+        stored_headers = {name: value for name, value in headers.items() if name not in UNCACHED_HEADERS}
+        now = time.time()
+        with self._lock:
+            replaced = self._conn.execute("SELECT size FROM http_cache WHERE url = ?", (url,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO http_cache "
+                "(url, status, headers, body, etag, last_modified, size, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, status, json.dumps(stored_headers), body, etag, last_modified, len(body), now, now),
+            )
+            self._total_bytes += len(body) - (replaced[0] if replaced else 0)
+            if self.max_bytes and self._total_bytes > self.max_bytes:
+                # Keep the most recently used pages whose bodies fit in max_bytes
+                self._conn.execute(
+                    "DELETE FROM http_cache WHERE url IN ("
+                    "SELECT url FROM (SELECT url, SUM(size) OVER (ORDER BY last_access DESC, url) AS total "
+                    "FROM http_cache) WHERE total > ?)",
+                    (self.max_bytes,),
+                )
+                self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0]
+            self._conn.commit()
+        return True
+
+    def touch(self, url: str) -> None:
+        with self._lock:
+            self._conn.execute("UPDATE http_cache SET last_access = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+
+    def resolve(
+        self, url: str, cached: Optional[CachedResponse], status: int, headers: Mapping[str, str], body: bytes
+    ) -> Optional[CachedResponse]:
+        """
+        Handle the answer to a (conditional) GET of ``url``: on 304 return the ``cached`` response to serve,
+        otherwise store the new response when possible and return None.
+        """
+        if status == 304 and cached is not None:
+            self.touch(url)
+            self.hits += 1
+            logger.debug(f"HTTP cache: {url} not modified, served {len(cached.body)} bytes from disk")
+            return cached
+        self.misses += 1
+        self.put(url, status, headers, body)
+        return None
+
+    def size(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0]
+
+
+_http_cache: Optional[HttpCache] = None
+_http_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    """Return the process-wide HTTP cache, or None when it is disabled in config.py."""
+    global _http_cache
+    if not cfg.HTTP_CACHE_ENABLED:
+        return None
+    if _http_cache is None:
+        with _http_cache_lock:
+            if _http_cache is None:
+                _http_cache = HttpCache(Path(cfg.HTTP_CACHE_PATH), max_bytes=cfg.HTTP_CACHE_MAX_BYTES)
+    return _http_cache
@@ -0,0 +1,165 @@
+"""
+HTTP clients shared by the job fetchers.
+
+``AsyncHttpClient`` wraps one pooled ``httpx.AsyncClient`` for a whole scrape,
+so every request gets the same timeout, and caps the number of requests in
+flight per host with a semaphore: many keyword searches can run at once
+without hammering a single job board. ``get_session()`` is the pooled
+``requests.Session`` of the blocking fetchers.
+
+Both keep connections alive between requests, ask for gzip (and brotli when a
+brotli decoder is installed) and the async client speaks HTTP/2 when ``h2`` is
+installed, so successive keywords and pages on one host reuse a connection
+instead of paying a new TCP and TLS handshake.
+
+Both also go through the on-disk HTTP cache (job_search/http_cache.py) when it
+is enabled: requests are made conditional and 304 answers are served from disk.
+"""
+import asyncio
+import importlib.util
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+from loguru import logger
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+import config as cfg
+from job_search.http_cache import CachedResponse, HttpCache, get_http_cache
+
+
+def brotli_available() -> bool:
+    return any(importlib.util.find_spec(name) is not None for name in ("brotli", "brotlicffi"))
+
+
+def http2_available() -> bool:
+    return cfg.JOB_SCRAPER_HTTP2 and importlib.util.find_spec("h2") is not None
+
+
+def default_headers() -> Dict[str, str]:
+    # httpx and urllib3 only decode brotli when a brotli package is installed
+    return {"Accept-Encoding": "gzip, deflate, br" if brotli_available() else "gzip, deflate"}
+
+
+def create_async_client(timeout: float, headers: Dict[str, str] = None) -> httpx.AsyncClient:
+    """An httpx client with keep-alive pooling sized from config.py, HTTP/2 when available and compression."""
+    limits = httpx.Limits(
+        max_connections=cfg.JOB_SCRAPER_MAX_CONNECTIONS,
+        max_keepalive_connections=cfg.JOB_SCRAPER_POOL_SIZE,
+        keepalive_expiry=cfg.JOB_SCRAPER_KEEPALIVE_SECONDS,
+    )
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(timeout),
+        limits=limits,
+        http2=http2_available(),
+        headers={**default_headers(), **(headers or {})},
+        follow_redirects=True,
+    )
+
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide requests session of the blocking fetchers, with pool sizes from config.py."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=cfg.JOB_SCRAPER_POOL_HOSTS,
+                    pool_maxsize=cfg.JOB_SCRAPER_POOL_SIZE,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update(default_headers())
+                _session = session
+    return _session
+
+
+def cached_get(url: str, timeout: Optional[float] = None, **kwargs) -> requests.Response:
+    """GET ``url`` with the shared session, as a conditional request served from disk on 304 when cached."""
+    timeout = cfg.JOB_SCRAPER_TIMEOUT_SECONDS if timeout is None else timeout
+    cache = get_http_cache()
+    cached = cache.get(url) if cache else None
+    headers = {**(kwargs.pop("headers", None) or {}), **(cached.conditional_headers() if cached else {})}
+    response = get_session().get(url, headers=headers, timeout=timeout, **kwargs)
+    if cache is None:
+        return response
+    revalidated = cache.resolve(url, cached, response.status_code, response.headers, response.content)
+    if revalidated is None:
+        return response
+    cached_response = requests.Response()
+    cached_response.status_code = revalidated.status
+    cached_response.headers = CaseInsensitiveDict(revalidated.headers)
+    cached_response._content = revalidated.body
+    cached_response.url = url
+    cached_response.request = response.request
+    cached_response.encoding = response.encoding or requests.utils.get_encoding_from_headers(cached_response.headers)
+    return cached_response
+
+
+class AsyncHttpClient:
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        per_host_limit: Optional[int] = None,
+        headers: Dict[str, str] = None,
+        cache: Optional[HttpCache] = None,
+    ):
+        """
+        ``timeout`` (seconds, for connect, read, write and pool acquisition) defaults to
+        config.JOB_SCRAPER_TIMEOUT_SECONDS, ``per_host_limit`` to config.JOB_SCRAPER_PER_HOST_CONCURRENCY
+        and ``cache`` to the shared HTTP cache (None when disabled).
+        """
+        self.timeout = cfg.JOB_SCRAPER_TIMEOUT_SECONDS if timeout is None else timeout
+        self.per_host_limit = per_host_limit or cfg.JOB_SCRAPER_PER_HOST_CONCURRENCY
+        self.cache = cache or get_http_cache()
+        self._client = create_async_client(self.timeout, headers)
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc.lower()
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_semaphores[host]
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """
+        GET ``url`` once a slot for its host is free; raises httpx.TimeoutException past the timeout.
+        Cached pages are requested conditionally and a 304 answer is replaced by the stored response;
+        the SQLite cache is read and written in a worker thread so the event loop keeps running.
+        """
+        cached = await asyncio.to_thread(self.cache.get, url) if self.cache else None
+        headers = {**(kwargs.pop("headers", None) or {}), **(cached.conditional_headers() if cached else {})}
+        async with self._semaphore(url):
+            response = await self._client.get(url, headers=headers, **kwargs)
+        logger.debug(
+            f"GET {url} -> {response.status_code} ({response.http_version}) in {response.elapsed.total_seconds():.2f}s"
+        )
+        if self.cache is None:
+            return response
+        revalidated = await asyncio.to_thread(
+            self.cache.resolve, url, cached, response.status_code, response.headers, response.content
+        )
+        if revalidated is None:
+            return response
+        return self._cached_response(revalidated, response.request)
+
+    @staticmethod
+    def _cached_response(cached: CachedResponse, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(cached.status, headers=cached.headers, content=cached.body, request=request)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
@@ -1,8 +1,9 @@
-import requests
-from bs4 import BeautifulSoup
 from typing import List, Dict
 from datetime import datetime, timedelta
 
+from job_search.card_extractor import extract_cards
+from job_search.http_client import cached_get
+
 EUTECHJOBS_URL = 'https://eutechjobs.com/jobs?search={keywords}&date=last-24-hours'
 
 TARGET_COUNTRIES = [
@@ -22,16 +23,12 @@ def scrape_jobs(keywords: List[str]) -> List[Dict]:
     jobs = []
     for keyword in keywords:
         url = EUTECHJOBS_URL.format(keywords=keyword.replace(' ', '+'))
-        resp = requests.get(url)
+        resp = cached_get(url)
         if resp.status_code != 200:
             continue
-        soup = BeautifulSoup(resp.text, 'html.parser')
-        for job_card in soup.select('div.job-listing'):
-            title = job_card.select_one('h2').get_text(strip=True) if job_card.select_one('h2') else ''
-            company = job_card.select_one('div.company').get_text(strip=True) if job_card.select_one('div.company') else ''
-            location = job_card.select_one('div.location').get_text(strip=True) if job_card.select_one('div.location') else ''
-            link = job_card.select_one('a.job-link')['href'] if job_card.select_one('a.job-link') else ''
-            description = job_card.select_one('div.description').get_text(strip=True) if job_card.select_one('div.description') else ''
+        for card in extract_cards(resp.text):
+            title, company, location = card['title'], card['company'], card['location']
+            link, description = card['link'], card['description']
             # Filter by country/city
             if any(country.lower() in location.lower() for country in TARGET_COUNTRIES) or \
                any(city in location.lower() for city in CITY_KEYWORDS):
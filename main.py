@@ -1,4 +1,3 @@
-import base64
 import sys
 from pathlib import Path
 import traceback
@@ -12,21 +11,24 @@ from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
 import re
+import config as cfg
 from documents.resume_facade import ResumeFacade
 from documents.resume_generator import ResumeGenerator
 from documents.style_manager import StyleManager
 from profiles.schema import JobApplicationProfile
 from profiles.profile import Resume
 from src.logging import logger
-from src.utils.chrome_utils import init_browser
+from src.utils.browser_pool import get_browser_pool
 from src.utils.constants import (
     PLAIN_TEXT_RESUME_YAML,
     SECRETS_YAML,
     WORK_PREFERENCES_YAML,
 )
 from src.skills_extractor import extract_skills_from_text
-from src.job_scraper.relocate_me_scraper import scrape_jobs as scrape_relocate_me
-from src.job_scraper.eutechjobs_scraper import scrape_jobs as scrape_eutechjobs
+from src.job_scraper.relocate_me_scraper import RelocateMeFetcher
+from src.job_scraper.eutechjobs_scraper import EuTechJobsFetcher
+from job_search.crawl_cursor import commit_crawls
+from job_search.engine import ScrapeEngine
 from src.job_scoring import score_job
 from src.excel_reporter import write_jobs_to_excel
 # from ai_hawk.bot_facade import AIHawkBotFacade
@@ -271,7 +273,6 @@ def create_cover_letter(parameters: dict, llm_api_key: str):
         job_url = answers.get('job_url')
         resume_generator = ResumeGenerator()
         resume_object = Resume(plain_text_resume)
-        driver = init_browser()
         resume_generator.set_resume_object(resume_object)
         resume_facade = ResumeFacade(            
             api_key=llm_api_key,
@@ -280,36 +281,16 @@ def create_cover_letter(parameters: dict, llm_api_key: str):
             resume_object=resume_object,
             output_path=Path("data_folder/output"),
         )
-        resume_facade.set_driver(driver)
-        resume_facade.link_to_job(job_url)
-        result_base64, suggested_name = resume_facade.create_cover_letter()         
-
-        # Decodifica Base64 in dati binari
-        try:
-            pdf_data = base64.b64decode(result_base64)
-        except base64.binascii.Error as e:
-            logger.error("Error decoding Base64: %s", e)
-            raise
-
-        # Definisci il percorso della cartella di output utilizzando `suggested_name`
-        output_dir = Path(parameters["outputFileDirectory"]) / suggested_name
-
-        # Crea la cartella se non esiste
-        try:
-            output_dir.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Cartella di output creata o già esistente: {output_dir}")
-        except IOError as e:
-            logger.error("Error creating output directory: %s", e)
-            raise
-        
-        output_path = output_dir / "cover_letter_tailored.pdf"
-        try:
-            with open(output_path, "wb") as file:
-                file.write(pdf_data)
-            logger.info(f"CV salvato in: {output_path}")
-        except IOError as e:
-            logger.error("Error writing file: %s", e)
-            raise
+        with get_browser_pool().browser() as driver:
+            resume_facade.set_driver(driver, pooled=True)
+            resume_facade.link_to_job(job_url)
+        # Il browser torna nel pool prima del rendering: il renderer Chrome ne prende uno solo se serve
+        resume_facade.set_driver(None)
+        # Il PDF viene scritto direttamente su disco in streaming, senza passare da base64
+        output_path, suggested_name = resume_facade.create_cover_letter(
+            output_dir=Path(parameters["outputFileDirectory"])
+        )
+        logger.info(f"CV salvato in: {output_path}")
     except Exception as e:
         logger.exception(f"An error occurred while creating the CV: {e}")
         raise
@@ -360,7 +341,6 @@ def create_resume_pdf_job_tailored(parameters: dict, llm_api_key: str):
         job_url = answers['job_url']
         resume_generator = ResumeGenerator()
         resume_object = Resume(plain_text_resume)
-        driver = init_browser()
         resume_generator.set_resume_object(resume_object)
         resume_facade = ResumeFacade(            
             api_key=llm_api_key,
@@ -369,36 +349,16 @@ def create_resume_pdf_job_tailored(parameters: dict, llm_api_key: str):
             resume_object=resume_object,
             output_path=Path("data_folder/output"),
         )
-        resume_facade.set_driver(driver)
-        resume_facade.link_to_job(job_url)
-        result_base64, suggested_name = resume_facade.create_resume_pdf_job_tailored()         
-
-        # Decodifica Base64 in dati binari
-        try:
-            pdf_data = base64.b64decode(result_base64)
-        except base64.binascii.Error as e:
-            logger.error("Error decoding Base64: %s", e)
-            raise
-
-        # Definisci il percorso della cartella di output utilizzando `suggested_name`
-        output_dir = Path(parameters["outputFileDirectory"]) / suggested_name
-
-        # Crea la cartella se non esiste
-        try:
-            output_dir.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Cartella di output creata o già esistente: {output_dir}")
-        except IOError as e:
-            logger.error("Error creating output directory: %s", e)
-            raise
-        
-        output_path = output_dir / "resume_tailored.pdf"
-        try:
-            with open(output_path, "wb") as file:
-                file.write(pdf_data)
-            logger.info(f"CV salvato in: {output_path}")
-        except IOError as e:
-            logger.error("Error writing file: %s", e)
-            raise
+        with get_browser_pool().browser() as driver:
+            resume_facade.set_driver(driver, pooled=True)
+            resume_facade.link_to_job(job_url)
+        # Il browser torna nel pool prima del rendering: il renderer Chrome ne prende uno solo se serve
+        resume_facade.set_driver(None)
+        # Il PDF viene scritto direttamente su disco in streaming, senza passare da base64
+        output_path, suggested_name = resume_facade.create_resume_pdf_job_tailored(
+            output_dir=Path(parameters["outputFileDirectory"])
+        )
+        logger.info(f"CV salvato in: {output_path}")
     except Exception as e:
         logger.exception(f"An error occurred while creating the CV: {e}")
         raise
@@ -450,8 +410,6 @@ def create_resume_pdf(parameters: dict, llm_api_key: str):
         resume_generator = ResumeGenerator()
         resume_object = Resume(plain_text_resume)
         print("[DEBUG] Resume object created.")
-        driver = init_browser()
-        print("[DEBUG] Selenium driver initialized.")
         resume_generator.set_resume_object(resume_object)
 
         # Create the ResumeFacade
@@ -462,24 +420,12 @@ def create_resume_pdf(parameters: dict, llm_api_key: str):
             resume_object=resume_object,
             output_path=Path("data_folder/output"),
         )
-        resume_facade.set_driver(driver)
-        print("[DEBUG] ResumeFacade created and driver set.")
-        result_base64 = resume_facade.create_resume_pdf()
-        print("[DEBUG] PDF bytes returned from resume_facade.create_resume_pdf().")
-
-        # Write the PDF file
-        output_dir = Path(parameters["outputFileDirectory"])
-        output_path = output_dir / "resume_base.pdf"
-        try:
-            import base64
-            with open(output_path, "wb") as file:
-                file.write(base64.b64decode(result_base64))
-            logger.info(f"Resume saved at: {output_path}")
-            print(f"[DEBUG] Resume saved at: {output_path}")
-        except IOError as e:
-            logger.error("Error writing file: %s", e)
-            print(f"[DEBUG] Error writing file: {e}")
-            raise
+        print("[DEBUG] ResumeFacade created.")
+        # No browser is checked out here: the Chrome renderer borrows one from the pool only when it is used
+        # The PDF is streamed straight to disk instead of being returned as base64
+        output_path = resume_facade.create_resume_pdf(output_dir=Path(parameters["outputFileDirectory"]))
+        logger.info(f"Resume saved at: {output_path}")
+        print(f"[DEBUG] Resume saved at: {output_path}")
     except Exception as e:
         logger.exception(f"An error occurred while creating the CV: {e}")
         print(f"[DEBUG] Exception occurred: {e}")
@@ -571,13 +517,10 @@ def search_and_score_jobs_workflow():
         # 2. Extract skills
         user_skills = extract_skills_from_text(resume_text)
         print(f"Extracted skills: {sorted(user_skills)}")
-        # 3. Scrape jobs from both sources
-        jobs = []
-        print("Scraping Relocate.me ...")
-        jobs += scrape_relocate_me(SEARCH_KEYWORDS)
-        print(f"Found {len(jobs)} jobs from Relocate.me.")
-        print("Scraping EU Tech Jobs ...")
-        jobs += scrape_eutechjobs(SEARCH_KEYWORDS)
+        # 3. Scrape jobs from both sources, every keyword of every source concurrently
+        print("Scraping Relocate.me and EU Tech Jobs ...")
+        jobs = ScrapeEngine([RelocateMeFetcher(), EuTechJobsFetcher()]).run(SEARCH_KEYWORDS)
+        print(f"Found {sum(job['source'] == 'Relocate.me' for job in jobs)} jobs from Relocate.me.")
         print(f"Total jobs found: {len(jobs)}")
         # 4. Score jobs
         for job in jobs:
@@ -591,8 +534,11 @@ def search_and_score_jobs_workflow():
         jobs.sort(key=lambda x: x['score'], reverse=True)
         # 6. Write to Excel
         excel_path = 'data_folder/output/job_search_results.xlsx'
-        write_jobs_to_excel(jobs, excel_path)
+        # Incremental crawls only return new postings: add them to the report instead of replacing it
+        write_jobs_to_excel(jobs, excel_path, merge=cfg.JOB_SCRAPER_INCREMENTAL)
         print(f"Job search results written to {excel_path}")
+        # The crawl cursors only move past postings that made it into the report
+        commit_crawls()
     except Exception as e:
         print(f"Error in job search workflow: {e}")
 
@@ -1,11 +1,20 @@
+from pathlib import Path
+
 import pandas as pd
 from typing import List, Dict
 
-def write_jobs_to_excel(jobs: List[Dict], excel_path: str):
+def write_jobs_to_excel(jobs: List[Dict], excel_path: str, merge: bool = False):
     """
     Write a list of job dicts (with score, filenames, etc.) to an Excel file.
+    With ``merge``, the rows already in the file are kept and a job found again (same link) is updated.
     """
     df = pd.DataFrame(jobs)
+    if merge and Path(excel_path).exists():
+        df = pd.concat([df, pd.read_excel(excel_path)], ignore_index=True)
+        if 'link' in df.columns:
+            df = df.drop_duplicates(subset='link', keep='first')
+        if 'score' in df.columns:
+            df = df.sort_values('score', ascending=False, kind='stable')
     # Reorder columns if present
     columns = [
         'title', 'company', 'location', 'link', 'score', 'score_explanation',
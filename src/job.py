@@ -11,6 +11,7 @@ class Job:
     description: str = ""
     summarize_job_description: str = ""
     recruiter_link: str = ""
+    recruiter_email: str = ""
     resume_path: str = ""
     cover_letter_path: str = ""
 
@@ -0,0 +1,103 @@
+"""
+Shared fetcher for job boards that list jobs as ``div.job-listing`` cards.
+
+Each board subclass only sets its search URL, base URL and source name. The
+same parsing and paginated, incremental crawl (job_search/crawl_cursor.py) run
+behind the blocking ``fetch_jobs`` (requests) and the async ``afetch_jobs``
+used by the concurrent scraping engine (job_search/engine.py).
+"""
+from typing import Any, Dict, List, Optional
+
+from job_search.base import JobFetcher
+from job_search.card_extractor import extract_cards
+from job_search.crawl_cursor import start_crawl
+from job_search.http_client import AsyncHttpClient, cached_get
+
+TARGET_COUNTRIES = [
+    'Ireland', 'Netherlands', 'Finland', 'Denmark', 'Luxembourg',
+    'Germany', 'Sweden', 'Norway', 'Switzerland', 'Belgium', 'France', 'Estonia', 'Lithuania', 'Latvia', 'Czech Republic'
+]
+
+CITY_KEYWORDS = [
+    'dublin', 'amsterdam', 'helsinki', 'copenhagen', 'luxembourg', 'berlin', 'stockholm', 'oslo', 'zurich', 'brussels', 'paris', 'tallinn', 'vilnius', 'riga', 'prague'
+]
+
+
+def in_target_location(job: Dict[str, Any]) -> bool:
+    location = job['location'].lower()
+    return any(country.lower() in location for country in TARGET_COUNTRIES) or \
+        any(city in location for city in CITY_KEYWORDS)
+
+
+class ListingPageFetcher(JobFetcher):
+    search_url: str = ""  # with a {keywords} placeholder
+    base_url: str = ""
+    source: str = ""
+    page_param: str = "page"  # query parameter selecting the results page
+
+    def url_for(self, query: str, page: int = 1) -> str:
+        url = self.search_url.format(keywords=query.replace(' ', '+'))
+        if page > 1:
+            url += f"{'&' if '?' in url else '?'}{self.page_param}={page}"
+        return url
+
+    def parse_cards(self, html: str) -> List[Dict[str, Any]]:
+        """
+        Job dicts (title, company, location, link, description, posted, source) of every card of a results page,
+        in page order. ``posted`` is the card's <time datetime> value, or "" when the board shows none.
+        """
+        jobs = []
+        for card in extract_cards(html):
+            link = card['link']
+            jobs.append({
+                'title': card['title'],
+                'company': card['company'],
+                'location': card['location'],
+                'link': link if link.startswith('http') else f'{self.base_url}{link}',
+                'description': card['description'],
+                'posted': card['posted'],
+                'source': self.source,
+            })
+        return jobs
+
+    def parse_jobs(self, html: str) -> List[Dict[str, Any]]:
+        """The cards of a results page located in target countries/cities."""
+        return [job for job in self.parse_cards(html) if in_target_location(job)]
+
+    def fetch_jobs(self, query: str = "", filters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """
+        Crawl the result pages of ``query`` newer than the stored cursor (see job_search/crawl_cursor.py).
+        A page answering other than 200, or raising, leaves the cursor where it was.
+        """
+        crawl = start_crawl(self.source, query)
+        for page in crawl.pages():
+            resp = cached_get(self.url_for(query, page))
+            if resp.status_code != 200:
+                crawl.abandon(f"HTTP {resp.status_code} on page {page}")
+                break
+            if not crawl.add_page(self.parse_cards(resp.text)):
+                break
+        return [job for job in crawl.finish() if in_target_location(job)]
+
+    async def afetch_jobs(
+        self, query: str = "", filters: Dict[str, Any] = None, client: Optional[AsyncHttpClient] = None
+    ) -> List[Dict[str, Any]]:
+        if client is None:
+            async with AsyncHttpClient() as client:
+                return await self.afetch_jobs(query, filters, client)
+        crawl = start_crawl(self.source, query)
+        for page in crawl.pages():
+            resp = await client.get(self.url_for(query, page))
+            if resp.status_code != 200:
+                crawl.abandon(f"HTTP {resp.status_code} on page {page}")
+                break
+            if not crawl.add_page(self.parse_cards(resp.text)):
+                break
+        return [job for job in crawl.finish() if in_target_location(job)]
+
+    def scrape(self, keywords: List[str]) -> List[Dict[str, Any]]:
+        """Fetch each keyword in turn; see job_search.engine.ScrapeEngine to fetch them concurrently."""
+        jobs = []
+        for keyword in keywords:
+            jobs += self.fetch_jobs(keyword)
+        return jobs
@@ -0,0 +1,174 @@
+"""
+Persistent memory of answers given to application-form questions.
+
+Answers are stored per question kind (numeric, options, textual) under the
+normalized question text and its sorted options, together with a fingerprint
+of the resume and job application profile they were derived from. Lookups
+accept near-identical wording via Levenshtein distance, and answers recorded
+for a different resume or profile are never returned.
+"""
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, List, Optional
+
+from Levenshtein import distance
+
+import config as cfg
+from src.logging import logger
+
+NUMERIC = "numeric"
+OPTIONS = "options"
+TEXTUAL = "textual"
+
+
+def normalize_question(question: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace."""
+    return " ".join(re.sub(r"[^\w\s]", " ", question.lower()).split())
+
+
+# Words whose presence or absence does not change what a form question asks
+FILLER_WORDS = {
+    "a", "an", "the", "do", "does", "you", "your", "please", "have", "has", "of", "in", "with",
+    "for", "to", "are", "is", "how", "many", "what", "kindly", "enter", "provide", "s",
+}
+
+
+# Words and prefixes that turn a question into its opposite; a yes/no answer must not carry over
+NEGATION_WORDS = {"not", "no", "never", "cannot", "nor", "without", "t"}  # "t" is what "n't" normalizes to
+NEGATION_PREFIXES = ("un", "non", "in", "im", "ir", "il", "dis")
+
+
+def is_negation(word: str, other: str) -> bool:
+    """True when one word is the other with a negating prefix, e.g. "unwilling" and "willing"."""
+    shorter, longer = sorted((word, other), key=len)
+    return any(longer == prefix + shorter for prefix in NEGATION_PREFIXES)
+
+
+def is_rephrasing(question: str, other: str) -> bool:
+    """
+    True when two normalized questions differ only in filler words or small typos. A short
+    distinguishing word ("Go" vs "C") is a different question even if the strings are close, and
+    so is a negation ("willing" vs "unwilling", or a "not" only one of them has).
+    """
+    words, other_words = set(question.split()), set(other.split())
+    for word in words ^ other_words:
+        if word in NEGATION_WORDS:
+            return False
+        if word in FILLER_WORDS:
+            continue
+        counterparts = other_words if word in words else words
+        if any(is_negation(word, c) for c in counterparts):
+            return False
+        max_edits = 1 if len(word) < 6 else 2
+        if len(word) < 4 or not any(distance(word, c) <= max_edits for c in counterparts):
+            return False
+    return True
+
+
+def options_key(options: Optional[List[str]]) -> str:
+    if not options:
+        return ""
+    return json.dumps(sorted(normalize_question(option) for option in options), ensure_ascii=False)
+
+
+def profile_fingerprint(resume: Any, job_application_profile: Any) -> str:
+    """Hash of the resume and job application profile the answers are derived from."""
+    digest = hashlib.sha256()
+    digest.update(str(resume).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(str(job_application_profile).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class AnswerMemory:
+    def __init__(self, path: Path, max_distance_ratio: float = 0.15):
+        self.path = Path(path)
+        self.max_distance_ratio = max_distance_ratio
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS answers (
+                kind TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                options TEXT NOT NULL,
+                question TEXT NOT NULL,
+                answer TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (kind, fingerprint, options, question)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def recall(self, kind: str, question: str, fingerprint: str, options: Optional[List[str]] = None) -> Optional[str]:
+        """Return the stored answer for the question or a near-identical one, if any."""
+        normalized = normalize_question(question)
+        key = (kind, fingerprint, options_key(options))
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT answer FROM answers WHERE kind = ? AND fingerprint = ? AND options = ? AND question = ?",
+                (*key, normalized),
+            ).fetchone()
+            if row is not None:
+                logger.debug(f"Answer memory exact hit for '{question}'")
+                return row[0]
+            candidates = self._conn.execute(
+                "SELECT question, answer FROM answers WHERE kind = ? AND fingerprint = ? AND options = ?",
+                key,
+            ).fetchall()
+
+        best_answer, best_ratio = None, None
+        for stored_question, answer in candidates:
+            ratio = distance(normalized, stored_question) / max(len(normalized), len(stored_question), 1)
+            if ratio > self.max_distance_ratio or not is_rephrasing(normalized, stored_question):
+                continue
+            if best_ratio is None or ratio < best_ratio:
+                best_answer, best_ratio = answer, ratio
+        if best_answer is not None:
+            logger.debug(f"Answer memory fuzzy hit for '{question}' (distance ratio {best_ratio:.2f})")
+        return best_answer
+
+    def remember(self, kind: str, question: str, answer: str, fingerprint: str, options: Optional[List[str]] = None) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO answers (kind, fingerprint, options, question, answer, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (kind, fingerprint, options_key(options), normalize_question(question), str(answer), time.time()),
+            )
+            self._conn.commit()
+
+    def invalidate_except(self, fingerprint: str) -> int:
+        """Drop answers derived from any other resume/profile version; returns how many were removed."""
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM answers WHERE fingerprint != ?", (fingerprint,))
+            self._conn.commit()
+        removed = max(cursor.rowcount, 0)
+        if removed:
+            logger.info(f"Answer memory invalidated {removed} answers after a resume/profile change")
+        return removed
+
+
+_answer_memory: Optional[AnswerMemory] = None
+_answer_memory_lock = threading.Lock()
+
+
+def get_answer_memory() -> Optional[AnswerMemory]:
+    """Return the process-wide answer memory, or None when it is disabled in config.py."""
+    global _answer_memory
+    if not cfg.ANSWER_MEMORY_ENABLED:
+        return None
+    if _answer_memory is None:
+        with _answer_memory_lock:
+            if _answer_memory is None:
+                _answer_memory = AnswerMemory(
+                    Path(cfg.ANSWER_MEMORY_PATH),
+                    max_distance_ratio=cfg.ANSWER_MEMORY_MAX_DISTANCE_RATIO,
+                )
+    return _answer_memory
@@ -0,0 +1,179 @@
+"""
+Shared store of job-description summaries.
+
+GPTAnswerer, the tailored resume generator and the cover letter generator all
+summarize the job description before using it. Summaries are stored in SQLite
+under the hash of the description and the version of the summarize template
+that produced them, so a description is summarized once per template no
+matter how many consumers need it. Concurrent requests for the same key wait
+for the first summarization instead of starting their own.
+"""
+import asyncio
+import hashlib
+import sqlite3
+import textwrap
+import threading
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+import config as cfg
+from src.logging import logger
+
+
+def description_hash(description: str) -> str:
+    """Hash of the job description with whitespace differences ignored."""
+    return hashlib.sha256(" ".join(description.split()).encode("utf-8")).hexdigest()
+
+
+def template_version(template: str) -> str:
+    """Short hash identifying the summarize template, so editing the prompt invalidates old summaries."""
+    return hashlib.sha256(textwrap.dedent(template).strip().encode("utf-8")).hexdigest()[:16]
+
+
+class JobSummaryCache:
+    def __init__(self, path: Path, max_entries: Optional[int] = None):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._inflight: Dict[Tuple[asyncio.AbstractEventLoop, Tuple[str, str]], asyncio.Future] = {}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS job_summaries (
+                description_hash TEXT NOT NULL,
+                template_version TEXT NOT NULL,
+                summary TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (description_hash, template_version)
+            )
+            """
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _key(description: str, template: str) -> Tuple[str, str]:
+        return description_hash(description), template_version(template)
+
+    def get(self, description: str, template: str) -> Optional[str]:
+        key = self._key(description, template)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT summary FROM job_summaries WHERE description_hash = ? AND template_version = ?",
+                key,
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE job_summaries SET last_access = ? WHERE description_hash = ? AND template_version = ?",
+                (time.time(), *key),
+            )
+            self._conn.commit()
+        logger.debug(f"Job summary cache hit ({key[0][:12]}, template {key[1]})")
+        return row[0]
+
+    def put(self, description: str, template: str, summary: str) -> None:
+        key = self._key(description, template)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO job_summaries "
+                "(description_hash, template_version, summary, created_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                (*key, summary, now, now),
+            )
+            if self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM job_summaries WHERE rowid IN ("
+                    "SELECT rowid FROM job_summaries ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+            self._conn.commit()
+
+    def get_or_create(self, description: str, template: str, summarize: Callable[[], str]) -> str:
+        """Return the stored summary, calling ``summarize`` once per key when there is none yet."""
+        key = self._key(description, template)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        try:
+            with key_lock:
+                summary = self.get(description, template)
+                if summary is None:
+                    logger.debug(f"Job summary cache miss ({key[0][:12]}, template {key[1]})")
+                    summary = summarize()
+                    self.put(description, template, summary)
+        finally:
+            with self._lock:
+                self._key_locks.pop(key, None)
+        return summary
+
+    async def aget_or_create(
+        self, description: str, template: str, asummarize: Callable[[], Awaitable[str]]
+    ) -> str:
+        """Async counterpart of ``get_or_create``: concurrent callers on one event loop share one summarization."""
+        summary = self.get(description, template)
+        if summary is not None:
+            return summary
+        # Futures belong to an event loop, so in-flight summaries are shared per loop
+        inflight_key = (asyncio.get_running_loop(), self._key(description, template))
+        with self._lock:
+            future = self._inflight.get(inflight_key)
+            owner = future is None
+            if owner:
+                future = inflight_key[0].create_future()
+                self._inflight[inflight_key] = future
+        if not owner:
+            return await asyncio.shield(future)
+        try:
+            summary = await asummarize()
+            self.put(description, template, summary)
+            future.set_result(summary)
+            return summary
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark as retrieved when nobody else was waiting
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(inflight_key, None)
+
+
+_job_summary_cache: Optional[JobSummaryCache] = None
+_job_summary_cache_lock = threading.Lock()
+
+
+def get_job_summary_cache() -> Optional[JobSummaryCache]:
+    """Return the process-wide summary store, or None when it is disabled in config.py."""
+    global _job_summary_cache
+    if not cfg.JOB_SUMMARY_CACHE_ENABLED:
+        return None
+    if _job_summary_cache is None:
+        with _job_summary_cache_lock:
+            if _job_summary_cache is None:
+                _job_summary_cache = JobSummaryCache(
+                    Path(cfg.JOB_SUMMARY_CACHE_PATH), max_entries=cfg.JOB_SUMMARY_CACHE_MAX_ENTRIES
+                )
+    return _job_summary_cache
+
+
+def summarize_with_cache(description: str, template: str, summarize: Callable[[], str]) -> str:
+    """Summarize through the shared store when it is enabled, otherwise call ``summarize`` directly."""
+    cache = get_job_summary_cache()
+    if cache is None:
+        return summarize()
+    return cache.get_or_create(description, template, summarize)
+
+
+async def asummarize_with_cache(
+    description: str, template: str, asummarize: Callable[[], Awaitable[str]]
+) -> str:
+    cache = get_job_summary_cache()
+    if cache is None:
+        return await asummarize()
+    return await cache.aget_or_create(description, template, asummarize)
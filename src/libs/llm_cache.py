@@ -0,0 +1,231 @@
+"""
+Persistent, content-addressed cache for LLM replies.
+
+Replies are keyed by model name, temperature and the SHA-256 of the rendered
+prompt and stored in a SQLite database, so regenerating the same document
+does not pay for the same prompt twice. Entries expire after a TTL and the
+least recently used ones are evicted once the table grows past its limit.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from langchain_core.messages import AIMessage, BaseMessage
+
+import config as cfg
+from src.logging import logger
+
+# Key looked up in ``RunnableConfig["configurable"]`` to skip the cache for one call,
+# e.g. ``chain.invoke(inputs, config={"configurable": {LLM_CACHE_BYPASS: True}})``.
+LLM_CACHE_BYPASS = "llm_cache_bypass"
+
+
+def render_prompt(messages: Any) -> str:
+    """Render a prompt value, message list or string into the text used for hashing."""
+    if isinstance(messages, str):
+        return messages
+    if hasattr(messages, "to_string"):
+        return messages.to_string()
+    if isinstance(messages, list):
+        return "\n".join(
+            f"{getattr(m, 'type', '')}: {getattr(m, 'content', m)}" for m in messages
+        )
+    return json.dumps(messages, default=str, sort_keys=True)
+
+
+def describe_llm(llm: Any) -> Tuple[str, Optional[float]]:
+    """
+    Return the (model name, temperature) pair identifying an LLM.
+
+    Works for bare langchain chat models as well as the ``AIAdapter``/``AIModel``
+    wrappers, which hold the langchain model in ``model`` or ``chatmodel``.
+    """
+    target = llm
+    for _ in range(4):
+        for attr in ("model_name", "model_id", "repo_id", "model"):
+            value = getattr(target, attr, None)
+            if isinstance(value, str) and value:
+                return value, getattr(target, "temperature", None)
+        inner = getattr(target, "chatmodel", None) or getattr(target, "model", None)
+        if inner is None:
+            break
+        target = inner
+    return type(llm).__name__, None
+
+
+def is_cache_bypassed(config: Optional[Dict[str, Any]]) -> bool:
+    """Check whether the runnable config of the current call asks to skip the cache."""
+    if not config:
+        return False
+    return bool((config.get("configurable") or {}).get(LLM_CACHE_BYPASS, False))
+
+
+class LLMResponseCache:
+    """SQLite-backed reply cache with TTL and LRU eviction and hit/miss counters."""
+
+    def __init__(self, path: Path, ttl_seconds: Optional[int], max_entries: Optional[int]):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                model TEXT NOT NULL,
+                temperature TEXT NOT NULL,
+                prompt_hash TEXT NOT NULL,
+                reply TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (model, temperature, prompt_hash)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_responses_last_access ON llm_responses (last_access)"
+        )
+        self._conn.commit()
+        logger.debug(f"LLM response cache opened at {self.path}")
+
+    @staticmethod
+    def _key(llm: Any, messages: Any) -> Tuple[str, str, str]:
+        model_name, temperature = describe_llm(llm)
+        prompt_hash = hashlib.sha256(render_prompt(messages).encode("utf-8")).hexdigest()
+        return model_name, str(temperature), prompt_hash
+
+    @staticmethod
+    def _serialize(reply: BaseMessage) -> str:
+        return json.dumps(
+            {
+                "content": reply.content,
+                "id": reply.id,
+                "response_metadata": reply.response_metadata,
+                "usage_metadata": getattr(reply, "usage_metadata", None),
+            },
+            ensure_ascii=False,
+            default=str,
+        )
+
+    @staticmethod
+    def _deserialize(payload: str) -> AIMessage:
+        data = json.loads(payload)
+        message = AIMessage(
+            content=data["content"],
+            id=data.get("id"),
+            response_metadata=data.get("response_metadata") or {},
+        )
+        if data.get("usage_metadata"):
+            message.usage_metadata = data["usage_metadata"]
+        return message
+
+    def get(self, llm: Any, messages: Any) -> Optional[AIMessage]:
+        """Return the cached reply for this model and prompt, or None on a miss."""
+        key = self._key(llm, messages)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT reply, created_at FROM llm_responses "
+                "WHERE model = ? AND temperature = ? AND prompt_hash = ?",
+                key,
+            ).fetchone()
+            if row is not None and self.ttl_seconds and now - row[1] > self.ttl_seconds:
+                self._conn.execute(
+                    "DELETE FROM llm_responses WHERE model = ? AND temperature = ? AND prompt_hash = ?",
+                    key,
+                )
+                self._conn.commit()
+                self.evictions += 1
+                row = None
+            if row is None:
+                self.misses += 1
+                logger.debug(f"LLM cache miss for model {key[0]} ({key[2][:12]})")
+                return None
+            self._conn.execute(
+                "UPDATE llm_responses SET last_access = ? "
+                "WHERE model = ? AND temperature = ? AND prompt_hash = ?",
+                (now, *key),
+            )
+            self._conn.commit()
+            self.hits += 1
+        logger.debug(f"LLM cache hit for model {key[0]} ({key[2][:12]})")
+        return self._deserialize(row[0])
+
+    def put(self, llm: Any, messages: Any, reply: BaseMessage) -> None:
+        """Store a reply and evict the least recently used entries above the limit."""
+        key = self._key(llm, messages)
+        now = time.time()
+        payload = self._serialize(reply)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses "
+                "(model, temperature, prompt_hash, reply, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (*key, payload, now, now),
+            )
+            if self.max_entries:
+                cursor = self._conn.execute(
+                    "DELETE FROM llm_responses WHERE rowid IN ("
+                    "SELECT rowid FROM llm_responses ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+                self.evictions += max(cursor.rowcount, 0)
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """Delete every entry older than the TTL and return how many were removed."""
+        if not self.ttl_seconds:
+            return 0
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM llm_responses WHERE created_at < ?",
+                (time.time() - self.ttl_seconds,),
+            )
+            self._conn.commit()
+            removed = max(cursor.rowcount, 0)
+            self.evictions += removed
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses")
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": entries,
+        }
+
+
+_llm_cache: Optional[LLMResponseCache] = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """Return the process-wide reply cache, or None when caching is disabled in config.py."""
+    global _llm_cache
+    if not cfg.LLM_CACHE_ENABLED:
+        return None
+    if _llm_cache is None:
+        with _llm_cache_lock:
+            if _llm_cache is None:
+                _llm_cache = LLMResponseCache(
+                    Path(cfg.LLM_CACHE_PATH),
+                    ttl_seconds=cfg.LLM_CACHE_TTL_SECONDS,
+                    max_entries=cfg.LLM_CACHE_MAX_ENTRIES,
+                )
+    return _llm_cache
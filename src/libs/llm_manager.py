@@ -1,20 +1,21 @@
+import asyncio
 import json
 import os
 import re
 import textwrap
-import time
+import threading
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Union
 
-import httpx
 from dotenv import load_dotenv
 from langchain_core.messages import BaseMessage
 from langchain_core.messages.ai import AIMessage
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompt_values import StringPromptValue
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable, RunnableConfig, RunnableLambda
 from Levenshtein import distance
 
 import ai_hawk.llm.prompts as prompts
@@ -36,6 +37,7 @@ from src.utils.constants import (
     INTERESTS,
     JOB_APPLICATION_PROFILE,
     JOB_DESCRIPTION,
+    JOB_DESCRIPTIONS,
     LANGUAGES,
     LEGAL_AUTHORIZATION,
     LLM_MODEL_TYPE,
@@ -71,17 +73,51 @@ from src.utils.constants import (
     WORK_PREFERENCES,
 )
 from src.job import Job
+from src.libs.answer_memory import (
+    NUMERIC as NUMERIC_ANSWER,
+    OPTIONS as OPTIONS_ANSWER,
+    TEXTUAL as TEXTUAL_ANSWER,
+    get_answer_memory,
+    profile_fingerprint,
+)
+from src.libs.job_summary_cache import asummarize_with_cache, summarize_with_cache
+from src.libs.llm_cache import get_llm_cache, is_cache_bypassed
+from src.libs.llm_rate_limiter import estimate_tokens, get_rate_limiter, reported_total_tokens
+from src.libs.llm_retry import aretry_call, retry_call
+from src.libs.section_router import get_section_router
 from src.logging import logger
 import config as cfg
 
 load_dotenv()
 
+# Scores several postings against one copy of the resume; each job answers in the
+# same "Score:"/"Reasoning:" format as the single-job suitability prompt.
+is_relevant_position_batch_template = """
+You are an expert HR recruiter. Evaluate how well the candidate's resume matches each of the job descriptions below.
+For every job, assign a score from 1 to 10, where 10 means the candidate is a perfect fit, and explain the score briefly.
+
+Answer with one block per job, in the same order, using exactly this format and nothing else:
+Job <number>:
+Score: <score>
+Reasoning: <reasoning>
+
+Resume:
+{resume}
+
+Job descriptions:
+{job_descriptions}
+"""
+
 
 class AIModel(ABC):
     @abstractmethod
     def invoke(self, prompt: str) -> str:
         pass
 
+    @abstractmethod
+    async def ainvoke(self, prompt: str) -> str:
+        pass
+
 
 class OpenAIModel(AIModel):
     def __init__(self, api_key: str, llm_model: str):
@@ -96,6 +132,11 @@ class OpenAIModel(AIModel):
         response = self.model.invoke(prompt)
         return response
 
+    async def ainvoke(self, prompt: str) -> BaseMessage:
+        logger.debug("Invoking OpenAI API asynchronously")
+        response = await self.model.ainvoke(prompt)
+        return response
+
 
 class ClaudeModel(AIModel):
     def __init__(self, api_key: str, llm_model: str):
@@ -108,6 +149,11 @@ class ClaudeModel(AIModel):
         logger.debug("Invoking Claude API")
         return response
 
+    async def ainvoke(self, prompt: str) -> BaseMessage:
+        response = await self.model.ainvoke(prompt)
+        logger.debug("Invoking Claude API asynchronously")
+        return response
+
 
 class OllamaModel(AIModel):
     def __init__(self, llm_model: str, llm_api_url: str):
@@ -123,6 +169,10 @@ class OllamaModel(AIModel):
         response = self.model.invoke(prompt)
         return response
 
+    async def ainvoke(self, prompt: str) -> BaseMessage:
+        response = await self.model.ainvoke(prompt)
+        return response
+
 class PerplexityModel(AIModel):
     def __init__(self, api_key: str, llm_model: str):
         from langchain_community.chat_models import ChatPerplexity
@@ -132,6 +182,10 @@ class PerplexityModel(AIModel):
         response = self.model.invoke(prompt)
         return response
 
+    async def ainvoke(self, prompt: str) -> BaseMessage:
+        response = await self.model.ainvoke(prompt)
+        return response
+
 # gemini doesn't seem to work because API doesn't rstitute answers for questions that involve answers that are too short
 class GeminiModel(AIModel):
     def __init__(self, api_key: str, llm_model: str):
@@ -163,6 +217,10 @@ class GeminiModel(AIModel):
         response = self.model.invoke(prompt)
         return response
 
+    async def ainvoke(self, prompt: str) -> BaseMessage:
+        response = await self.model.ainvoke(prompt)
+        return response
+
 
 class HuggingFaceModel(AIModel):
     def __init__(self, api_key: str, llm_model: str):
@@ -180,10 +238,18 @@ class HuggingFaceModel(AIModel):
         )
         return response
 
+    async def ainvoke(self, prompt: str) -> BaseMessage:
+        response = await self.chatmodel.ainvoke(prompt)
+        logger.debug(
+            f"Invoking Model from Hugging Face API asynchronously. Response: {response}, Type: {type(response)}"
+        )
+        return response
+
 
 class AIAdapter:
     def __init__(self, config: dict, api_key: str):
         self.model = self._create_model(config, api_key)
+        self.rate_limiter = get_rate_limiter(cfg.LLM_MODEL_TYPE, cfg.LLM_MODEL)
 
     def _create_model(self, config: dict, api_key: str) -> AIModel:
         llm_model_type = cfg.LLM_MODEL_TYPE
@@ -209,7 +275,22 @@ class AIAdapter:
             raise ValueError(f"Unsupported model type: {llm_model_type}")
 
     def invoke(self, prompt: str) -> str:
-        return self.model.invoke(prompt)
+        if self.rate_limiter is None:
+            return self.model.invoke(prompt)
+        estimated_tokens = estimate_tokens(prompt)
+        self.rate_limiter.acquire(estimated_tokens)
+        response = self.model.invoke(prompt)
+        self.rate_limiter.record_usage(estimated_tokens, reported_total_tokens(response))
+        return response
+
+    async def ainvoke(self, prompt: str) -> str:
+        if self.rate_limiter is None:
+            return await self.model.ainvoke(prompt)
+        estimated_tokens = estimate_tokens(prompt)
+        await self.rate_limiter.aacquire(estimated_tokens)
+        response = await self.model.ainvoke(prompt)
+        self.rate_limiter.record_usage(estimated_tokens, reported_total_tokens(response))
+        return response
 
 
 class LLMLogger:
@@ -325,64 +406,65 @@ class LLMLogger:
 
 
 class LoggerChatModel:
-    def __init__(self, llm: Union[OpenAIModel, OllamaModel, ClaudeModel, GeminiModel]):
+    def __init__(self, llm: Union[OpenAIModel, OllamaModel, ClaudeModel, GeminiModel], use_cache: bool = True):
         self.llm = llm
+        self.use_cache = use_cache
+        # Chains built on this model by get_chain(), keyed by template name; they live and die with the model
+        self._chains: Dict[str, Runnable] = {}
         logger.debug(f"LoggerChatModel successfully initialized with LLM: {llm}")
 
-    def __call__(self, messages: List[Dict[str, str]]) -> str:
+    def __call__(self, messages: List[Dict[str, str]], config: Optional[RunnableConfig] = None) -> str:
         logger.debug(f"Entering __call__ method with messages: {messages}")
-        while True:
-            try:
-                logger.debug("Attempting to call the LLM with messages")
-
-                reply = self.llm.invoke(messages)
-                logger.debug(f"LLM response received: {reply}")
-
-                parsed_reply = self.parse_llmresult(reply)
-                logger.debug(f"Parsed LLM reply: {parsed_reply}")
-
-                LLMLogger.log_request(prompts=messages, parsed_reply=parsed_reply)
-                logger.debug("Request successfully logged")
-
-                return reply
-
-            except httpx.HTTPStatusError as e:
-                logger.error(f"HTTPStatusError encountered: {str(e)}")
-                if e.response.status_code == 429:
-                    retry_after = e.response.headers.get("retry-after")
-                    retry_after_ms = e.response.headers.get("retry-after-ms")
-
-                    if retry_after:
-                        wait_time = int(retry_after)
-                        logger.warning(
-                            f"Rate limit exceeded. Waiting for {wait_time} seconds before retrying (extracted from 'retry-after' header)..."
-                        )
-                        time.sleep(wait_time)
-                    elif retry_after_ms:
-                        wait_time = int(retry_after_ms) / 1000.0
-                        logger.warning(
-                            f"Rate limit exceeded. Waiting for {wait_time} seconds before retrying (extracted from 'retry-after-ms' header)..."
-                        )
-                        time.sleep(wait_time)
-                    else:
-                        wait_time = 30
-                        logger.warning(
-                            f"'retry-after' header not found. Waiting for {wait_time} seconds before retrying (default)..."
-                        )
-                        time.sleep(wait_time)
-                else:
-                    logger.error(
-                        f"HTTP error occurred with status code: {e.response.status_code}, waiting 30 seconds before retrying"
-                    )
-                    time.sleep(30)
-
-            except Exception as e:
-                logger.error(f"Unexpected error occurred: {str(e)}")
-                logger.info(
-                    "Waiting for 30 seconds before retrying due to an unexpected error."
-                )
-                time.sleep(30)
-                continue
+        cache = self._get_cache(config)
+        if cache is not None:
+            cached_reply = cache.get(self.llm, messages)
+            if cached_reply is not None:
+                logger.debug("LLM response served from cache")
+                return cached_reply
+
+        logger.debug("Attempting to call the LLM with messages")
+        reply = retry_call(self.llm.invoke, messages, description="LLM call")
+        return self._handle_reply(messages, reply, cache)
+
+    async def acall(self, messages: List[Dict[str, str]], config: Optional[RunnableConfig] = None) -> str:
+        """
+        Async counterpart of ``__call__``; backs off with ``asyncio.sleep`` so other requests keep running.
+        The SQLite cache and the request log are read and written in a worker thread, off the event loop.
+        """
+        logger.debug(f"Entering acall method with messages: {messages}")
+        cache = self._get_cache(config)
+        if cache is not None:
+            cached_reply = await asyncio.to_thread(cache.get, self.llm, messages)
+            if cached_reply is not None:
+                logger.debug("LLM response served from cache")
+                return cached_reply
+
+        logger.debug("Attempting to call the LLM asynchronously with messages")
+        reply = await aretry_call(self.llm.ainvoke, messages, description="Async LLM call")
+        return await asyncio.to_thread(self._handle_reply, messages, reply, cache)
+
+    def as_runnable(self) -> RunnableLambda:
+        """Wrap the model so chains use ``acall`` when invoked with ``ainvoke``."""
+        return RunnableLambda(self, afunc=self.acall)
+
+    def _get_cache(self, config: Optional[RunnableConfig]):
+        if not self.use_cache or is_cache_bypassed(config):
+            return None
+        return get_llm_cache()
+
+    def _handle_reply(self, messages, reply: BaseMessage, cache) -> BaseMessage:
+        logger.debug(f"LLM response received: {reply}")
+
+        parsed_reply = self.parse_llmresult(reply)
+        logger.debug(f"Parsed LLM reply: {parsed_reply}")
+
+        LLMLogger.log_request(prompts=messages, parsed_reply=parsed_reply)
+        logger.debug("Request successfully logged")
+
+        if cache is not None:
+            cache.put(self.llm, messages, reply)
+
+        return reply
 
     def parse_llmresult(self, llmresult: AIMessage) -> Dict[str, Dict]:
         logger.debug(f"Parsing LLM result: {llmresult}")
@@ -458,10 +540,68 @@ class LoggerChatModel:
             raise
 
 
+# Compiled prompts are shared process-wide; chains are cached per LoggerChatModel because
+# each one is bound to that model's adapter. Both are built on first use.
+SECTION_TEMPLATES = {
+    PERSONAL_INFORMATION: "personal_information_template",
+    SELF_IDENTIFICATION: "self_identification_template",
+    LEGAL_AUTHORIZATION: "legal_authorization_template",
+    WORK_PREFERENCES: "work_preferences_template",
+    EDUCATION_DETAILS: "education_details_template",
+    EXPERIENCE_DETAILS: "experience_details_template",
+    PROJECTS: "projects_template",
+    AVAILABILITY: "availability_template",
+    SALARY_EXPECTATIONS: "salary_expectations_template",
+    CERTIFICATIONS: "certifications_template",
+    LANGUAGES: "languages_template",
+    INTERESTS: "interests_template",
+    COVER_LETTER: "coverletter_template",
+}
+
+_prompt_registry: Dict[str, ChatPromptTemplate] = {}
+_registry_lock = threading.RLock()
+
+
+def get_prompt_template(template_name: str, template: Optional[str] = None) -> ChatPromptTemplate:
+    """
+    Return the compiled prompt for ``template_name``, parsing it only on first use.
+    The template text defaults to the attribute of the same name in the prompts module.
+    """
+    with _registry_lock:
+        if template_name not in _prompt_registry:
+            if template is None:
+                template = getattr(prompts, template_name)
+            logger.debug(f"Compiling prompt template: {template_name}")
+            _prompt_registry[template_name] = ChatPromptTemplate.from_template(
+                textwrap.dedent(template)
+            )
+        return _prompt_registry[template_name]
+
+
+def get_chain(llm: LoggerChatModel, template_name: str, template: Optional[str] = None) -> Runnable:
+    """
+    Return the ``prompt | llm | StrOutputParser()`` chain for a template, building it once per model.
+    Chains are stored on the model itself: they reference it, so a module-level registry would keep it alive.
+    """
+    with _registry_lock:
+        chains = llm._chains
+        if template_name not in chains:
+            logger.debug(f"Creating chain for template: {template_name}")
+            chains[template_name] = (
+                get_prompt_template(template_name, template)
+                | llm.as_runnable()
+                | StrOutputParser()
+            )
+        return chains[template_name]
+
+
 class GPTAnswerer:
     def __init__(self, config, llm_api_key):
         self.ai_adapter = AIAdapter(config, llm_api_key)
         self.llm_cheap = LoggerChatModel(self.ai_adapter)
+        self.section_router = get_section_router()
+        self.answer_memory = get_answer_memory()
+        self._answer_fingerprint = None
 
     @property
     def job_description(self):
@@ -499,67 +639,61 @@ class GPTAnswerer:
             self.summarize_job_description(self.job.description)
         )
 
+    async def aset_job(self, job: Job):
+        logger.debug(f"Setting job asynchronously: {job}")
+        self.job = job
+        self.job.set_summarize_job_description(
+            await self.asummarize_job_description(self.job.description)
+        )
+
     def set_job_application_profile(self, job_application_profile):
         logger.debug(f"Setting job application profile: {job_application_profile}")
         self.job_application_profile = job_application_profile
 
+    def _current_answer_fingerprint(self) -> str:
+        fingerprint = profile_fingerprint(self.resume, getattr(self, "job_application_profile", None))
+        if fingerprint != self._answer_fingerprint:
+            # Answers derived from an older resume/profile must not be reused
+            self.answer_memory.invalidate_except(fingerprint)
+            self._answer_fingerprint = fingerprint
+        return fingerprint
+
+    def _recall_answer(self, kind: str, question: str, options: Optional[list[str]] = None) -> Optional[str]:
+        if self.answer_memory is None:
+            return None
+        return self.answer_memory.recall(kind, question, self._current_answer_fingerprint(), options)
+
+    def _remember_answer(self, kind: str, question: str, answer, options: Optional[list[str]] = None) -> None:
+        if self.answer_memory is not None:
+            self.answer_memory.remember(kind, question, answer, self._current_answer_fingerprint(), options)
+
     def _clean_llm_output(self, output: str) -> str:
         return output.replace("*", "").replace("#", "").strip()
-    
+
     def summarize_job_description(self, text: str) -> str:
         logger.debug(f"Summarizing job description: {text}")
-        prompts.summarize_prompt_template = self._preprocess_template_string(
-            prompts.summarize_prompt_template
+        chain = self._create_chain("summarize_prompt_template")
+        raw_output = summarize_with_cache(
+            text, prompts.summarize_prompt_template, lambda: chain.invoke({TEXT: text})
         )
-        prompt = ChatPromptTemplate.from_template(prompts.summarize_prompt_template)
-        chain = prompt | self.llm_cheap | StrOutputParser()
-        raw_output = chain.invoke({TEXT: text})
         output = self._clean_llm_output(raw_output)
         logger.debug(f"Summary generated: {output}")
         return output
 
-    def _create_chain(self, template: str):
-        logger.debug(f"Creating chain with template: {template}")
-        prompt = ChatPromptTemplate.from_template(template)
-        return prompt | self.llm_cheap | StrOutputParser()
+    async def asummarize_job_description(self, text: str) -> str:
+        logger.debug(f"Summarizing job description asynchronously: {text}")
+        chain = self._create_chain("summarize_prompt_template")
+        raw_output = await asummarize_with_cache(
+            text, prompts.summarize_prompt_template, lambda: chain.ainvoke({TEXT: text})
+        )
+        output = self._clean_llm_output(raw_output)
+        logger.debug(f"Summary generated: {output}")
+        return output
 
-    def answer_question_textual_wide_range(self, question: str) -> str:
-        logger.debug(f"Answering textual question: {question}")
-        chains = {
-            PERSONAL_INFORMATION: self._create_chain(
-                prompts.personal_information_template
-            ),
-            SELF_IDENTIFICATION: self._create_chain(
-                prompts.self_identification_template
-            ),
-            LEGAL_AUTHORIZATION: self._create_chain(
-                prompts.legal_authorization_template
-            ),
-            WORK_PREFERENCES: self._create_chain(
-                prompts.work_preferences_template
-            ),
-            EDUCATION_DETAILS: self._create_chain(
-                prompts.education_details_template
-            ),
-            EXPERIENCE_DETAILS: self._create_chain(
-                prompts.experience_details_template
-            ),
-            PROJECTS: self._create_chain(prompts.projects_template),
-            AVAILABILITY: self._create_chain(prompts.availability_template),
-            SALARY_EXPECTATIONS: self._create_chain(
-                prompts.salary_expectations_template
-            ),
-            CERTIFICATIONS: self._create_chain(
-                prompts.certifications_template
-            ),
-            LANGUAGES: self._create_chain(prompts.languages_template),
-            INTERESTS: self._create_chain(prompts.interests_template),
-            COVER_LETTER: self._create_chain(prompts.coverletter_template),
-        }
+    def _create_chain(self, template_name: str, template: Optional[str] = None):
+        return get_chain(self.llm_cheap, template_name, template)
 
-        prompt = ChatPromptTemplate.from_template(prompts.determine_section_template)
-        chain = prompt | self.llm_cheap | StrOutputParser()
-        raw_output = chain.invoke({QUESTION: question})
+    def _extract_section_name(self, raw_output: str) -> str:
         output = self._clean_llm_output(raw_output)
 
         match = re.search(
@@ -572,20 +706,15 @@ class GPTAnswerer:
         if not match:
             raise ValueError("Could not extract section name from the response.")
 
-        section_name = match.group(1).lower().replace(" ", "_")
+        return match.group(1).lower().replace(" ", "_")
 
+    def _section_chain_and_inputs(self, section_name: str, question: str):
         if section_name == "cover_letter":
-            chain = chains.get(section_name)
-            raw_output = chain.invoke(
-                {
-                    RESUME: self.resume,
-                    JOB_DESCRIPTION: self.job_description,
-                    COMPANY: self.job.company,
-                }
-            )
-            output = self._clean_llm_output(raw_output)
-            logger.debug(f"Cover letter generated: {output}")
-            return output
+            return self._create_chain(SECTION_TEMPLATES[section_name]), {
+                RESUME: self.resume,
+                JOB_DESCRIPTION: self.job_description,
+                COMPANY: self.job.company,
+            }
         resume_section = getattr(self.resume, section_name, None) or getattr(
             self.job_application_profile, section_name, None
         )
@@ -596,34 +725,73 @@ class GPTAnswerer:
             raise ValueError(
                 f"Section '{section_name}' not found in either resume or job_application_profile."
             )
-        chain = chains.get(section_name)
-        if chain is None:
+        template_name = SECTION_TEMPLATES.get(section_name)
+        if template_name is None:
             logger.error(f"Chain not defined for section '{section_name}'")
             raise ValueError(f"Chain not defined for section '{section_name}'")
-        raw_output = chain.invoke(
-            {RESUME_SECTION: resume_section, QUESTION: question}
-        )
-        output = self._clean_llm_output(raw_output)
+        return self._create_chain(template_name), {RESUME_SECTION: resume_section, QUESTION: question}
+
+    def determine_section(self, question: str) -> str:
+        """Route the question to a resume section locally, asking the LLM only when unsure."""
+        section_name = self.section_router.route(question) if self.section_router else None
+        if section_name is None:
+            section_chain = self._create_chain("determine_section_template")
+            section_name = self._extract_section_name(
+                section_chain.invoke({QUESTION: question})
+            )
+            if self.section_router:
+                self.section_router.learn(question, section_name)
+        return section_name
+
+    async def adetermine_section(self, question: str) -> str:
+        section_name = self.section_router.route(question) if self.section_router else None
+        if section_name is None:
+            section_chain = self._create_chain("determine_section_template")
+            section_name = self._extract_section_name(
+                await section_chain.ainvoke({QUESTION: question})
+            )
+            if self.section_router:
+                self.section_router.learn(question, section_name)
+        return section_name
+
+    def answer_question_textual_wide_range(self, question: str) -> str:
+        logger.debug(f"Answering textual question: {question}")
+        remembered = self._recall_answer(TEXTUAL_ANSWER, question)
+        if remembered is not None:
+            return remembered
+        section_name = self.determine_section(question)
+
+        chain, inputs = self._section_chain_and_inputs(section_name, question)
+        output = self._clean_llm_output(chain.invoke(inputs))
         logger.debug(f"Question answered: {output}")
+        if section_name != COVER_LETTER:
+            self._remember_answer(TEXTUAL_ANSWER, question, output)
         return output
 
-    def answer_question_numeric(
-        self, question: str, default_experience: str = 3
-    ) -> str:
-        logger.debug(f"Answering numeric question: {question}")
-        func_template = self._preprocess_template_string(
-            prompts.numeric_question_template
-        )
-        prompt = ChatPromptTemplate.from_template(func_template)
-        chain = prompt | self.llm_cheap | StrOutputParser()
-        raw_output_str = chain.invoke(
-            {
-                RESUME_EDUCATIONS: self.resume.education_details,
-                RESUME_JOBS: self.resume.experience_details,
-                RESUME_PROJECTS: self.resume.projects,
-                QUESTION: question,
-            }
-        )
+    async def aanswer_question_textual_wide_range(self, question: str) -> str:
+        logger.debug(f"Answering textual question asynchronously: {question}")
+        remembered = self._recall_answer(TEXTUAL_ANSWER, question)
+        if remembered is not None:
+            return remembered
+        section_name = await self.adetermine_section(question)
+
+        chain, inputs = self._section_chain_and_inputs(section_name, question)
+        output = self._clean_llm_output(await chain.ainvoke(inputs))
+        logger.debug(f"Question answered: {output}")
+        if section_name != COVER_LETTER:
+            self._remember_answer(TEXTUAL_ANSWER, question, output)
+        return output
+
+    def _numeric_inputs(self, question: str) -> dict:
+        return {
+            RESUME_EDUCATIONS: self.resume.education_details,
+            RESUME_JOBS: self.resume.experience_details,
+            RESUME_PROJECTS: self.resume.projects,
+            QUESTION: question,
+        }
+
+    def _parse_numeric_output(self, raw_output_str: str, default_experience):
+        """Return the number in the LLM output and whether it came from the LLM (False: the default was used)."""
         output_str = self._clean_llm_output(raw_output_str)
         logger.debug(f"Raw output for numeric question: {output_str}")
         try:
@@ -633,7 +801,37 @@ class GPTAnswerer:
             logger.warning(
                 f"Failed to extract number, using default experience: {default_experience}"
             )
-            output = default_experience
+            return default_experience, False
+        return output, True
+
+    def answer_question_numeric(
+        self, question: str, default_experience: str = 3
+    ) -> str:
+        logger.debug(f"Answering numeric question: {question}")
+        remembered = self._recall_answer(NUMERIC_ANSWER, question)
+        if remembered is not None:
+            return remembered
+        chain = self._create_chain("numeric_question_template")
+        raw_output_str = chain.invoke(self._numeric_inputs(question))
+        output, parsed = self._parse_numeric_output(raw_output_str, default_experience)
+        # The default is a one-off guess, only numbers the LLM gave are remembered
+        if parsed:
+            self._remember_answer(NUMERIC_ANSWER, question, output)
+        return output
+
+    async def aanswer_question_numeric(
+        self, question: str, default_experience: str = 3
+    ) -> str:
+        logger.debug(f"Answering numeric question asynchronously: {question}")
+        remembered = self._recall_answer(NUMERIC_ANSWER, question)
+        if remembered is not None:
+            return remembered
+        chain = self._create_chain("numeric_question_template")
+        raw_output_str = await chain.ainvoke(self._numeric_inputs(question))
+        output, parsed = self._parse_numeric_output(raw_output_str, default_experience)
+        # The default is a one-off guess, only numbers the LLM gave are remembered
+        if parsed:
+            self._remember_answer(NUMERIC_ANSWER, question, output)
         return output
 
     def extract_number_from_string(self, output_str):
@@ -646,34 +844,44 @@ class GPTAnswerer:
             logger.error("No numbers found in the string")
             raise ValueError("No numbers found in the string")
 
-    def answer_question_from_options(self, question: str, options: list[str]) -> str:
-        logger.debug(f"Answering question from options: {question}")
-        func_template = self._preprocess_template_string(prompts.options_template)
-        prompt = ChatPromptTemplate.from_template(func_template)
-        chain = prompt | self.llm_cheap | StrOutputParser()
-        raw_output_str = chain.invoke(
-            {
-                RESUME: self.resume,
-                JOB_APPLICATION_PROFILE: self.job_application_profile,
-                QUESTION: question,
-                OPTIONS: options,
-            }
-        )
+    def _options_inputs(self, question: str, options: list[str]) -> dict:
+        return {
+            RESUME: self.resume,
+            JOB_APPLICATION_PROFILE: self.job_application_profile,
+            QUESTION: question,
+            OPTIONS: options,
+        }
+
+    def _parse_options_output(self, raw_output_str: str, options: list[str]) -> str:
         output_str = self._clean_llm_output(raw_output_str)
         logger.debug(f"Raw output for options question: {output_str}")
         best_option = self.find_best_match(output_str, options)
         logger.debug(f"Best option determined: {best_option}")
         return best_option
 
-    def determine_resume_or_cover(self, phrase: str) -> str:
-        logger.debug(
-            f"Determining if phrase refers to resume or cover letter: {phrase}"
-        )
-        prompt = ChatPromptTemplate.from_template(
-            prompts.resume_or_cover_letter_template
-        )
-        chain = prompt | self.llm_cheap | StrOutputParser()
-        raw_response = chain.invoke({PHRASE: phrase})
+    def answer_question_from_options(self, question: str, options: list[str]) -> str:
+        logger.debug(f"Answering question from options: {question}")
+        remembered = self._recall_answer(OPTIONS_ANSWER, question, options)
+        if remembered is not None:
+            return self.find_best_match(remembered, options)
+        chain = self._create_chain("options_template")
+        raw_output_str = chain.invoke(self._options_inputs(question, options))
+        best_option = self._parse_options_output(raw_output_str, options)
+        self._remember_answer(OPTIONS_ANSWER, question, best_option, options)
+        return best_option
+
+    async def aanswer_question_from_options(self, question: str, options: list[str]) -> str:
+        logger.debug(f"Answering question from options asynchronously: {question}")
+        remembered = self._recall_answer(OPTIONS_ANSWER, question, options)
+        if remembered is not None:
+            return self.find_best_match(remembered, options)
+        chain = self._create_chain("options_template")
+        raw_output_str = await chain.ainvoke(self._options_inputs(question, options))
+        best_option = self._parse_options_output(raw_output_str, options)
+        self._remember_answer(OPTIONS_ANSWER, question, best_option, options)
+        return best_option
+
+    def _parse_resume_or_cover(self, raw_response: str) -> str:
         response = self._clean_llm_output(raw_response)
         logger.debug(f"Response for resume_or_cover: {response}")
         if "resume" in response:
@@ -683,19 +891,27 @@ class GPTAnswerer:
         else:
             return "resume"
 
-    def is_job_suitable(self):
-        logger.info("Checking if job is suitable")
-        prompt = ChatPromptTemplate.from_template(prompts.is_relavant_position_template)
-        chain = prompt | self.llm_cheap | StrOutputParser()
-        raw_output = chain.invoke(
-            {
-                RESUME: self.resume,
-                JOB_DESCRIPTION: self.job_description,
-            }
+    def determine_resume_or_cover(self, phrase: str) -> str:
+        logger.debug(
+            f"Determining if phrase refers to resume or cover letter: {phrase}"
+        )
+        chain = self._create_chain("resume_or_cover_letter_template")
+        return self._parse_resume_or_cover(chain.invoke({PHRASE: phrase}))
+
+    async def adetermine_resume_or_cover(self, phrase: str) -> str:
+        logger.debug(
+            f"Determining asynchronously if phrase refers to resume or cover letter: {phrase}"
         )
+        chain = self._create_chain("resume_or_cover_letter_template")
+        return self._parse_resume_or_cover(await chain.ainvoke({PHRASE: phrase}))
+
+    def _parse_suitability(self, raw_output: str) -> bool:
         output = self._clean_llm_output(raw_output)
         logger.debug(f"Job suitability output: {output}")
+        return self._suitability_from_output(output)
 
+    @staticmethod
+    def _suitability_from_output(output: str) -> bool:
         try:
             score = re.search(r"Score:\s*(\d+)", output, re.IGNORECASE).group(1)
             reasoning = re.search(r"Reasoning:\s*(.+)", output, re.IGNORECASE | re.DOTALL).group(1)
@@ -707,3 +923,95 @@ class GPTAnswerer:
         if int(score) < JOB_SUITABILITY_SCORE:
             logger.debug(f"Job is not suitable: {reasoning}")
         return int(score) >= JOB_SUITABILITY_SCORE
+
+    def is_job_suitable(self):
+        logger.info("Checking if job is suitable")
+        chain = self._create_chain("is_relavant_position_template")
+        raw_output = chain.invoke(
+            {
+                RESUME: self.resume,
+                JOB_DESCRIPTION: self.job_description,
+            }
+        )
+        return self._parse_suitability(raw_output)
+
+    async def ais_job_suitable(self):
+        logger.info("Checking asynchronously if job is suitable")
+        chain = self._create_chain("is_relavant_position_template")
+        raw_output = await chain.ainvoke(
+            {
+                RESUME: self.resume,
+                JOB_DESCRIPTION: self.job_description,
+            }
+        )
+        return self._parse_suitability(raw_output)
+
+    @staticmethod
+    def _format_job_batch(jobs: List[Job]) -> str:
+        return "\n\n".join(
+            f"Job {index}:\n{job.description}" for index, job in enumerate(jobs, start=1)
+        )
+
+    def _parse_batch_suitability(self, raw_output: str, job_count: int) -> List[bool]:
+        output = self._clean_llm_output(raw_output)
+        logger.debug(f"Batch job suitability output: {output}")
+
+        blocks = {}
+        parts = re.split(r"^\s*Job\s+(\d+)\s*:", output, flags=re.IGNORECASE | re.MULTILINE)
+        for number, block in zip(parts[1::2], parts[2::2]):
+            blocks[int(number)] = block
+
+        results = []
+        for index in range(1, job_count + 1):
+            if index not in blocks:
+                logger.warning(f"No score returned for job {index} of the batch. Proceeding with application, but job may or may not be suitable.")
+                results.append(True)
+                continue
+            results.append(self._suitability_from_output(blocks[index]))
+        return results
+
+    def _job_batches(self, jobs: List[Job], batch_size: Optional[int]) -> List[List[Job]]:
+        batch_size = batch_size or cfg.JOB_SUITABILITY_BATCH_SIZE
+        return [jobs[i:i + batch_size] for i in range(0, len(jobs), batch_size)]
+
+    def are_jobs_suitable(self, jobs: List[Job], batch_size: Optional[int] = None) -> List[bool]:
+        """
+        Score many jobs against the resume, sending the resume once per batch of jobs
+        instead of once per job. Returns one suitability flag per job, in order.
+        """
+        logger.info(f"Checking suitability of {len(jobs)} jobs in batches")
+        chain = self._create_chain(
+            "is_relevant_position_batch_template", is_relevant_position_batch_template
+        )
+        results = []
+        for batch in self._job_batches(jobs, batch_size):
+            raw_output = chain.invoke(
+                {
+                    RESUME: self.resume,
+                    JOB_DESCRIPTIONS: self._format_job_batch(batch),
+                }
+            )
+            results.extend(self._parse_batch_suitability(raw_output, len(batch)))
+        return results
+
+    async def aare_jobs_suitable(self, jobs: List[Job], batch_size: Optional[int] = None) -> List[bool]:
+        logger.info(f"Checking asynchronously suitability of {len(jobs)} jobs in batches")
+        chain = self._create_chain(
+            "is_relevant_position_batch_template", is_relevant_position_batch_template
+        )
+        batches = self._job_batches(jobs, batch_size)
+        raw_outputs = await asyncio.gather(
+            *(
+                chain.ainvoke(
+                    {
+                        RESUME: self.resume,
+                        JOB_DESCRIPTIONS: self._format_job_batch(batch),
+                    }
+                )
+                for batch in batches
+            )
+        )
+        results = []
+        for batch, raw_output in zip(batches, raw_outputs):
+            results.extend(self._parse_batch_suitability(raw_output, len(batch)))
+        return results
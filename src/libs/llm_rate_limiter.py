@@ -0,0 +1,166 @@
+"""
+Client-side requests-per-minute and tokens-per-minute limiting for LLM calls.
+
+Every caller of the same provider/model shares one pair of token buckets, so
+thread pools and batch runners can saturate the quota configured in
+``config.LLM_RATE_LIMITS`` without ever tripping the provider's HTTP 429.
+Capacity is reserved up front and the caller waits outside the lock, which
+keeps the buckets fair under contention. When ``LLM_RATE_LIMIT_STATE_DIR`` is
+set, bucket state lives in lock-protected files so that several processes
+share the same budget.
+"""
+import asyncio
+import json
+import math
+import re
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import config as cfg
+from src.libs.llm_cache import render_prompt
+from src.logging import logger
+
+try:
+    import fcntl
+except ImportError:  # Windows: limits are enforced per process only
+    fcntl = None
+
+# Rough English-text ratio used to estimate prompt size before the provider reports usage
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(messages: Any) -> int:
+    return max(1, math.ceil(len(render_prompt(messages)) / CHARS_PER_TOKEN))
+
+
+def reported_total_tokens(reply: Any) -> Optional[int]:
+    usage_metadata = getattr(reply, "usage_metadata", None) or {}
+    total_tokens = usage_metadata.get("total_tokens")
+    return total_tokens if isinstance(total_tokens, int) else None
+
+
+class TokenBucket:
+    """
+    Token bucket that hands out reservations: the amount is debited immediately,
+    possibly into a negative balance, and the caller is told how long to wait
+    until the bucket would have held it.
+    """
+
+    def __init__(self, capacity: float, per_second: float, state_path: Optional[Path] = None):
+        self.capacity = capacity
+        self.per_second = per_second
+        self.state_path = state_path if fcntl is not None else None
+        self._lock = threading.Lock()
+        self._tokens = capacity
+        self._updated = time.time()
+
+    @contextmanager
+    def _shared_state(self):
+        """Load and save the bucket state around a critical section."""
+        with self._lock:
+            if self.state_path is None:
+                yield
+                return
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.state_path, "a+", encoding="utf-8") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    raw = f.read()
+                    if raw:
+                        state = json.loads(raw)
+                        self._tokens, self._updated = state["tokens"], state["updated"]
+                    yield
+                    f.seek(0)
+                    f.truncate()
+                    json.dump({"tokens": self._tokens, "updated": self._updated}, f)
+                    f.flush()
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def reserve(self, amount: float) -> float:
+        """Debit ``amount`` (a negative amount refunds) and return the seconds to wait before using it."""
+        with self._shared_state():
+            now = time.time()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.per_second)
+            self._updated = now
+            self._tokens -= min(amount, self.capacity)
+            self._tokens = min(self._tokens, self.capacity)
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.per_second
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute limits for one provider/model."""
+
+    def __init__(self, name: str, rpm: Optional[int] = None, tpm: Optional[int] = None, state_dir: Optional[Path] = None):
+        self.name = name
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", name)
+        self.request_bucket = (
+            TokenBucket(rpm, rpm / 60.0, state_dir / f"{safe_name}.rpm.json" if state_dir else None)
+            if rpm else None
+        )
+        self.token_bucket = (
+            TokenBucket(tpm, tpm / 60.0, state_dir / f"{safe_name}.tpm.json" if state_dir else None)
+            if tpm else None
+        )
+
+    def _reserve(self, tokens: int) -> float:
+        wait_time = 0.0
+        if self.request_bucket is not None:
+            wait_time = max(wait_time, self.request_bucket.reserve(1))
+        if self.token_bucket is not None:
+            wait_time = max(wait_time, self.token_bucket.reserve(tokens))
+        if wait_time > 0:
+            logger.debug(f"Rate limiter {self.name}: waiting {wait_time:.2f}s for {tokens} tokens")
+        return wait_time
+
+    def acquire(self, tokens: int) -> None:
+        """Block the calling thread until one request of ``tokens`` tokens fits in the limits."""
+        wait_time = self._reserve(tokens)
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+    async def aacquire(self, tokens: int) -> None:
+        """Async counterpart of ``acquire`` that only suspends the current task."""
+        wait_time = self._reserve(tokens)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: Optional[int]) -> None:
+        """Correct the token bucket once the provider has reported the real usage."""
+        if self.token_bucket is None or actual_tokens is None:
+            return
+        self.token_bucket.reserve(actual_tokens - estimated_tokens)
+
+
+_rate_limiters: Dict[Tuple[str, str], Optional[RateLimiter]] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str, model: str) -> Optional[RateLimiter]:
+    """
+    Return the shared limiter for a provider/model as configured in ``config.LLM_RATE_LIMITS``,
+    falling back to the provider's ``'*'`` entry, or None when no limit is configured.
+    """
+    key = (provider, model)
+    with _rate_limiters_lock:
+        if key not in _rate_limiters:
+            provider_limits = cfg.LLM_RATE_LIMITS.get(provider, {})
+            limits = provider_limits.get(model) or provider_limits.get("*")
+            if not limits:
+                _rate_limiters[key] = None
+            else:
+                state_dir = Path(cfg.LLM_RATE_LIMIT_STATE_DIR) if cfg.LLM_RATE_LIMIT_STATE_DIR else None
+                _rate_limiters[key] = RateLimiter(
+                    f"{provider}-{model}",
+                    rpm=limits.get("rpm"),
+                    tpm=limits.get("tpm"),
+                    state_dir=state_dir,
+                )
+                logger.debug(f"Rate limiter for {provider}/{model} initialized with {limits}")
+        return _rate_limiters[key]
@@ -0,0 +1,169 @@
+"""
+Bounded retry/backoff shared by every LLM caller.
+
+Errors are classified as retryable (rate limits, overloads, 5xx, timeouts,
+dropped connections) or fatal (bad credentials, malformed requests,
+programming errors). Retryable errors are retried with exponential backoff
+and jitter, honouring the provider's ``retry-after``/``retry-after-ms``
+headers, until either the attempt limit or the total deadline is reached.
+The async variant waits with ``asyncio.sleep`` so other requests on the same
+event loop keep running while one of them backs off.
+"""
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Optional
+
+import config as cfg
+from src.logging import logger
+
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+
+# Exceptions raised by our own code rather than by the provider; retrying them cannot help
+FATAL_EXCEPTION_TYPES = (ValueError, TypeError, KeyError, AttributeError, NotImplementedError)
+
+
+class RetryError(Exception):
+    """Raised when a retryable error persists past the attempt limit or deadline."""
+
+    def __init__(self, message: str, last_error: Exception):
+        super().__init__(message)
+        self.last_error = last_error
+
+
+@dataclass
+class RetryPolicy:
+    max_attempts: int = 8
+    base_delay: float = 2.0
+    max_delay: float = 60.0
+    deadline: Optional[float] = 300.0
+    jitter: float = 0.5
+
+    @classmethod
+    def from_config(cls) -> "RetryPolicy":
+        return cls(
+            max_attempts=cfg.LLM_RETRY_MAX_ATTEMPTS,
+            base_delay=cfg.LLM_RETRY_BASE_DELAY_SECONDS,
+            max_delay=cfg.LLM_RETRY_MAX_DELAY_SECONDS,
+            deadline=cfg.LLM_RETRY_DEADLINE_SECONDS,
+        )
+
+
+def get_status_code(err: Exception) -> Optional[int]:
+    """Extract the HTTP status code from openai/anthropic, httpx or requests errors."""
+    status_code = getattr(err, "status_code", None)
+    if isinstance(status_code, int):
+        return status_code
+    response = getattr(err, "response", None)
+    status_code = getattr(response, "status_code", None)
+    return status_code if isinstance(status_code, int) else None
+
+
+def get_retry_after(err: Exception) -> Optional[float]:
+    """Return the server-requested wait in seconds from ``retry-after-ms`` or ``retry-after``."""
+    headers = getattr(getattr(err, "response", None), "headers", None)
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000.0
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                return max(0.0, retry_at.timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    return None
+
+
+def is_retryable(err: Exception) -> bool:
+    status_code = get_status_code(err)
+    if status_code is not None:
+        return status_code in RETRYABLE_STATUS_CODES
+    return not isinstance(err, FATAL_EXCEPTION_TYPES)
+
+
+class _RetryState:
+    def __init__(self, policy: RetryPolicy, description: str):
+        self.policy = policy
+        self.description = description
+        self.attempt = 0
+        self.started = time.monotonic()
+
+    def next_delay(self, err: Exception) -> float:
+        """Return how long to wait before the next attempt, or raise if ``err`` must not be retried."""
+        self.attempt += 1
+        if not is_retryable(err):
+            logger.error(f"{self.description} failed with a non-retryable error: {err}")
+            raise err
+
+        if self.attempt >= self.policy.max_attempts:
+            logger.critical(f"{self.description} failed after {self.attempt} attempts: {err}")
+            raise RetryError(f"{self.description} failed after {self.attempt} attempts", err) from err
+
+        retry_after = get_retry_after(err)
+        if retry_after is not None:
+            delay = retry_after + random.uniform(0, self.policy.jitter)
+        else:
+            delay = min(self.policy.max_delay, self.policy.base_delay * 2 ** (self.attempt - 1))
+            delay *= random.uniform(1 - self.policy.jitter, 1)
+
+        if self.policy.deadline is not None:
+            elapsed = time.monotonic() - self.started
+            if elapsed + delay > self.policy.deadline:
+                logger.critical(
+                    f"{self.description} exceeded its {self.policy.deadline}s retry budget: {err}"
+                )
+                raise RetryError(
+                    f"{self.description} exceeded its {self.policy.deadline}s retry budget", err
+                ) from err
+
+        logger.warning(
+            f"{self.description} failed ({err}). Retrying in {delay:.1f} seconds "
+            f"(attempt {self.attempt + 1}/{self.policy.max_attempts})"
+            + (" as requested by the retry-after header" if retry_after is not None else "")
+        )
+        return delay
+
+
+def retry_call(
+    fn: Callable[..., Any],
+    *args,
+    policy: Optional[RetryPolicy] = None,
+    description: str = "LLM call",
+    **kwargs,
+) -> Any:
+    """Call ``fn`` with retries; only the calling thread waits between attempts."""
+    state = _RetryState(policy or RetryPolicy.from_config(), description)
+    while True:
+        try:
+            return fn(*args, **kwargs)
+        except Exception as err:
+            time.sleep(state.next_delay(err))
+
+
+async def aretry_call(
+    fn: Callable[..., Awaitable[Any]],
+    *args,
+    policy: Optional[RetryPolicy] = None,
+    description: str = "LLM call",
+    **kwargs,
+) -> Any:
+    """Await ``fn`` with retries; the event loop keeps serving other tasks between attempts."""
+    state = _RetryState(policy or RetryPolicy.from_config(), description)
+    while True:
+        try:
+            return await fn(*args, **kwargs)
+        except Exception as err:
+            await asyncio.sleep(state.next_delay(err))
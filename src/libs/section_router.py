@@ -0,0 +1,254 @@
+"""
+Local router that maps an application-form question to a resume section.
+
+Questions are compared to seed phrases and to previously routed questions
+with TF-IDF cosine similarity (nearest neighbour per section). When the best
+section is not confident enough, ``route`` returns None and the caller falls
+back to the LLM; the LLM's answer is then learned so the same kind of
+question is routed locally next time.
+"""
+import json
+import math
+import re
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+import config as cfg
+from src.logging import logger
+from src.utils.constants import (
+    AVAILABILITY,
+    CERTIFICATIONS,
+    COVER_LETTER,
+    EDUCATION_DETAILS,
+    EXPERIENCE_DETAILS,
+    INTERESTS,
+    LANGUAGES,
+    LEGAL_AUTHORIZATION,
+    PERSONAL_INFORMATION,
+    PROJECTS,
+    SALARY_EXPECTATIONS,
+    SELF_IDENTIFICATION,
+    WORK_PREFERENCES,
+)
+
+SEED_EXAMPLES: Dict[str, List[str]] = {
+    PERSONAL_INFORMATION: [
+        "personal information", "what is your name", "first name", "last name", "email address",
+        "phone number", "mobile number", "home address", "city of residence", "zip code postal code",
+        "linkedin profile url", "github profile", "personal website", "date of birth", "country of residence",
+    ],
+    SELF_IDENTIFICATION: [
+        "self identification", "gender", "pronouns", "are you a veteran", "protected veteran status",
+        "do you have a disability", "ethnicity", "race", "sexual orientation", "hispanic or latino",
+    ],
+    LEGAL_AUTHORIZATION: [
+        "legal authorization", "are you legally authorized to work in this country",
+        "do you require visa sponsorship", "will you now or in the future require sponsorship",
+        "work permit", "work authorization", "citizenship status", "right to work", "green card holder",
+        "eu work authorization", "are you eligible to work",
+    ],
+    WORK_PREFERENCES: [
+        "work preferences", "are you open to remote work", "are you willing to relocate",
+        "willing to travel", "in person work", "hybrid work", "onsite", "background check",
+        "drug test", "willing to work shifts", "open to relocation",
+    ],
+    EDUCATION_DETAILS: [
+        "education details", "highest level of education", "degree", "university", "college",
+        "gpa", "bachelor's degree", "master's degree", "field of study", "graduation year",
+        "what did you study",
+    ],
+    EXPERIENCE_DETAILS: [
+        "experience details", "describe your experience", "previous role", "responsibilities in your last job",
+        "current employer", "current job title", "tell us about your work experience",
+        "what technologies have you worked with", "achievements at work", "leadership experience",
+    ],
+    PROJECTS: [
+        "projects", "describe a project you worked on", "side project", "portfolio", "open source contributions",
+        "project you are most proud of", "something you built",
+    ],
+    AVAILABILITY: [
+        "availability", "when can you start", "earliest start date", "notice period",
+        "available to start", "how soon can you join",
+    ],
+    SALARY_EXPECTATIONS: [
+        "salary expectations", "expected salary", "desired compensation", "current salary",
+        "hourly rate", "pay range", "compensation expectations",
+    ],
+    CERTIFICATIONS: [
+        "certifications", "are you certified", "professional license", "certificate",
+        "aws certification", "list your certifications",
+    ],
+    LANGUAGES: [
+        "languages", "which languages do you speak", "english proficiency", "are you fluent in",
+        "language level", "native speaker",
+    ],
+    INTERESTS: [
+        "interests", "hobbies", "what do you do in your free time", "what are you passionate about",
+        "personal interests",
+    ],
+    COVER_LETTER: [
+        "cover letter", "why do you want to work here", "why are you interested in this position",
+        "motivation letter", "why should we hire you", "tell us why you are a good fit for this role",
+    ],
+}
+
+# Function words and filler common to questions of every section; left in, one of them shared with a
+# seed (e.g. "did" in "what did you study") is enough to route a question confidently to the wrong section
+STOPWORDS = {
+    "a", "about", "after", "all", "an", "and", "any", "are", "as", "at", "be", "been", "before", "being",
+    "by", "can", "could", "currently", "did", "do", "does", "done", "for", "from", "get", "got", "had",
+    "has", "have", "having", "how", "i", "if", "in", "into", "is", "it", "its", "just", "least", "many",
+    "may", "me", "might", "more", "most", "much", "must", "my", "no", "not", "of", "on", "or", "our",
+    "out", "over", "please", "provide", "should", "so", "some", "such", "than", "that", "the", "their",
+    "them", "there", "these", "they", "this", "those", "to", "under", "up", "us", "very", "was", "we",
+    "were", "what", "which", "who", "why", "will", "with", "would", "yes", "you", "your", "yourself",
+    "year", "years", "age", "old", "here", "anyone", "anything", "else", "ever", "like", "also",
+}
+
+# A question sharing a single word with an example (and having more than one) only matches it with at
+# least this similarity: one rare word in common, as "license" in "driver license" and "professional
+# license", is not enough evidence on its own
+MIN_SHARED_WORDS = 2
+SINGLE_WORD_THRESHOLD = 0.6
+
+SUFFIXES = ("ship", "ing", "ly", "ed", "es", "s")
+
+MAX_LEARNED_EXAMPLES_PER_SECTION = 200
+
+
+def stem(word: str) -> str:
+    """Strip one common English suffix so that e.g. 'remotely' and 'remote' share a token."""
+    for suffix in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 4:
+            return word[: -len(suffix)]
+    return word
+
+
+def words_of(text: str) -> List[str]:
+    """Lowercased, stemmed words without stopwords."""
+    return [stem(w) for w in re.findall(r"[a-z0-9']+", text.lower()) if w not in STOPWORDS]
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased, stemmed word unigrams and bigrams without stopwords."""
+    words = words_of(text)
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+class SectionRouter:
+    def __init__(self, memory_path: Optional[Path] = None, threshold: float = 0.4, margin: float = 0.05):
+        self.memory_path = Path(memory_path) if memory_path else None
+        self.threshold = threshold
+        self.margin = margin
+        self._lock = threading.Lock()
+        self._learned: Dict[str, List[str]] = self._load_learned()
+        self._index: Optional[List[Tuple[str, Dict[str, float], float, FrozenSet[str]]]] = None
+        self._idf: Dict[str, float] = {}
+
+    def _load_learned(self) -> Dict[str, List[str]]:
+        if self.memory_path is None or not self.memory_path.exists():
+            return {}
+        try:
+            with open(self.memory_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable section router memory {self.memory_path}: {e}")
+            return {}
+
+    def _save_learned(self) -> None:
+        if self.memory_path is None:
+            return
+        self.memory_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.memory_path, "w", encoding="utf-8") as f:
+            json.dump(self._learned, f, ensure_ascii=False, indent=2)
+
+    def _examples(self) -> List[Tuple[str, str]]:
+        examples = [(section, text) for section, texts in SEED_EXAMPLES.items() for text in texts]
+        examples += [(section, text) for section, texts in self._learned.items() for text in texts]
+        return examples
+
+    @staticmethod
+    def _vectorize(tokens: List[str], idf: Dict[str, float]) -> Tuple[Dict[str, float], float]:
+        counts = Counter(tokens)
+        vector = {t: c * idf.get(t, 0.0) for t, c in counts.items()}
+        norm = math.sqrt(sum(v * v for v in vector.values()))
+        return vector, norm
+
+    def _build_index(self) -> List[Tuple[str, Dict[str, float], float, FrozenSet[str]]]:
+        examples = self._examples()
+        tokenized = [(section, tokenize(text), frozenset(words_of(text))) for section, text in examples]
+        document_frequency = Counter(t for _, tokens, _ in tokenized for t in set(tokens))
+        total = len(tokenized)
+        self._idf = {t: math.log((1 + total) / (1 + df)) + 1 for t, df in document_frequency.items()}
+        return [(section, *self._vectorize(tokens, self._idf), words) for section, tokens, words in tokenized]
+
+    def scores(self, question: str) -> Dict[str, float]:
+        """
+        Return the best cosine similarity between the question and each section's examples. An example sharing
+        fewer than MIN_SHARED_WORDS words with the question (all of its words when it has fewer) only counts
+        from SINGLE_WORD_THRESHOLD up.
+        """
+        with self._lock:
+            if self._index is None:
+                self._index = self._build_index()
+            index, idf = self._index, self._idf
+        query, query_norm = self._vectorize(tokenize(question), idf)
+        best: Dict[str, float] = {}
+        if query_norm == 0:
+            return best
+        question_words = set(words_of(question))
+        min_shared = min(MIN_SHARED_WORDS, len(question_words))
+        for section, vector, norm, words in index:
+            if norm == 0:
+                continue
+            similarity = sum(w * vector.get(t, 0.0) for t, w in query.items()) / (query_norm * norm)
+            if len(question_words & words) < min_shared and similarity < SINGLE_WORD_THRESHOLD:
+                continue
+            if similarity > best.get(section, 0.0):
+                best[section] = similarity
+        return best
+
+    def route(self, question: str) -> Optional[str]:
+        """Return the section for the question, or None when the caller should ask the LLM."""
+        ranked = sorted(self.scores(question).items(), key=lambda item: item[1], reverse=True)
+        if not ranked:
+            return None
+        section, confidence = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+        if confidence < self.threshold or confidence - runner_up < self.margin:
+            logger.debug(f"Section router not confident for '{question}': {section} ({confidence:.2f})")
+            return None
+        logger.debug(f"Section router routed '{question}' to {section} ({confidence:.2f})")
+        return section
+
+    def learn(self, question: str, section: str) -> None:
+        """Remember a question routed by the LLM so similar questions are routed locally."""
+        with self._lock:
+            examples = self._learned.setdefault(section, [])
+            if question in examples:
+                return
+            examples.append(question)
+            del examples[:-MAX_LEARNED_EXAMPLES_PER_SECTION]
+            self._index = None
+            self._save_learned()
+
+
+_section_router: Optional[SectionRouter] = None
+_section_router_lock = threading.Lock()
+
+
+def get_section_router() -> Optional[SectionRouter]:
+    """Return the process-wide router, or None when local routing is disabled in config.py."""
+    global _section_router
+    if not cfg.SECTION_ROUTER_ENABLED:
+        return None
+    if _section_router is None:
+        with _section_router_lock:
+            if _section_router is None:
+                _section_router = SectionRouter(
+                    Path(cfg.SECTION_ROUTER_MEMORY_PATH) if cfg.SECTION_ROUTER_MEMORY_PATH else None,
+                    threshold=cfg.SECTION_ROUTER_CONFIDENCE_THRESHOLD,
+                )
+    return _section_router
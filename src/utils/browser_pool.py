@@ -0,0 +1,169 @@
+"""
+Pool of warm Chrome instances shared by PDF rendering and job page fetching.
+
+Starting Chrome costs seconds, so instead of one ``init_browser()`` and one
+``quit()`` per document, callers check a driver out of the pool and hand it
+back when done. Drivers are health-checked on checkout, reset on return and
+recycled after a fixed number of uses to keep memory growth in check.
+"""
+import atexit
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+from selenium import webdriver
+
+import config as cfg
+from src.logging import logger
+from src.utils.chrome_utils import init_browser
+
+
+class BrowserPool:
+    def __init__(
+        self,
+        size: int = 2,
+        max_uses: Optional[int] = 20,
+        factory: Optional[Callable[[], webdriver.Chrome]] = None,
+    ):
+        self.size = size
+        self.max_uses = max_uses
+        self.factory = factory or (lambda: init_browser(headless=True))
+        self._condition = threading.Condition()
+        self._idle: List[webdriver.Chrome] = []
+        self._uses: Dict[int, int] = {}
+        self._created = 0
+        self._closed = False
+
+    def warm_up(self, count: Optional[int] = None) -> None:
+        """Start browsers up to ``count`` (default: the pool size) so the first checkouts do not wait."""
+        count = min(count or self.size, self.size)
+        threads = []
+        for _ in range(count - self._created):
+            thread = threading.Thread(target=self._add_idle_browser, daemon=True)
+            thread.start()
+            threads.append(thread)
+        for thread in threads:
+            thread.join()
+
+    def _add_idle_browser(self) -> None:
+        with self._condition:
+            if self._created >= self.size:
+                return
+            self._created += 1
+        try:
+            driver = self._start()
+        except Exception:
+            with self._condition:
+                self._created -= 1
+            raise
+        with self._condition:
+            self._idle.append(driver)
+            self._condition.notify()
+
+    def _start(self) -> webdriver.Chrome:
+        driver = self.factory()
+        self._uses[id(driver)] = 0
+        logger.debug("Browser pool started a Chrome instance")
+        return driver
+
+    def _discard(self, driver: webdriver.Chrome) -> None:
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"Error while quitting a pooled browser: {e}")
+
+    @staticmethod
+    def _is_healthy(driver: webdriver.Chrome) -> bool:
+        try:
+            return driver.execute_script("return 1") == 1
+        except Exception as e:
+            logger.warning(f"Pooled browser failed its health check: {e}")
+            return False
+
+    def checkout(self, timeout: Optional[float] = None) -> webdriver.Chrome:
+        """Return a healthy browser, starting one if the pool is not full, else waiting for a release."""
+        while True:
+            with self._condition:
+                if self._closed:
+                    raise RuntimeError("Browser pool is closed")
+                if not self._idle and self._created >= self.size:
+                    if not self._condition.wait_for(
+                        lambda: self._idle or self._created < self.size or self._closed, timeout
+                    ):
+                        raise TimeoutError(f"No browser became available within {timeout}s")
+                    continue
+                driver = self._idle.pop() if self._idle else None
+                if driver is None:
+                    self._created += 1
+            if driver is None:
+                try:
+                    driver = self._start()
+                except Exception:
+                    with self._condition:
+                        self._created -= 1
+                        self._condition.notify()
+                    raise
+            elif not self._is_healthy(driver):
+                self._discard(driver)
+                with self._condition:
+                    self._created -= 1
+                continue
+            self._uses[id(driver)] += 1
+            return driver
+
+    def release(self, driver: webdriver.Chrome) -> None:
+        """Hand a browser back; it is quit instead when it reached ``max_uses`` or the pool is closed."""
+        recycle = self._closed or (self.max_uses is not None and self._uses.get(id(driver), 0) >= self.max_uses)
+        if not recycle:
+            try:
+                driver.get("about:blank")
+            except Exception as e:
+                logger.warning(f"Could not reset pooled browser, recycling it: {e}")
+                recycle = True
+        if recycle:
+            self._discard(driver)
+        with self._condition:
+            if recycle:
+                self._created -= 1
+            else:
+                self._idle.append(driver)
+            self._condition.notify()
+
+    @contextmanager
+    def browser(self, timeout: Optional[float] = None):
+        """``with pool.browser() as driver:`` checks a browser out and always hands it back."""
+        driver = self.checkout(timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self) -> None:
+        """Quit every idle browser; browsers still checked out are quit when released."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._created -= len(idle)
+            self._condition.notify_all()
+        for driver in idle:
+            self._discard(driver)
+
+
+_browser_pool: Optional[BrowserPool] = None
+_browser_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Return the process-wide browser pool configured in config.py, closed automatically at exit."""
+    global _browser_pool
+    if _browser_pool is None:
+        with _browser_pool_lock:
+            if _browser_pool is None:
+                _browser_pool = BrowserPool(
+                    size=cfg.BROWSER_POOL_SIZE,
+                    max_uses=cfg.BROWSER_POOL_MAX_USES,
+                    factory=lambda: init_browser(headless=cfg.BROWSER_POOL_HEADLESS),
+                )
+                atexit.register(_browser_pool.close)
+    return _browser_pool
@@ -1,15 +1,48 @@
+import base64
 import os
 import time
+from functools import lru_cache
+from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager  # Import webdriver_manager
-import urllib
+import config as cfg
 from src.logging import logger
 
-def chrome_browser_options():
+# Resolves once web fonts are loaded and no new resource (image, font, stylesheet) finished for `quiet` ms.
+# This stands in for "network idle" with the Resource Timing API, which runs in any driver without CDP
+# Network.* event listeners. Its limit: a request shows up there only once it has finished, so one still
+# in flight after a quiet period (a slow image, a late fetch) is not waited for.
+WAIT_FOR_RESOURCES_SCRIPT = """
+const quiet = arguments[0];
+const done = arguments[arguments.length - 1];
+const fontsReady = document.fonts ? document.fonts.ready : Promise.resolve();
+fontsReady.then(() => {
+    let lastCount = performance.getEntriesByType("resource").length;
+    let stableSince = performance.now();
+    (function check() {
+        const count = performance.getEntriesByType("resource").length;
+        if (count !== lastCount) {
+            lastCount = count;
+            stableSince = performance.now();
+        }
+        const imagesLoaded = Array.from(document.images).every((img) => img.complete);
+        if (imagesLoaded && performance.now() - stableSince >= quiet) {
+            done(true);
+        } else {
+            setTimeout(check, 25);
+        }
+    })();
+});
+"""
+
+def chrome_browser_options(headless: bool = False):
     logger.debug("Setting Chrome browser options")
     options = Options()
+    if headless:
+        options.add_argument("--headless=new")
     options.add_argument("--start-maximized")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
@@ -35,11 +68,18 @@ def chrome_browser_options():
     
     return options
 
-def init_browser() -> webdriver.Chrome:
+@lru_cache(maxsize=None)
+def chromedriver_path() -> str:
+    """Resolve (and download if needed) the ChromeDriver binary once per process."""
+    path = ChromeDriverManager().install()
+    logger.debug(f"ChromeDriver available at {path}")
+    return path
+
+def init_browser(headless: bool = False) -> webdriver.Chrome:
     try:
-        options = chrome_browser_options()
+        options = chrome_browser_options(headless)
         # Use webdriver_manager to handle ChromeDriver
-        driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=options)
+        driver = webdriver.Chrome(service=ChromeService(chromedriver_path()), options=options)
         logger.debug("Chrome browser initialized successfully.")
         return driver
     except Exception as e:
@@ -48,6 +88,70 @@ def init_browser() -> webdriver.Chrome:
 
 
 
+def wait_for_page_ready(driver, max_wait: float = None, quiet_period_ms: int = None) -> bool:
+    """
+    Wait until the loaded page is ready to print: document.readyState is complete, document.fonts.ready
+    has resolved and resource loading went quiet. Returns False if ``max_wait`` seconds passed first.
+
+    "Quiet" means no resource finished loading for ``quiet_period_ms``, read from the Resource Timing
+    entries rather than from CDP network events: requests still in flight are not visible there, so a
+    resource that is still downloading once the page has been quiet for that long is not waited for.
+    """
+    max_wait = cfg.PDF_READY_MAX_WAIT_SECONDS if max_wait is None else max_wait
+    quiet_period_ms = cfg.PDF_READY_QUIET_PERIOD_MS if quiet_period_ms is None else quiet_period_ms
+    start = time.monotonic()
+    deadline = start + max_wait
+    while driver.execute_script("return document.readyState") != "complete":
+        if time.monotonic() >= deadline:
+            logger.warning(f"Page not loaded after {max_wait}s, printing it anyway")
+            return False
+        time.sleep(0.02)
+    # Pooled drivers are reused by other callers: put their script timeout back afterwards
+    previous_script_timeout = driver.timeouts.script
+    driver.set_script_timeout(max(deadline - time.monotonic(), 0.1))
+    try:
+        driver.execute_async_script(WAIT_FOR_RESOURCES_SCRIPT, quiet_period_ms)
+    except TimeoutException:
+        logger.warning(f"Fonts or resources still loading after {max_wait}s, printing the page anyway")
+        return False
+    finally:
+        driver.set_script_timeout(previous_script_timeout)
+    logger.debug(f"Page ready for printing after {time.monotonic() - start:.3f}s")
+    return True
+
+
+# Opzioni di stampa di Page.printToPDF, comuni alla modalità base64 e a quella in streaming
+PRINT_TO_PDF_OPTIONS = {
+    "printBackground": True,          # Includi lo sfondo nella stampa
+    "landscape": False,               # Stampa in verticale (False per ritratto)
+    "paperWidth": 8.27,               # Larghezza del foglio in pollici (A4)
+    "paperHeight": 11.69,             # Altezza del foglio in pollici (A4)
+    "marginTop": 0.8,                  # Margine superiore in pollici (circa 2 cm)
+    "marginBottom": 0.8,               # Margine inferiore in pollici (circa 2 cm)
+    "marginLeft": 0.5,                 # Margine sinistro in pollici (circa 1.27 cm)
+    "marginRight": 0.5,                # Margine destro in pollici (circa 1.27 cm)
+    "displayHeaderFooter": False,      # Non visualizzare intestazioni e piè di pagina
+    "preferCSSPageSize": True,         # Preferire le dimensioni della pagina CSS
+    "generateDocumentOutline": False,  # Non generare un sommario del documento
+    "generateTaggedPDF": False,        # Non generare PDF taggato
+}
+
+# Bytes requested per IO.read call when streaming a PDF out of Chrome
+PDF_STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+def load_html(driver, html_content):
+    """
+    Load an HTML document into the current tab with Page.setDocumentContent, instead of URL-quoting it
+    into a data: URL, then wait until it is ready to print.
+    """
+    driver.get("about:blank")
+    frame_id = driver.execute_cdp_cmd("Page.getFrameTree", {})["frameTree"]["frame"]["id"]
+    driver.execute_cdp_cmd("Page.setDocumentContent", {"frameId": frame_id, "html": html_content})
+    # Attendi che la pagina, i font e le risorse siano caricati (al massimo PDF_READY_MAX_WAIT_SECONDS)
+    wait_for_page_ready(driver)
+
+
 def HTML_to_PDF(html_content, driver):
     """
     Converte una stringa HTML in un PDF e restituisce il PDF come stringa base64.
@@ -62,32 +166,59 @@ def HTML_to_PDF(html_content, driver):
     if not isinstance(html_content, str) or not html_content.strip():
         raise ValueError("Il contenuto HTML deve essere una stringa non vuota.")
 
-    # Codifica l'HTML in un URL di tipo data
-    encoded_html = urllib.parse.quote(html_content)
-    data_url = f"data:text/html;charset=utf-8,{encoded_html}"
-
     try:
-        driver.get(data_url)
-        # Attendi che la pagina si carichi completamente
-        time.sleep(2)  # Potrebbe essere necessario aumentare questo tempo per HTML complessi
-
-        # Esegue il comando CDP per stampare la pagina in PDF
-        pdf_base64 = driver.execute_cdp_cmd("Page.printToPDF", {
-            "printBackground": True,          # Includi lo sfondo nella stampa
-            "landscape": False,               # Stampa in verticale (False per ritratto)
-            "paperWidth": 8.27,               # Larghezza del foglio in pollici (A4)
-            "paperHeight": 11.69,             # Altezza del foglio in pollici (A4)
-            "marginTop": 0.8,                  # Margine superiore in pollici (circa 2 cm)
-            "marginBottom": 0.8,               # Margine inferiore in pollici (circa 2 cm)
-            "marginLeft": 0.5,                 # Margine sinistro in pollici (circa 1.27 cm)
-            "marginRight": 0.5,                # Margine destro in pollici (circa 1.27 cm)
-            "displayHeaderFooter": False,      # Non visualizzare intestazioni e piè di pagina
-            "preferCSSPageSize": True,         # Preferire le dimensioni della pagina CSS
-            "generateDocumentOutline": False,  # Non generare un sommario del documento
-            "generateTaggedPDF": False,        # Non generare PDF taggato
-            "transferMode": "ReturnAsBase64"   # Restituire il PDF come stringa base64
-        })
+        load_html(driver, html_content)
+
+        # Esegue il comando CDP per stampare la pagina in PDF, restituito come stringa base64
+        pdf_base64 = driver.execute_cdp_cmd(
+            "Page.printToPDF", {**PRINT_TO_PDF_OPTIONS, "transferMode": "ReturnAsBase64"}
+        )
         return pdf_base64['data']
     except Exception as e:
         logger.error(f"Si è verificata un'eccezione WebDriver: {e}")
         raise RuntimeError(f"Si è verificata un'eccezione WebDriver: {e}")
+
+
+def HTML_to_PDF_file(html_content, driver, output_path, chunk_size: int = PDF_STREAM_CHUNK_SIZE) -> int:
+    """
+    Print an HTML string to a PDF file, streaming it out of Chrome (``transferMode: ReturnAsStream``)
+    in ``IO.read`` chunks written straight to ``output_path``, so at most one chunk is held in memory.
+    The file is written under a temporary name and renamed once complete.
+
+    :return: Size of the PDF in bytes.
+    :raises ValueError: If the HTML is not a non-empty string.
+    :raises RuntimeError: If the WebDriver or a CDP command fails.
+    """
+    if not isinstance(html_content, str) or not html_content.strip():
+        raise ValueError("Il contenuto HTML deve essere una stringa non vuota.")
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.part")
+    try:
+        load_html(driver, html_content)
+        stream = driver.execute_cdp_cmd(
+            "Page.printToPDF", {**PRINT_TO_PDF_OPTIONS, "transferMode": "ReturnAsStream"}
+        )["stream"]
+        size = 0
+        try:
+            with open(partial_path, "wb") as file:
+                while True:
+                    chunk = driver.execute_cdp_cmd("IO.read", {"handle": stream, "size": chunk_size})
+                    if chunk.get("base64Encoded"):
+                        data = base64.b64decode(chunk["data"])
+                    else:
+                        data = chunk["data"].encode("latin-1")
+                    file.write(data)
+                    size += len(data)
+                    if chunk.get("eof"):
+                        break
+        finally:
+            driver.execute_cdp_cmd("IO.close", {"handle": stream})
+        os.replace(partial_path, output_path)
+        logger.debug(f"PDF streamed to {output_path} ({size} bytes)")
+        return size
+    except Exception as e:
+        partial_path.unlink(missing_ok=True)
+        logger.error(f"Si è verificata un'eccezione WebDriver: {e}")
+        raise RuntimeError(f"Si è verificata un'eccezione WebDriver: {e}")
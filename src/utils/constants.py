@@ -46,6 +46,7 @@ OPTIONS = "options"
 RESUME = "resume"
 RESUME_SECTION = "resume_section"
 JOB_DESCRIPTION = "job_description"
+JOB_DESCRIPTIONS = "job_descriptions"
 COMPANY = "company"
 JOB_APPLICATION_PROFILE = "job_application_profile"
 RESUME_EDUCATIONS = "resume_educations"
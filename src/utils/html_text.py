@@ -0,0 +1,101 @@
+"""
+In-memory HTML to plain text conversion for job pages.
+
+Markup, attributes and non-content elements (scripts, styles, navigation,
+footers, hidden elements...) are dropped while the HTML is fed to the parser
+in chunks, and the visible text is yielded block by block, so a page never
+has to be written to disk or held twice as raw HTML and text.
+"""
+from html.parser import HTMLParser
+from typing import Iterator, List
+
+# Elements whose whole content is boilerplate or not human-readable text. Form controls are skipped
+# but not <form> itself: ASP.NET WebForms and some ATS pages wrap the whole page body in one form
+SKIPPED_TAGS = {
+    "script", "style", "noscript", "template", "svg", "canvas", "iframe", "object",
+    "nav", "footer", "aside", "select", "option", "textarea",
+}
+
+# Elements that end a block of text
+BLOCK_TAGS = {
+    "address", "article", "blockquote", "br", "dd", "div", "dl", "dt", "fieldset", "figcaption",
+    "figure", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "ol", "p", "pre",
+    "section", "table", "td", "th", "title", "tr", "ul",
+}
+
+VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param",
+    "source", "track", "wbr",
+}
+
+DEFAULT_FEED_SIZE = 64 * 1024
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._skip_tag = None
+        self._skip_depth = 0
+        self._current: List[str] = []
+        self.blocks: List[str] = []
+
+    @staticmethod
+    def _is_hidden(attrs) -> bool:
+        attributes = dict(attrs)
+        return "hidden" in attributes or attributes.get("aria-hidden") == "true"
+
+    def _end_block(self) -> None:
+        text = " ".join("".join(self._current).split())
+        if text:
+            self.blocks.append(text)
+        self._current = []
+
+    def handle_starttag(self, tag, attrs):
+        if self._skip_tag is not None:
+            if tag == self._skip_tag:
+                self._skip_depth += 1
+            return
+        if tag not in VOID_TAGS and (tag in SKIPPED_TAGS or self._is_hidden(attrs)):
+            self._end_block()
+            self._skip_tag, self._skip_depth = tag, 1
+            return
+        if tag in BLOCK_TAGS:
+            self._end_block()
+
+    def handle_startendtag(self, tag, attrs):
+        if self._skip_tag is None and tag in BLOCK_TAGS:
+            self._end_block()
+
+    def handle_endtag(self, tag):
+        if self._skip_tag is not None:
+            if tag == self._skip_tag:
+                self._skip_depth -= 1
+                if self._skip_depth == 0:
+                    self._skip_tag = None
+            return
+        if tag in BLOCK_TAGS:
+            self._end_block()
+
+    def handle_data(self, data):
+        if self._skip_tag is None:
+            self._current.append(data)
+
+    def close(self):
+        super().close()
+        self._end_block()
+
+
+def iter_html_text(html: str, feed_size: int = DEFAULT_FEED_SIZE) -> Iterator[str]:
+    """Yield the visible text blocks of an HTML document, feeding the parser ``feed_size`` characters at a time."""
+    parser = _TextExtractor()
+    for start in range(0, len(html), feed_size):
+        parser.feed(html[start:start + feed_size])
+        yield from parser.blocks
+        parser.blocks.clear()
+    parser.close()
+    yield from parser.blocks
+
+
+def html_to_text(html: str) -> str:
+    """Return the visible text of an HTML document, one block per line."""
+    return "\n".join(iter_html_text(html))
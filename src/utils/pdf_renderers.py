@@ -0,0 +1,126 @@
+"""
+Interchangeable HTML to PDF renderers.
+
+``ChromeRenderer`` prints through headless Chrome (``HTML_to_PDF``), which is
+the reference output. ``WeasyPrintRenderer`` lays the page out in-process with
+WeasyPrint: no browser, no WebDriver round trips, and the resume styles' CSS
+is honoured, at the cost of WeasyPrint's narrower CSS support (e.g. no
+JavaScript, partial flexbox). ``ReportLabRenderer`` is the text-only layout of
+``PDFGenerator``. Callers pick one per document by name.
+"""
+import base64
+import io
+import os
+from pathlib import Path
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Type, Union
+
+import config as cfg
+from src.libs.resume_and_cover_builder.pdf_generator import PDFGenerator
+from src.logging import logger
+from src.utils.browser_pool import get_browser_pool
+from src.utils.chrome_utils import HTML_to_PDF, HTML_to_PDF_file
+
+CHROME = "chrome"
+WEASYPRINT = "weasyprint"
+REPORTLAB = "reportlab"
+
+# Same A4 page and margins as the Chrome print settings in HTML_to_PDF. Passed as a user
+# stylesheet, so an @page rule in the resume style still takes precedence.
+WEASYPRINT_PAGE_CSS = "@page { size: A4; margin: 0.8in 0.5in; }"
+
+
+class PDFRenderer(ABC):
+    name: str = ""
+
+    @abstractmethod
+    def render(self, html: str) -> bytes:
+        """Render an HTML document to PDF bytes."""
+
+    def render_base64(self, html: str) -> str:
+        """Render to a base64 string, the format HTML_to_PDF and ResumeFacade return."""
+        return base64.b64encode(self.render(html)).decode("ascii")
+
+    def render_to_file(self, html: str, output_path: Union[str, Path]) -> int:
+        """Render straight to ``output_path`` (written atomically) and return the PDF size in bytes."""
+        pdf = self.render(html)
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.part")
+        partial_path.write_bytes(pdf)
+        os.replace(partial_path, output_path)
+        return len(pdf)
+
+
+class ChromeRenderer(PDFRenderer):
+    name = CHROME
+
+    def __init__(self, driver=None):
+        """Print with ``driver``, or with a browser borrowed from the pool for each document."""
+        self.driver = driver
+
+    def render_base64(self, html: str) -> str:
+        if self.driver is not None:
+            return HTML_to_PDF(html, self.driver)
+        with get_browser_pool().browser() as driver:
+            return HTML_to_PDF(html, driver)
+
+    def render(self, html: str) -> bytes:
+        return base64.b64decode(self.render_base64(html))
+
+    def render_to_file(self, html: str, output_path: Union[str, Path]) -> int:
+        """Stream the PDF out of Chrome into ``output_path`` chunk by chunk, without a base64 copy."""
+        if self.driver is not None:
+            return HTML_to_PDF_file(html, self.driver, output_path)
+        with get_browser_pool().browser() as driver:
+            return HTML_to_PDF_file(html, driver, output_path)
+
+
+class WeasyPrintRenderer(PDFRenderer):
+    name = WEASYPRINT
+
+    def __init__(self, base_url: Optional[str] = None):
+        try:
+            import weasyprint
+        except (ImportError, OSError) as e:  # OSError: missing Pango/Cairo system libraries
+            raise RuntimeError(f"WeasyPrint is not available: {e}") from e
+        self._weasyprint = weasyprint
+        self.base_url = base_url
+        self._page_css = weasyprint.CSS(string=WEASYPRINT_PAGE_CSS)
+
+    def render(self, html: str) -> bytes:
+        document = self._weasyprint.HTML(string=html, base_url=self.base_url)
+        return document.write_pdf(stylesheets=[self._page_css])
+
+
+class ReportLabRenderer(PDFRenderer):
+    name = REPORTLAB
+
+    def __init__(self):
+        self._generator = PDFGenerator()
+
+    def render(self, html: str) -> bytes:
+        output = io.BytesIO()
+        self._generator._create_pdf_from_text(self._generator._html_to_text(html), output)
+        return output.getvalue()
+
+
+RENDERERS: Dict[str, Type[PDFRenderer]] = {
+    CHROME: ChromeRenderer,
+    WEASYPRINT: WeasyPrintRenderer,
+    REPORTLAB: ReportLabRenderer,
+}
+
+
+def get_renderer(name: Optional[str] = None, driver=None) -> PDFRenderer:
+    """
+    Return the renderer called ``name`` (default: config.PDF_RENDERER). ``driver`` is used by the
+    Chrome renderer and ignored by the others.
+    """
+    name = name or cfg.PDF_RENDERER
+    if name not in RENDERERS:
+        raise ValueError(f"Unknown PDF renderer '{name}', expected one of {sorted(RENDERERS)}")
+    logger.debug(f"Rendering PDF with {name}")
+    if name == CHROME:
+        return ChromeRenderer(driver)
+    return RENDERERS[name]()